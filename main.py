@@ -40,8 +40,8 @@ if sys.platform == 'win32':
 write_log("Importing PyQt6...")
 try:
     from PyQt6.QtWidgets import QApplication
-    from PyQt6.QtCore import Qt, QSize, QTimer
-    from PyQt6.QtGui import QFont, QIcon
+    from PyQt6.QtCore import Qt, QTimer
+    from PyQt6.QtGui import QFont
     write_log("PyQt6 imported successfully")
 except Exception as e:
     write_log(f"PyQt6 import error: {e}")
@@ -50,6 +50,7 @@ except Exception as e:
 write_log("Importing MainWindow...")
 try:
     from src.gui.main_window import MainWindow
+    from src.gui.utils import load_app_icon
     write_log("MainWindow imported successfully")
 except Exception as e:
     write_log(f"MainWindow import error: {e}")
@@ -120,19 +121,12 @@ def main():
         app.setApplicationVersion("1.0.0")
         app.setOrganizationName("YTDownloader")
 
-        # アプリケーションアイコン設定（複数サイズで設定）
+        # アプリケーションアイコン設定
         write_log("Setting application icon...")
-        icon = QIcon()
-        for icon_name in ['icon.ico', 'icon_d.png']:
-            icon_path = os.path.join(app_path, icon_name)
-            if os.path.exists(icon_path):
-                # 複数サイズでアイコンを追加
-                for size in [16, 24, 32, 48, 64, 128, 256]:
-                    icon.addFile(icon_path, QSize(size, size))
-                write_log(f"Icon loaded: {icon_path}")
-                break
+        icon = load_app_icon(app_path)
         if not icon.isNull():
             app.setWindowIcon(icon)
+            write_log("Icon loaded")
     except Exception as e:
         write_log(f"Error in main() setup: {e}")
         raise
@@ -198,7 +192,7 @@ def main():
             padding: 6px;
             min-height: 25px;
         }
-        QComboBox QAbstractItemView::item:hover {
+        QComboBox QAbstractItemView::item:hover, QComboBox QAbstractItemView::item:selected {
             background-color: #0078d4;
             color: white;
         }
@@ -10,7 +10,20 @@ AUDIO_BITRATE_KBPS = 128  # 想定音声ビットレート (kbps)
 BYTES_PER_SECOND = AUDIO_BITRATE_KBPS * 1024 // 8  # 約16KB/秒
 DOWNLOAD_TIMEOUT_SECONDS = 3600  # ダウンロードタイムアウト (1時間)
 THREAD_WAIT_TIMEOUT_MS = 5000  # スレッド待機タイムアウト (5秒)
+PROGRESS_UI_INTERVAL_MS = 100  # 進捗表示の更新間隔（ミリ秒）
+TRANSCRIBE_PROGRESS_COALESCE_MS = 16  # 文字起こし進捗をまとめて描画する間隔（ミリ秒、約60Hz）
+LOG_MAX_LINES = 1000  # ログ表示の最大行数
+PROGRESS_EMIT_MIN_PERCENT = 0.5  # ワーカーが進捗を通知する最小変化率（%）
+PROGRESS_EMIT_MIN_INTERVAL_SECONDS = 0.5  # 変化が小さくても進捗を通知する間隔（秒）
 MAX_RETRIES = 3  # 最大リトライ回数
+PLAYLIST_FETCH_WORKERS = 8  # 再生リストの動画情報を並列取得するスレッド数
+VIDEO_INFO_CACHE_TTL_SECONDS = 1800  # 再生リスト取得時の動画情報をダウンロードに再利用する期間（秒、配信URLの有効期限より短く）
+VIDEO_INFO_CACHE_MAX_ENTRIES = 500  # 保持する動画情報の上限（超えた分は古い順に破棄）
+DEFAULT_DOWNLOAD_CONCURRENCY = 3  # 同時ダウンロード数の既定値
+MAX_DOWNLOAD_CONCURRENCY = 8  # 同時ダウンロード数の上限
+DEFAULT_SPACES_CONCURRENCY = 4  # Xスペースの同時ダウンロード数の既定値
+PART_FILE_DELETE_WORKERS = 8  # 一時ファイル(.part)を並列に削除するスレッド数（ネットワークドライブ向け）
+SPACES_TEMP_DIR_NAME = "tmp"  # Xスペースの作業用フォルダ（保存先の下、完成したファイルだけを保存先へ移動）
 URL_FETCH_TIMEOUT_SECONDS = 30  # URL取得タイムアウト（秒）
 GPU_DETECT_TIMEOUT_SECONDS = 10  # GPU検出タイムアウト（秒）
 
@@ -22,7 +35,8 @@ CUSTOM_VOCABULARY_WARNING_THRESHOLD = 100  # 警告を表示する文字数
 # FFmpeg設定
 # =============================================================================
 FFMPEG_URL = "https://github.com/BtbN/FFmpeg-Builds/releases/download/latest/ffmpeg-master-latest-win64-gpl.zip"
-FFMPEG_FILENAME = "ffmpeg-master-latest-win64-gpl.zip"
+FFMPEG_DOWNLOAD_CHUNK_BYTES = 1024 * 1024  # ダウンロード時の読み込み単位（1MB）
+FFMPEG_SPOOL_MAX_BYTES = 128 * 1024 * 1024  # これを超えるまでZIPはメモリ上に保持（128MB）
 # SHA256チェックサムは動的に取得するため、検証はダウンロード後に行う
 # 注意: GitHubのlatestリリースはハッシュが変わるため、チェックサム検証は
 # ファイル整合性確認（ダウンロード完了後のZIP検証）で代替
@@ -45,11 +59,27 @@ WHISPER_ENGINES = {
     'faster-whisper': 'Faster Whisper（2-4倍高速）',
 }
 
+# 音声バッファ設定（Whisperの入力は16kHzモノラル）
+WHISPER_SAMPLE_RATE = 16000
+WHISPER_CHUNK_SECONDS = 30  # Whisperの処理単位（秒）
+PINNED_AUDIO_MAX_SECONDS = 600  # GPUへ転送する最大長（ピン留めバッファは最大約38MB、超える場合はCPU上で処理）
+
+# 無音区間のスキップ（VAD）: この長さ以上の無音で区間を区切る（ミリ秒）
+WHISPER_VAD_MIN_SILENCE_MS = 500
+
+# 読み込み済みモデルを保持する数（大きいモデル2つでVRAMが不足しないよう1つに制限）
+WHISPER_MODEL_CACHE_SIZE = 1
+
+# 文字起こし結果キャッシュ
+TRANSCRIPT_CACHE_DIR_NAME = 'transcripts'  # キャッシュ用ディレクトリ内のサブディレクトリ名
+TRANSCRIPT_CACHE_READ_CHUNK_BYTES = 1024 * 1024  # ハッシュ計算時の読み込み単位（1MB）
+
 # faster-whisperモデル（large-v3対応）
 FASTER_WHISPER_MODELS = ['tiny', 'base', 'small', 'medium', 'large-v2', 'large-v3']
 
 # kotoba-whisper モデルID（Hugging Face）
 KOTOBA_WHISPER_MODEL = 'kotoba-tech/kotoba-whisper-v2.1'
+KOTOBA_CHUNK_LENGTH_SECONDS = 15  # 長い音声をこの長さに区切ってまとめて推論（モデルの推奨値）
 
 # =============================================================================
 # UI設定
@@ -57,6 +87,7 @@ KOTOBA_WHISPER_MODEL = 'kotoba-tech/kotoba-whisper-v2.1'
 DEFAULT_WINDOW_WIDTH = 900
 DEFAULT_WINDOW_HEIGHT = 700
 MAX_RECENT_URLS = 20
+PLAYLIST_TABLE_FETCH_ROWS = 500  # 再生リスト表の行をスクロールに合わせて追加する単位
 
 # =============================================================================
 # セキュリティ設定
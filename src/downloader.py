@@ -7,9 +7,13 @@ import os
 import sys
 import json
 import re
+import time
+import random
 import logging
 import threading
 import urllib.parse
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Callable, Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass
@@ -20,11 +24,28 @@ from src.constants import (
     ALLOWED_YOUTUBE_HOSTS,
     ERROR_MESSAGES,
     MAX_RETRIES,
+    PLAYLIST_FETCH_WORKERS,
+    VIDEO_INFO_CACHE_TTL_SECONDS, VIDEO_INFO_CACHE_MAX_ENTRIES,
 )
 
 # ロガー設定
 logger = logging.getLogger(__name__)
 
+# 動画IDを抽出する正規表現（watch?v=, youtu.be/, shorts/ 形式）
+# （11文字より長いトークンは動画IDではないため切り詰めずに不一致とする）
+_VIDEO_ID_RE = re.compile(r'(?:[?&]v=|youtu\.be/|/shorts/)([\w-]{11})(?![\w-])')
+
+# 再利用のために保持する動画情報から除く項目（ダウンロードには使わず、サイズが大きい）
+_UNCACHED_INFO_KEYS = frozenset(('thumbnails', 'heatmap', 'description'))
+
+# YouTube URL（watch?v=, youtu.be/, playlist?list=, shorts/ 形式）を1回の走査で抽出する正規表現
+_YOUTUBE_URL_RE = re.compile(
+    r'https?://(?:(?:www\.)?youtube\.com/(?:watch\?v=|playlist\?list=|shorts/)|youtu\.be/)[\w-]+'
+)
+
+# 連続するアンダースコア（sanitize_filename で1つにまとめる）
+_UNDERSCORE_RUN_RE = re.compile(r'_+')
+
 
 def sanitize_filename(filename: str, max_length: int = 200) -> str:
     """
@@ -45,7 +66,7 @@ def sanitize_filename(filename: str, max_length: int = 200) -> str:
     filename = filename.translate(trans_table)
 
     # 連続するアンダースコアを1つに（正規表現で効率化）
-    filename = re.sub(r'_+', '_', filename)
+    filename = _UNDERSCORE_RUN_RE.sub('_', filename)
 
     # 先頭・末尾のアンダースコアとスペースを除去
     filename = filename.strip('_ ')
@@ -100,6 +121,35 @@ def validate_youtube_url(url: str) -> Tuple[bool, str]:
         return False, ERROR_MESSAGES['invalid_url']
 
 
+def canonicalize_youtube_url(url: str) -> str:
+    """
+    YouTube動画URLを正規形に変換（重複判定用）
+
+    watch?v=ID / youtu.be/ID / shorts/ID を https://www.youtube.com/watch?v=ID に統一する。
+    再生リストを含むURLは意味が変わるため、YouTube以外のホストのURLは対象外のためそのまま返す
+
+    Args:
+        url: 元のURL
+
+    Returns:
+        正規化されたURL
+    """
+    url = url.strip()
+    if 'list=' in url:
+        return url
+    try:
+        host = urllib.parse.urlparse(url).hostname
+    except ValueError:
+        return url
+    if host not in ALLOWED_YOUTUBE_HOSTS:
+        return url
+
+    match = _VIDEO_ID_RE.search(url)
+    if match:
+        return f"https://www.youtube.com/watch?v={match.group(1)}"
+    return url
+
+
 def get_ffmpeg_path() -> Optional[str]:
     """FFmpegのパスを取得"""
     if getattr(sys, 'frozen', False):
@@ -193,6 +243,9 @@ class YouTubeDownloader:
         self._cancel_flag = False
         self._cancel_lock = threading.Lock()  # スレッドセーフなキャンセル制御
         self._ffmpeg_path = get_ffmpeg_path()
+        # 再生リスト取得時の動画情報（動画ID -> (取得時刻, info_dict)）。ダウンロード時の再取得を省く
+        self._info_cache: Dict[str, Tuple[float, Dict]] = {}
+        self._info_cache_lock = threading.Lock()
         logger.info(f"YouTubeDownloader initialized. Output: {output_dir}")
 
     def _get_base_opts(self) -> Dict:
@@ -256,26 +309,83 @@ class YouTubeDownloader:
 
             self._progress_callback(info)
 
-    def get_video_info(self, url: str) -> VideoInfo:
-        """動画情報を取得"""
+    def _get_info_opts(self) -> Dict:
+        """動画情報取得用のオプションを取得"""
         ydl_opts = self._get_base_opts()
         ydl_opts['extract_flat'] = False
-
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-
-            return VideoInfo(
-                video_id=info.get('id', ''),
-                title=info.get('title', ''),
-                url=info.get('webpage_url', url),
-                duration=info.get('duration', 0) or 0,
-                view_count=info.get('view_count', 0) or 0,
-                upload_date=info.get('upload_date', ''),
-                thumbnail=info.get('thumbnail', ''),
-                channel=info.get('channel', '') or info.get('uploader', ''),
-                description=info.get('description', ''),
-                formats=info.get('formats', [])
-            )
+        return ydl_opts
+
+    def _remember_info(self, info: Dict):
+        """
+        取得済みの動画情報をダウンロード用に保持
+
+        ダウンロードに使わない大きな項目（サムネイル一覧・ヒートマップ等）は除き、
+        期限切れの情報を破棄したうえで件数を VIDEO_INFO_CACHE_MAX_ENTRIES までに抑える
+        """
+        video_id = info.get('id')
+        if not video_id:
+            return
+        info = {k: v for k, v in info.items() if k not in _UNCACHED_INFO_KEYS}
+        now = time.monotonic()
+        with self._info_cache_lock:
+            cache = self._info_cache
+            # 挿入順＝取得順のため、先頭から期限切れ・上限超過の分を破棄
+            while cache:
+                oldest_id = next(iter(cache))
+                fetched_at = cache[oldest_id][0]
+                if now - fetched_at <= VIDEO_INFO_CACHE_TTL_SECONDS and len(cache) < VIDEO_INFO_CACHE_MAX_ENTRIES:
+                    break
+                del cache[oldest_id]
+            cache.pop(video_id, None)
+            cache[video_id] = (now, info)
+
+    def _take_cached_info(self, url: str) -> Optional[Dict]:
+        """保持している動画情報を取り出す（1回限り、期限切れはNone）"""
+        if 'list=' in url:
+            return None
+        match = _VIDEO_ID_RE.search(url)
+        if not match:
+            return None
+        with self._info_cache_lock:
+            entry = self._info_cache.pop(match.group(1), None)
+        if entry is None:
+            return None
+        fetched_at, info = entry
+        if time.monotonic() - fetched_at > VIDEO_INFO_CACHE_TTL_SECONDS:
+            return None
+        return info
+
+    def get_video_info(self, url: str, ydl: Optional[yt_dlp.YoutubeDL] = None,
+                       remember: bool = False) -> VideoInfo:
+        """
+        動画情報を取得
+
+        Args:
+            url: 動画URL
+            ydl: 再利用するYoutubeDLインスタンス（省略時は新規作成）
+                 連続取得時に渡すとHTTP接続（TLSセッション）が使い回される
+            remember: 取得した情報を保持し、後のダウンロードで再取得を省く
+        """
+        if ydl is None:
+            with yt_dlp.YoutubeDL(self._get_info_opts()) as new_ydl:
+                return self.get_video_info(url, new_ydl, remember)
+
+        info = ydl.extract_info(url, download=False)
+        if remember and info:
+            self._remember_info(info)
+
+        return VideoInfo(
+            video_id=info.get('id', ''),
+            title=info.get('title', ''),
+            url=info.get('webpage_url', url),
+            duration=info.get('duration', 0) or 0,
+            view_count=info.get('view_count', 0) or 0,
+            upload_date=info.get('upload_date', ''),
+            thumbnail=info.get('thumbnail', ''),
+            channel=info.get('channel', '') or info.get('uploader', ''),
+            description=info.get('description', ''),
+            formats=info.get('formats', [])
+        )
 
     def get_playlist_info(self, url: str,
                           filter_options: Optional[PlaylistFilter] = None,
@@ -286,6 +396,10 @@ class YouTubeDownloader:
         ydl_opts['extract_flat'] = 'in_playlist'
         ydl_opts['ignoreerrors'] = True
 
+        # 前回の再生リストの情報は破棄
+        with self._info_cache_lock:
+            self._info_cache.clear()
+
         videos = []
 
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
@@ -302,28 +416,58 @@ class YouTubeDownloader:
                     videos.append(video_info)
                 return videos
 
-            total = len(entries)
+        # 各動画の詳細取得を並列実行（順序は再生リスト順を維持）
+        entries = [entry for entry in entries if entry is not None]
+        total = len(entries)
+        results: List[Optional[VideoInfo]] = [None] * total
 
-            for i, entry in enumerate(entries):
-                if self._is_cancelled():
-                    logger.info("Playlist fetch cancelled by user")
-                    break
+        # YoutubeDLはスレッドごとに1つ作成して使い回す（HTTP接続を再利用）
+        local = threading.local()
+        opened_ydls = []
+        opened_lock = threading.Lock()
 
-                if entry is None:
-                    continue
+        def fetch_one(entry: Dict) -> Optional[VideoInfo]:
+            if self._is_cancelled():
+                return None
 
-                if progress_callback:
-                    progress_callback(i + 1, total)
+            info_ydl = getattr(local, 'ydl', None)
+            if info_ydl is None:
+                info_ydl = yt_dlp.YoutubeDL(self._get_info_opts())
+                local.ydl = info_ydl
+                with opened_lock:
+                    opened_ydls.append(info_ydl)
 
-                try:
-                    video_url = entry.get('url') or f"https://www.youtube.com/watch?v={entry.get('id')}"
-                    video_info = self.get_video_info(video_url)
+            try:
+                video_url = entry.get('url') or f"https://www.youtube.com/watch?v={entry.get('id')}"
+                return self.get_video_info(video_url, info_ydl, remember=True)
+            except Exception as e:
+                logger.warning(f"Failed to get video info for {entry.get('id', 'unknown')}: {e}")
+                return None
 
-                    if self._passes_filter(video_info, filter_options):
-                        videos.append(video_info)
-                except Exception as e:
-                    logger.warning(f"Failed to get video info for {entry.get('id', 'unknown')}: {e}")
-                    continue
+        try:
+            with ThreadPoolExecutor(max_workers=PLAYLIST_FETCH_WORKERS) as executor:
+                futures = {executor.submit(fetch_one, entry): i for i, entry in enumerate(entries)}
+                completed = 0
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    completed += 1
+
+                    if progress_callback:
+                        progress_callback(completed, total)
+
+                    if self._is_cancelled():
+                        logger.info("Playlist fetch cancelled by user")
+                        for pending in futures:
+                            pending.cancel()
+                        break
+        finally:
+            for info_ydl in opened_ydls:
+                info_ydl.close()
+
+        videos = [
+            video_info for video_info in results
+            if video_info is not None and self._passes_filter(video_info, filter_options)
+        ]
 
         return videos
 
@@ -352,13 +496,13 @@ class YouTubeDownloader:
         if filter_options.max_duration and video.duration > filter_options.max_duration:
             return False
 
-        # タイトルフィルター
-        title_lower = video.title.lower()
+        # タイトルフィルター（大文字・小文字を区別しない）
+        title_folded = video.title.casefold()
         if filter_options.title_contains:
-            if filter_options.title_contains.lower() not in title_lower:
+            if filter_options.title_contains.casefold() not in title_folded:
                 return False
         if filter_options.title_excludes:
-            if filter_options.title_excludes.lower() in title_lower:
+            if filter_options.title_excludes.casefold() in title_folded:
                 return False
 
         return True
@@ -400,12 +544,20 @@ class YouTubeDownloader:
                  subtitle: bool = False,
                  subtitle_lang: str = 'ja,en') -> str:
         """動画をダウンロード"""
-        logger.info(f"Starting download: {url}")
         self.reset_cancel()
+        return self._download(url, format_option, output_template, audio_only, subtitle, subtitle_lang)
+
+    def _download(self, url: str,
+                  format_option: str = 'best',
+                  output_template: Optional[str] = None,
+                  audio_only: bool = False,
+                  subtitle: bool = False,
+                  subtitle_lang: str = 'ja,en') -> str:
+        """動画をダウンロード（キャンセル状態はリセットしない）"""
+        logger.info(f"Starting download: {url}")
 
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
-            logger.debug(f"Created output directory: {self.output_dir}")
+        # 並列ダウンロード時に同時に作成されても失敗しないようexist_okを指定
+        os.makedirs(self.output_dir, exist_ok=True)
 
         if output_template is None:
             # セキュリティ対策: ファイル名をサニタイズするカスタムテンプレート
@@ -442,8 +594,22 @@ class YouTubeDownloader:
             ydl_opts['subtitleslangs'] = subtitle_lang.split(',')
             ydl_opts['subtitlesformat'] = 'srt/vtt/best'
 
+        cached_info = self._take_cached_info(url)
+
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=True)
+            info = None
+            if cached_info is not None:
+                # 再生リスト取得時の情報を使い、動画ページの再取得を省く（--load-info-json と同じ手順）
+                try:
+                    info = ydl.process_ie_result(
+                        ydl.sanitize_info(cached_info, remove_private_keys=True), download=True
+                    )
+                except yt_dlp.utils.DownloadError as e:
+                    if self._is_cancelled():
+                        raise
+                    logger.warning(f"Download with cached info failed, re-extracting: {e}")
+            if info is None:
+                info = ydl.extract_info(url, download=True)
             if info:
                 return ydl.prepare_filename(info)
             return ''
@@ -453,54 +619,91 @@ class YouTubeDownloader:
                        audio_only: bool = False,
                        subtitle: bool = False,
                        anti_ban: bool = True,
-                       item_callback: Optional[Callable[[int, int, str], None]] = None) -> List[str]:
-        """複数動画を一括ダウンロード"""
-        import time
-        import random
+                       item_callback: Optional[Callable[[int, int, str], None]] = None,
+                       max_workers: int = 1) -> List[str]:
+        """
+        複数動画を一括ダウンロード
 
-        logger.info(f"Starting batch download: {len(urls)} URLs (anti_ban={anti_ban})")
-        self.reset_cancel()
-        downloaded_files = []
-        total = len(urls)
+        キャンセルフラグはここではリセットしない（URL解析などの準備中に押された
+        キャンセルを失わないよう、呼び出し側が開始前に reset_cancel を呼ぶ）
 
-        for i, url in enumerate(urls):
-            if self._is_cancelled():
-                logger.info("Batch download cancelled by user")
-                break
+        Args:
+            max_workers: 同時ダウンロード数（1の場合は1件ずつ順番に処理）
 
-            # BAN対策: 2件目以降は遅延を入れる
-            if anti_ban and i > 0:
-                delay = random.uniform(3.0, 5.0)  # 3〜5秒のランダム遅延
-                logger.info(f"Anti-ban delay: {delay:.1f}s")
-                time.sleep(delay)
+        Returns:
+            URLの順に並んだ結果（ファイルパスまたは "ERROR: ..."）。キャンセル後の未処理分は含まない
+        """
+        logger.info(f"Starting batch download: {len(urls)} URLs (anti_ban={anti_ban}, workers={max_workers})")
+        total = len(urls)
+        results: List[Optional[str]] = [None] * total
+
+        # BAN対策: 2件目以降は3〜5秒の遅延を入れる
+        # 並列時も直前の開始予定時刻から間隔を空け、同時に開始しないようにする
+        schedule_lock = threading.Lock()
+        last_start = [0.0]
+
+        def wait_turn(index: int) -> bool:
+            if not anti_ban or index == 0:
+                return True
+            with schedule_lock:
+                now = time.monotonic()
+                start_at = max(now, last_start[0]) + random.uniform(3.0, 5.0)  # 3〜5秒のランダム遅延
+                last_start[0] = start_at
+            delay = start_at - now
+            logger.info(f"Anti-ban delay: {delay:.1f}s")
+            return self._sleep_unless_cancelled(delay)
+
+        def download_one(index: int, url: str):
+            if self._is_cancelled() or not wait_turn(index):
+                return
 
             if item_callback:
-                item_callback(i + 1, total, url)
+                item_callback(index + 1, total, url)
 
             try:
-                filepath = self.download(url, format_option, audio_only=audio_only, subtitle=subtitle)
-                downloaded_files.append(filepath)
-                logger.info(f"Downloaded ({i+1}/{total}): {filepath}")
+                filepath = self._download(url, format_option, audio_only=audio_only, subtitle=subtitle)
+                results[index] = filepath
+                logger.info(f"Downloaded ({index+1}/{total}): {filepath}")
             except Exception as e:
-                error_msg = f"ERROR: {str(e)}"
-                downloaded_files.append(error_msg)
-                logger.error(f"Download failed ({i+1}/{total}): {e}")
+                results[index] = f"ERROR: {str(e)}"
+                logger.error(f"Download failed ({index+1}/{total}): {e}")
 
-        return downloaded_files
+        if max_workers <= 1 or total <= 1:
+            for i, url in enumerate(urls):
+                if self._is_cancelled():
+                    logger.info("Batch download cancelled by user")
+                    break
+                download_one(i, url)
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, total)) as executor:
+                futures = [executor.submit(download_one, i, url) for i, url in enumerate(urls)]
+                for future in as_completed(futures):
+                    future.result()
+            if self._is_cancelled():
+                logger.info("Batch download cancelled by user")
+
+        return [r for r in results if r is not None]
+
+    def _sleep_unless_cancelled(self, seconds: float) -> bool:
+        """指定秒数待機（キャンセルされた場合はFalseを返して中断）"""
+        deadline = time.monotonic() + seconds
+        while not self._is_cancelled():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            time.sleep(min(0.2, remaining))
+        return False
 
 
 def extract_urls_from_text(text: str) -> List[str]:
     """テキストからYouTube URLを抽出"""
-    patterns = [
-        r'https?://(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-        r'https?://youtu\.be/[\w-]+',
-        r'https?://(?:www\.)?youtube\.com/playlist\?list=[\w-]+',
-        r'https?://(?:www\.)?youtube\.com/shorts/[\w-]+',
-    ]
-
-    urls = []
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
-        urls.extend(matches)
-
-    return list(dict.fromkeys(urls))  # 重複を除去しつつ順序を維持
+    # キャッシュ側は不変のタプルを返すため、呼び出し側にはリストのコピーを渡す
+    return list(_extract_urls_cached(text))
+
+
+@lru_cache(maxsize=16)
+def _extract_urls_cached(text: str) -> Tuple[str, ...]:
+    """テキストからYouTube URLを抽出（同じテキストの再走査を避けるためキャッシュ）"""
+    # 全形式をまとめた正規表現で1回だけ走査（テキスト中の出現順）
+    urls = _YOUTUBE_URL_RE.findall(text)
+    return tuple(dict.fromkeys(urls))  # 重複を除去しつつ順序を維持
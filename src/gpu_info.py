@@ -5,6 +5,7 @@ GPU情報検出モジュール
 import subprocess
 import re
 import logging
+from functools import lru_cache
 from typing import Optional, Tuple
 from dataclasses import dataclass
 
@@ -61,6 +62,20 @@ class GPUInfo:
         else:
             return "tiny"
 
+    def get_recommended_batch_size(self) -> int:
+        """faster-whisper/kotoba-whisperのバッチ推論に推奨するバッチサイズを取得（1はバッチ推論なし）"""
+        if not self.available:
+            return 1
+
+        if self.vram_mb >= 12000:
+            return 16
+        elif self.vram_mb >= 6000:
+            return 8
+        elif self.vram_mb >= 4000:
+            return 4
+        else:
+            return 1
+
     def can_run_model(self, model: str) -> Tuple[bool, str]:
         """指定モデルが実行可能か判定"""
         model_requirements = {
@@ -88,8 +103,14 @@ class GPUInfo:
             return False, f"VRAM不足（必要: {required // 1000}GB, 搭載: {self.vram_str}）"
 
 
+@lru_cache(maxsize=1)
 def detect_gpu() -> GPUInfo:
-    """GPUを検出（タイムアウト付き）"""
+    """
+    GPUを検出（タイムアウト付き）
+
+    検出にはnvidia-smiの起動などで時間がかかるため、結果はプロセス内で使い回す
+    （再検出が必要な場合は invalidate_gpu_cache を呼ぶ）
+    """
     logger.info("Detecting GPU...")
 
     # まずPyTorchで確認を試みる（タイムアウト付きでサブプロセスで実行）
@@ -143,6 +164,11 @@ def detect_gpu() -> GPUInfo:
     return GPUInfo(available=False, name="", vram_mb=0)
 
 
+def invalidate_gpu_cache():
+    """キャッシュしたGPU検出結果を破棄（次回の detect_gpu で再検出）"""
+    detect_gpu.cache_clear()
+
+
 def get_device_display_text(gpu_info: GPUInfo) -> str:
     """デバイス情報の表示テキストを取得"""
     if gpu_info.available:
@@ -2,25 +2,27 @@
 設定ダイアログ
 """
 
-import os
-
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QGroupBox,
     QLineEdit, QPushButton, QHBoxLayout, QComboBox,
     QCheckBox, QDialogButtonBox, QFileDialog, QTextEdit,
-    QLabel
+    QLabel, QSpinBox, QMessageBox
 )
 from PyQt6.QtCore import QSettings
 
-from src.gui.utils import style_combobox
-from src.constants import MAX_CUSTOM_VOCABULARY_CHARS, CUSTOM_VOCABULARY_WARNING_THRESHOLD
+from src.gui.utils import style_combobox, get_transcript_cache_dir, DEFAULT_DOWNLOAD_DIR
+from src.transcript_cache import TranscriptCache
+from src.constants import (
+    MAX_CUSTOM_VOCABULARY_CHARS, CUSTOM_VOCABULARY_WARNING_THRESHOLD
+)
 
 
 class SettingsDialog(QDialog):
     """設定ダイアログ"""
 
-    def __init__(self, parent=None):
+    def __init__(self, settings: QSettings, parent=None):
         super().__init__(parent)
+        self._settings = settings  # MainWindowと共有する設定
         self.setWindowTitle("設定")
         self.setMinimumWidth(400)
         self.setup_ui()
@@ -98,6 +100,32 @@ class SettingsDialog(QDialog):
         self.prefer_youtube_check.setChecked(True)
         transcribe_layout.addRow("", self.prefer_youtube_check)
 
+        self.preload_model_check = QCheckBox("起動時にWhisperモデルを読み込む")
+        self.preload_model_check.setToolTip(
+            "アプリ起動時にバックグラウンドでモデルを読み込み、\n"
+            "最初の文字起こしの待ち時間を短縮します（起動後のメモリ使用量が増えます）"
+        )
+        transcribe_layout.addRow("", self.preload_model_check)
+
+        # モデル保存先（空欄なら各ライブラリの既定の場所）
+        self.whisper_cache_dir_edit = QLineEdit()
+        self.whisper_cache_dir_edit.setPlaceholderText("空欄の場合は既定の場所")
+        self.whisper_cache_dir_edit.setToolTip(
+            "Whisperモデルのダウンロード・保存先\n"
+            "一度保存したモデルは次回以降の起動で再利用されます"
+        )
+        whisper_cache_dir_btn = QPushButton("参照...")
+        whisper_cache_dir_btn.clicked.connect(self.browse_whisper_cache_dir)
+        whisper_cache_dir_layout = QHBoxLayout()
+        whisper_cache_dir_layout.addWidget(self.whisper_cache_dir_edit)
+        whisper_cache_dir_layout.addWidget(whisper_cache_dir_btn)
+        transcribe_layout.addRow("モデル保存先:", whisper_cache_dir_layout)
+
+        # 文字起こし結果キャッシュ（同じファイル・同じ条件の再実行で再利用）
+        clear_transcript_cache_btn = QPushButton("文字起こしキャッシュを削除")
+        clear_transcript_cache_btn.clicked.connect(self.clear_transcript_cache)
+        transcribe_layout.addRow("", clear_transcript_cache_btn)
+
         transcribe_group.setLayout(transcribe_layout)
         layout.addWidget(transcribe_group)
 
@@ -121,6 +149,25 @@ class SettingsDialog(QDialog):
         self.whisper_engine_combo.currentIndexChanged.connect(self.on_engine_changed)
         accuracy_layout.addRow("エンジン:", self.whisper_engine_combo)
 
+        # バッチサイズ（Faster Whisper・kotoba-whisperのみ、0は搭載VRAMから自動決定）
+        self.batch_size_spin = QSpinBox()
+        self.batch_size_spin.setRange(0, 32)
+        self.batch_size_spin.setSpecialValueText("自動")
+        self.batch_size_spin.setToolTip(
+            "Faster Whisper・kotoba-whisperで複数の音声区間をまとめて処理する数\n"
+            "大きいほど高速ですがVRAMを多く使用します\n"
+            "自動: VRAM 6GBで8、12GB以上で16（CPUでは使用しません）"
+        )
+        accuracy_layout.addRow("バッチサイズ:", self.batch_size_spin)
+
+        # 無音区間のスキップ（Faster Whisperのみ）
+        self.vad_filter_check = QCheckBox("無音区間をスキップ（VAD）")
+        self.vad_filter_check.setToolTip(
+            "Faster Whisperで無音の区間を検出して文字起こしから除外します\n"
+            "話の間が長い音声ほど高速になります（タイムスタンプは元の時間のまま）"
+        )
+        accuracy_layout.addRow("", self.vad_filter_check)
+
         # カスタム辞書（用語リスト）
         vocab_label = QLabel("カスタム辞書（読点「、」またはカンマ「,」区切り）:")
         accuracy_layout.addRow(vocab_label)
@@ -159,10 +206,21 @@ class SettingsDialog(QDialog):
         if dir_path:
             self.output_dir_edit.setText(dir_path)
 
+    def browse_whisper_cache_dir(self):
+        dir_path = QFileDialog.getExistingDirectory(self, "モデル保存先を選択")
+        if dir_path:
+            self.whisper_cache_dir_edit.setText(dir_path)
+
+    def clear_transcript_cache(self):
+        removed = TranscriptCache(get_transcript_cache_dir()).clear()
+        QMessageBox.information(self, "キャッシュ削除", f"文字起こしキャッシュを削除しました（{removed}件）")
+
     def on_engine_changed(self, index):
         """エンジン選択変更時の処理"""
         # kotoba-whisper(index=2)選択時はWhisperモデル選択を無効化
         is_kotoba = (index == 2)
+        self.batch_size_spin.setEnabled(index in (1, 2))
+        self.vad_filter_check.setEnabled(index == 1)
         self.whisper_model_combo.setEnabled(not is_kotoba)
         self.model_note_label.setVisible(is_kotoba)
         if is_kotoba:
@@ -189,32 +247,40 @@ class SettingsDialog(QDialog):
         self.vocab_count_label.setStyleSheet(f"color: {color}; font-size: 11px;")
 
     def load_settings(self):
-        settings = QSettings("YTDownloader", "Settings")
-        self.output_dir_edit.setText(settings.value("output_dir", os.path.expanduser("~/Downloads")))
+        settings = self._settings
+        self.output_dir_edit.setText(settings.value("output_dir", DEFAULT_DOWNLOAD_DIR))
         self.default_format_combo.setCurrentIndex(settings.value("default_format", 0, type=int))
         self.auto_subtitle_check.setChecked(settings.value("auto_subtitle", False, type=bool))
         self.whisper_model_combo.setCurrentIndex(settings.value("whisper_model", 1, type=int))
         self.default_lang_combo.setCurrentIndex(settings.value("default_lang", 0, type=int))
         self.prefer_youtube_check.setChecked(settings.value("prefer_youtube", True, type=bool))
+        self.preload_model_check.setChecked(settings.value("preload_whisper_model", False, type=bool))
+        self.whisper_cache_dir_edit.setText(settings.value("whisper_cache_dir", "", type=str))
 
         # 精度向上設定
         engine_idx = settings.value("whisper_engine", 0, type=int)
         self.whisper_engine_combo.setCurrentIndex(engine_idx)
         self.on_engine_changed(engine_idx)  # UIの状態を更新
+        self.batch_size_spin.setValue(settings.value("whisper_batch_size", 0, type=int))
+        self.vad_filter_check.setChecked(settings.value("whisper_vad_filter", True, type=bool))
         self.custom_vocabulary_edit.setPlainText(settings.value("custom_vocabulary", "", type=str))
         self.on_vocabulary_changed()  # 文字数カウントを更新
 
     def save_settings(self):
-        settings = QSettings("YTDownloader", "Settings")
+        settings = self._settings
         settings.setValue("output_dir", self.output_dir_edit.text())
         settings.setValue("default_format", self.default_format_combo.currentIndex())
         settings.setValue("auto_subtitle", self.auto_subtitle_check.isChecked())
         settings.setValue("whisper_model", self.whisper_model_combo.currentIndex())
         settings.setValue("default_lang", self.default_lang_combo.currentIndex())
         settings.setValue("prefer_youtube", self.prefer_youtube_check.isChecked())
+        settings.setValue("preload_whisper_model", self.preload_model_check.isChecked())
+        settings.setValue("whisper_cache_dir", self.whisper_cache_dir_edit.text().strip())
 
         # 精度向上設定
         settings.setValue("whisper_engine", self.whisper_engine_combo.currentIndex())
+        settings.setValue("whisper_batch_size", self.batch_size_spin.value())
+        settings.setValue("whisper_vad_filter", self.vad_filter_check.isChecked())
         settings.setValue("custom_vocabulary", self.custom_vocabulary_edit.toPlainText())
 
         self.accept()
@@ -12,8 +12,9 @@ from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QTabWidget,
     QStatusBar, QMenu, QMenuBar, QDialog, QMessageBox
 )
-from PyQt6.QtGui import QAction, QIcon
-from PyQt6.QtCore import QSettings, QSize
+from PyQt6.QtGui import QAction
+from PyQt6.QtCore import QSettings
+from yt_dlp.version import __version__ as _YTDLP_VERSION
 
 from src.downloader import YouTubeDownloader
 from src.transcriber import Transcriber
@@ -22,6 +23,7 @@ from src.transcriber import Transcriber
 from src.gui.tabs import DownloadTab, PlaylistTab, SpacesTab, TranscribeTab
 from src.gui.dialogs import SettingsDialog
 from src.gui.workers import UpdateYtDlpWorker
+from src.gui.utils import release_worker, load_app_icon, DEFAULT_DOWNLOAD_DIR
 
 # ロギング設定
 logging.basicConfig(
@@ -30,6 +32,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# メニューのスタイル（マウスオーバー時の視認性向上）
+_MENU_CSS = """
+    QMenuBar::item:selected {
+        background-color: #0078d4;
+        color: white;
+    }
+    QMenu::item:selected {
+        background-color: #0078d4;
+        color: white;
+    }
+"""
+
 
 class MainWindow(QMainWindow):
     """メインウィンドウ"""
@@ -42,13 +56,22 @@ class MainWindow(QMainWindow):
         # ウィンドウアイコン設定
         self._set_window_icon()
 
+        # 設定は1つのインスタンスを使い回し、終了時にまとめて書き出す
+        self._settings = QSettings("YTDownloader", "Settings")
+
         self.downloader = YouTubeDownloader()
-        self.transcriber = Transcriber()
+        self.transcriber = Transcriber(
+            cache_dir=self._settings.value("whisper_cache_dir", "", type=str)
+        )
 
         self.setup_ui()
         self.load_settings()
         self.setup_connections()
 
+        # 最初の文字起こしを待たせないよう、設定に応じてモデルを先に読み込む
+        if self._settings.value("preload_whisper_model", False, type=bool):
+            self.transcribe_tab.preload_model()
+
     def _set_window_icon(self):
         """ウィンドウアイコンを設定"""
         # アプリケーションディレクトリを取得
@@ -57,16 +80,8 @@ class MainWindow(QMainWindow):
         else:
             app_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-        # アイコンファイルを探して設定（複数サイズ）
-        icon = QIcon()
-        for icon_name in ['icon.ico', 'icon_d.png']:
-            icon_path = os.path.join(app_dir, icon_name)
-            if os.path.exists(icon_path):
-                for size in [16, 24, 32, 48, 64, 128, 256]:
-                    icon.addFile(icon_path, QSize(size, size))
-                logger.debug(f"Window icon loaded: {icon_path}")
-                break
-
+        # アイコンファイルを探して設定
+        icon = load_app_icon(app_dir)
         if not icon.isNull():
             self.setWindowIcon(icon)
             logger.debug("Window icon set successfully")
@@ -86,16 +101,16 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(self.tab_widget)
 
         # タブ作成（分離したモジュールを使用）
-        self.download_tab = DownloadTab(self.downloader)
+        self.download_tab = DownloadTab(self.downloader, self._settings)
         self.tab_widget.addTab(self.download_tab, "YouTubeダウンロード")
 
         self.playlist_tab = PlaylistTab(self.downloader)
         self.tab_widget.addTab(self.playlist_tab, "YouTube再生リスト一括ダウンロード")
 
-        self.spaces_tab = SpacesTab()
+        self.spaces_tab = SpacesTab(self._settings)
         self.tab_widget.addTab(self.spaces_tab, "Xスペースダウンロード")
 
-        self.transcribe_tab = TranscribeTab(self.transcriber)
+        self.transcribe_tab = TranscribeTab(self.transcriber, self._settings)
         self.tab_widget.addTab(self.transcribe_tab, "文字起こし")
 
         # ステータスバー
@@ -106,44 +121,32 @@ class MainWindow(QMainWindow):
     def setup_menu(self):
         """メニューバーセットアップ"""
         menubar = self.menuBar()
+        menubar.setStyleSheet(_MENU_CSS)
+
+        # (メニュー名, [(項目名, スロット), ...])、Noneは区切り線
+        menus = (
+            ("ファイル", (
+                ("設定", self.show_settings),
+                None,
+                ("終了", self.close),
+            )),
+            ("ヘルプ", (
+                ("yt-dlpを更新", self.update_ytdlp),
+                None,
+                ("このアプリについて", self.show_about),
+            )),
+        )
 
-        # メニューのスタイル設定（マウスオーバー時の視認性向上）
-        menubar.setStyleSheet("""
-            QMenuBar::item:selected {
-                background-color: #0078d4;
-                color: white;
-            }
-            QMenu::item:selected {
-                background-color: #0078d4;
-                color: white;
-            }
-        """)
-
-        # ファイルメニュー
-        file_menu = menubar.addMenu("ファイル")
-
-        settings_action = QAction("設定", self)
-        settings_action.triggered.connect(self.show_settings)
-        file_menu.addAction(settings_action)
-
-        file_menu.addSeparator()
-
-        exit_action = QAction("終了", self)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-
-        # ヘルプメニュー
-        help_menu = menubar.addMenu("ヘルプ")
-
-        update_ytdlp_action = QAction("yt-dlpを更新", self)
-        update_ytdlp_action.triggered.connect(self.update_ytdlp)
-        help_menu.addAction(update_ytdlp_action)
-
-        help_menu.addSeparator()
-
-        about_action = QAction("このアプリについて", self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        for menu_title, items in menus:
+            menu = menubar.addMenu(menu_title)
+            for item in items:
+                if item is None:
+                    menu.addSeparator()
+                    continue
+                title, slot = item
+                action = QAction(title, self)
+                action.triggered.connect(slot)
+                menu.addAction(action)
 
     def setup_connections(self):
         """シグナル接続"""
@@ -158,18 +161,20 @@ class MainWindow(QMainWindow):
 
     def load_settings(self):
         """設定を読み込み"""
-        settings = QSettings("YTDownloader", "Settings")
-        default_dir = os.path.expanduser("~/Downloads")
-
         # YouTube用保存先
-        output_dir = settings.value("output_dir", default_dir)
+        output_dir = self._settings.value("output_dir", DEFAULT_DOWNLOAD_DIR)
         self.download_tab.save_dir_edit.setText(output_dir)
         self.downloader.output_dir = output_dir
 
         # Xスペース用保存先
         self.spaces_tab.load_settings(output_dir)
 
-        logger.debug(f"Settings loaded - output_dir: {output_dir}")
+        logger.debug("Settings loaded - output_dir: %s", output_dir)
+
+    def closeEvent(self, event):
+        """終了時に設定をディスクへ書き出す"""
+        self._settings.sync()
+        super().closeEvent(event)
 
     def on_playlist_download_requested(self, urls: list):
         """再生リストからダウンロード要求"""
@@ -194,22 +199,29 @@ class MainWindow(QMainWindow):
 
     def show_settings(self):
         """設定ダイアログを表示"""
-        dialog = SettingsDialog(self)
+        old_cache_dir = self._settings.value("whisper_cache_dir", "", type=str)
+        dialog = SettingsDialog(self._settings, self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.load_settings()
+            # モデルの保存先が変わった時だけ読み込み済みモデルを破棄（文字起こし中は除く）
+            # エンジン・モデルの切り替えはキャッシュのキーで区別されるため破棄不要
+            # 保存先はモデル読み込み時にだけ参照されるため、文字起こし中でも反映してよい
+            cache_dir = self._settings.value("whisper_cache_dir", "", type=str)
+            if cache_dir != old_cache_dir:
+                self.transcriber.set_cache_dir(cache_dir)
+                if self.transcribe_tab.current_worker is None:
+                    self.transcriber.clear_model_cache()
             # 文字起こしタブのUI状態を更新
             self.transcribe_tab.update_model_ui_state()
 
     def show_about(self):
         """アプリ情報を表示"""
-        import yt_dlp
-        ytdlp_version = yt_dlp.version.__version__
         QMessageBox.about(self, "YouTube Downloader",
             f"YouTube Downloader v1.0\n\n"
             f"YouTube動画のダウンロードと文字起こしツール\n"
             f"私的利用専用\n\n"
             f"使用ライブラリ:\n"
-            f"- yt-dlp (v{ytdlp_version})\n"
+            f"- yt-dlp (v{_YTDLP_VERSION})\n"
             f"- OpenAI Whisper\n"
             f"- PyQt6"
         )
@@ -238,6 +250,8 @@ class MainWindow(QMainWindow):
 
     def _on_ytdlp_update_finished(self, success: bool, message: str):
         """yt-dlp更新完了"""
+        release_worker(self.update_worker)
+        self.update_worker = None
         self.status_bar.showMessage("準備完了")
 
         if success:
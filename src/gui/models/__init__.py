@@ -0,0 +1,11 @@
+"""
+モデルモジュール
+QTableViewなどで使用するデータモデル
+"""
+
+from src.gui.models.playlist_model import PlaylistTableModel, PlaylistFilterProxy
+
+__all__ = [
+    'PlaylistTableModel',
+    'PlaylistFilterProxy',
+]
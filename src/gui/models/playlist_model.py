@@ -0,0 +1,190 @@
+"""
+再生リスト用テーブルモデル
+QTableWidgetItemを使わず、列ごとの配列から表示データを返す
+行はスクロールに合わせて PLAYLIST_TABLE_FETCH_ROWS 件ずつ追加する
+"""
+
+from typing import List, Optional
+
+import numpy as np
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+
+from src.downloader import VideoInfo
+from src.constants import PLAYLIST_TABLE_FETCH_ROWS
+
+
+class PlaylistTableModel(QAbstractTableModel):
+    """再生リストのテーブルモデル"""
+
+    HEADERS = ("選択", "タイトル", "再生時間", "再生回数", "アップロード日")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.videos: List[VideoInfo] = []
+        # ビューに公開済みの行数（残りは fetchMore で追加）
+        self._loaded = 0
+        # 列ごとの表示文字列（公開済みの行の分だけ生成）
+        self._titles: List[str] = []
+        self._durations: List[str] = []
+        self._views: List[str] = []
+        self._dates: List[str] = []
+        # 選択状態（1行1バイト）と選択中の件数（変更のたびに増減させて保持）
+        self.checked = bytearray()
+        self._checked_total = 0
+
+    def load(self, videos: List[VideoInfo]):
+        """動画リストを読み込み（全件選択状態、表示は最初の一部のみ）"""
+        self.beginResetModel()
+        self.videos = list(videos)
+        self._titles = []
+        self._durations = []
+        self._views = []
+        self._dates = []
+        self._loaded = 0
+        self._format_rows(min(len(self.videos), PLAYLIST_TABLE_FETCH_ROWS))
+        self.checked = bytearray(b'\x01') * len(self.videos)
+        self._checked_total = len(self.videos)
+        self.endResetModel()
+
+    def _format_rows(self, count: int):
+        """公開済みの行の続きから count 件の表示文字列を生成"""
+        batch = self.videos[self._loaded:self._loaded + count]
+        self._titles.extend(v.title for v in batch)
+        self._durations.extend(v.duration_str for v in batch)
+        self._views.extend(v.view_count_str for v in batch)
+        self._dates.extend(
+            v.upload_datetime.strftime("%Y/%m/%d") if v.upload_datetime else "不明"
+            for v in batch
+        )
+        self._loaded += len(batch)
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self.videos)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(len(self.videos) - self._loaded, PLAYLIST_TABLE_FETCH_ROWS)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._format_rows(count)
+        self.endInsertRows()
+
+    def clear(self):
+        """全データを消去"""
+        self.load([])
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 1:
+                return self._titles[row]
+            if column == 2:
+                return self._durations[row]
+            if column == 3:
+                return self._views[row]
+            if column == 4:
+                return self._dates[row]
+        elif role == Qt.ItemDataRole.CheckStateRole and column == 0:
+            return Qt.CheckState.Checked if self.checked[row] else Qt.CheckState.Unchecked
+
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or index.column() != 0 or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+
+        row = index.row()
+        new_state = 1 if Qt.CheckState(value) == Qt.CheckState.Checked else 0
+        if self.checked[row] == new_state:
+            return True
+
+        self.checked[row] = new_state
+        self._checked_total += 1 if new_state else -1
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if index.column() == 0:
+            return Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def set_all_checked(self, checked: bool):
+        """全行の選択状態を一括変更"""
+        if not self.videos:
+            return
+        self.checked = bytearray(b'\x01' if checked else b'\x00') * len(self.videos)
+        self._checked_total = len(self.videos) if checked else 0
+        self._emit_checks_changed()
+
+    def set_checked_mask(self, mask: np.ndarray):
+        """行ごとの真偽値配列で選択状態を一括設定"""
+        if not self.videos:
+            return
+        self.checked = bytearray(np.asarray(mask, dtype=np.uint8))
+        self._checked_total = self.checked.count(1)
+        self._emit_checks_changed()
+
+    def _emit_checks_changed(self):
+        """公開済みの全行のチェック状態の変更を通知"""
+        if self._loaded:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(self._loaded - 1, 0),
+                [Qt.ItemDataRole.CheckStateRole]
+            )
+
+    def checked_count(self) -> int:
+        """選択中の件数（走査せずに保持している件数を返す）"""
+        return self._checked_total
+
+    def checked_videos(self) -> List[VideoInfo]:
+        """選択中の動画リスト"""
+        return [v for v, c in zip(self.videos, self.checked) if c]
+
+
+class PlaylistFilterProxy(QSortFilterProxyModel):
+    """再生リストのフィルター用プロキシ（表示する行を真偽値配列で保持）"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # ソースモデルと同じ行順の表示可否（Noneは全件表示）
+        self._accepted: Optional[np.ndarray] = None
+
+    def set_accepted_rows(self, mask: Optional[np.ndarray]):
+        """表示する行を設定（モデルの再構築はせず、表示行だけを再評価）"""
+        self._accepted = mask
+        self.invalidateFilter()
+
+    def clear_filter(self):
+        """フィルターを解除して全件表示"""
+        self.set_accepted_rows(None)
+
+    def accepted_mask(self) -> Optional[np.ndarray]:
+        """現在の表示可否配列（全件表示中はNone）"""
+        return self._accepted
+
+    def filterAcceptsRow(self, source_row, source_parent) -> bool:
+        if self._accepted is None:
+            return True
+        return bool(self._accepted[source_row])
@@ -9,13 +9,16 @@ from datetime import datetime
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
     QLabel, QTextEdit, QComboBox, QCheckBox,
-    QProgressBar, QPushButton, QLineEdit, QFileDialog, QMessageBox
+    QProgressBar, QPushButton, QLineEdit, QFileDialog, QMessageBox, QSpinBox
 )
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import QSettings, QThreadPool, QTimer, pyqtSignal
 
-from src.gui.utils import style_combobox
+from src.gui.utils import (
+    style_combobox, release_worker, LogBuffer, DEFAULT_DOWNLOAD_DIR, PROGRESS_UI_INTERVAL_MS
+)
 from src.gui.workers import DownloadWorker
-from src.downloader import YouTubeDownloader, extract_urls_from_text
+from src.downloader import YouTubeDownloader
+from src.constants import DEFAULT_DOWNLOAD_CONCURRENCY, MAX_DOWNLOAD_CONCURRENCY
 
 
 class DownloadTab(QWidget):
@@ -24,10 +27,28 @@ class DownloadTab(QWidget):
     # 文字起こし開始シグナル（ファイルパスを親に送信）
     transcribe_requested = pyqtSignal(str)
 
-    def __init__(self, downloader: YouTubeDownloader, parent=None):
+    # 画質フォーマット（quality_combo のインデックス順）
+    _QUALITY_FORMATS = (
+        'best',
+        'best_mp4',
+        'bestvideo[height<=1080]+bestaudio/best[height<=1080]',
+        'bestvideo[height<=720]+bestaudio/best[height<=720]',
+        'bestvideo[height<=480]+bestaudio/best[height<=480]',
+        'bestvideo[height<=360]+bestaudio/best[height<=360]',
+    )
+
+    def __init__(self, downloader: YouTubeDownloader, settings: QSettings, parent=None):
         super().__init__(parent)
         self.downloader = downloader
+        self._settings = settings  # MainWindowと共有する設定
         self.current_worker = None
+
+        # ダウンロード中の進捗は最新の1件だけを保持し、タイマーでまとめて反映
+        self._pending_download_progress = None
+        self._download_ui_timer = QTimer(self)
+        self._download_ui_timer.setInterval(PROGRESS_UI_INTERVAL_MS)
+        self._download_ui_timer.timeout.connect(self._flush_download_progress)
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -75,6 +96,17 @@ class DownloadTab(QWidget):
         self.quality_combo.setCurrentIndex(1)  # MP4をデフォルトに
         quality_layout.addWidget(quality_label)
         quality_layout.addWidget(self.quality_combo)
+
+        # 同時ダウンロード数（ダウンロード開始時に設定へ保存）
+        concurrency_label = QLabel("同時ダウンロード数:")
+        self.concurrency_spin = QSpinBox()
+        self.concurrency_spin.setRange(1, MAX_DOWNLOAD_CONCURRENCY)
+        self.concurrency_spin.setValue(
+            self._settings.value("dl_concurrency", DEFAULT_DOWNLOAD_CONCURRENCY, type=int)
+        )
+        self.concurrency_spin.setToolTip("複数URLを同時にダウンロードする数（増やしすぎると制限される可能性があります）")
+        quality_layout.addWidget(concurrency_label)
+        quality_layout.addWidget(self.concurrency_spin)
         options_layout.addLayout(quality_layout)
 
         # チェックボックス
@@ -95,8 +127,7 @@ class DownloadTab(QWidget):
         save_layout = QVBoxLayout()
         save_label = QLabel("保存先:")
         self.save_dir_edit = QLineEdit()
-        default_save_dir = os.path.expanduser("~/Downloads")
-        self.save_dir_edit.setText(default_save_dir)
+        self.save_dir_edit.setText(DEFAULT_DOWNLOAD_DIR)
         self.save_dir_edit.setToolTip("実際の保存先はタイムスタンプ付きフォルダが作成されます")
         save_dir_btn = QPushButton("参照...")
         save_dir_btn.clicked.connect(self.browse_save_dir)
@@ -144,6 +175,7 @@ class DownloadTab(QWidget):
         # ログ表示
         self.download_log = QTextEdit()
         self.download_log.setReadOnly(True)
+        self._download_log_buffer = LogBuffer(self.download_log)
         self.download_log.setMaximumHeight(150)
         layout.addWidget(self.download_log)
 
@@ -163,77 +195,86 @@ class DownloadTab(QWidget):
             QMessageBox.warning(self, "エラー", "URLを入力してください")
             return
 
-        urls = extract_urls_from_text(text)
-        if not urls:
-            # 直接入力の場合
-            urls = [line.strip() for line in text.split('\n') if line.strip()]
-
-        if not urls:
-            QMessageBox.warning(self, "エラー", "有効なURLが見つかりません")
-            return
-
-        # 保存先設定（タイムスタンプ付きフォルダを作成）
-        base_dir = self.save_dir_edit.text().strip() or os.path.expanduser("~/Downloads")
+        # 保存先設定（タイムスタンプ付きフォルダは最初のダウンロード時に作成される）
+        base_dir = self.save_dir_edit.text().strip() or DEFAULT_DOWNLOAD_DIR
         timestamp = datetime.now().strftime("%Y%m%d_%H_%M_%S")
-        output_dir = os.path.join(base_dir, f"YouTube_{timestamp}")
-        self.downloader.output_dir = output_dir
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        self.downloader.output_dir = os.path.join(base_dir, f"YouTube_{timestamp}")
 
         # オプション取得
-        format_map = {
-            0: 'best',
-            1: 'best_mp4',
-            2: 'bestvideo[height<=1080]+bestaudio/best[height<=1080]',
-            3: 'bestvideo[height<=720]+bestaudio/best[height<=720]',
-            4: 'bestvideo[height<=480]+bestaudio/best[height<=480]',
-            5: 'bestvideo[height<=360]+bestaudio/best[height<=360]',
-        }
+        quality_idx = self.quality_combo.currentIndex()
+        if 0 <= quality_idx < len(self._QUALITY_FORMATS):
+            format_option = self._QUALITY_FORMATS[quality_idx]
+        else:
+            format_option = 'best'
 
         options = {
-            'format': format_map.get(self.quality_combo.currentIndex(), 'best'),
+            'format': format_option,
             'audio_only': self.audio_only_check.isChecked(),
             'subtitle': self.subtitle_check.isChecked(),
             'anti_ban': self.anti_ban_check.isChecked(),
+            'concurrency': self.concurrency_spin.value(),
         }
+        self._settings.setValue("dl_concurrency", options['concurrency'])
 
         # UI更新
         self.download_btn.setEnabled(False)
         self.cancel_btn.setEnabled(True)
         self.download_progress.setValue(0)
         self.download_status_label.setText("ダウンロード準備中...")
-        self.download_log.clear()
-
-        # ワーカー開始
-        self.current_worker = DownloadWorker(self.downloader, urls, options)
-        self.current_worker.progress.connect(self.on_download_progress)
-        self.current_worker.item_progress.connect(self.on_item_progress)
-        self.current_worker.finished.connect(self.on_download_finished)
-        self.current_worker.error.connect(self.on_download_error)
-        self.current_worker.start()
+        self._download_log_buffer.clear()
+
+        # ワーカー開始（URLの解析もワーカー側で行い、GUIスレッドを止めない）
+        # キャンセルフラグは開始前にリセットし、解析中のキャンセルも反映させる
+        self.downloader.reset_cancel()
+        self.current_worker = DownloadWorker(self.downloader, text, options)
+        signals = self.current_worker.signals
+        signals.progress.connect(self.on_download_progress)
+        signals.item_progress.connect(self.on_item_progress)
+        signals.urls_parsed.connect(self.on_urls_parsed)
+        signals.finished.connect(self.on_download_finished)
+        signals.error.connect(self.on_download_error)
+        QThreadPool.globalInstance().start(self.current_worker)
+        self._download_ui_timer.start()
 
     def on_download_progress(self, info):
         """ダウンロード進捗更新"""
         status = info.get('status', '')
         if status == 'downloading':
-            percent = info.get('percent', 0)
-            self.download_progress.setValue(int(percent))
-            speed = info.get('speed', 0)
-            if speed:
-                speed_str = f"{speed / 1024 / 1024:.1f} MB/s"
-            else:
-                speed_str = "計算中..."
-            self.download_status_label.setText(f"ダウンロード中... {percent:.1f}% ({speed_str})")
+            # 高頻度な進捗はタイマーで間引いて反映
+            self._pending_download_progress = info
         elif status == 'finished':
+            self._pending_download_progress = None
             self.download_status_label.setText(info.get('message', '処理中...'))
 
+    def _flush_download_progress(self):
+        """保留中のダウンロード進捗をUIに反映（タイマーから呼び出し）"""
+        info = self._pending_download_progress
+        if info is None:
+            return
+        self._pending_download_progress = None
+
+        percent = info.get('percent', 0)
+        self.download_progress.setValue(int(percent))
+        speed = info.get('speed', 0)
+        if speed:
+            speed_str = f"{speed / 1024 / 1024:.1f} MB/s"
+        else:
+            speed_str = "計算中..."
+        self.download_status_label.setText(f"ダウンロード中... {percent:.1f}% ({speed_str})")
+
+    def on_urls_parsed(self, urls):
+        """URL解析完了"""
+        self.item_progress_label.setText(f"進捗: 0/{len(urls)}")
+        self.download_status_label.setText(f"{len(urls)}件のダウンロードを準備中...")
+
     def on_item_progress(self, current, total, url):
         """アイテム進捗更新"""
         self.item_progress_label.setText(f"進捗: {current}/{total}")
-        self.download_log.append(f"[{current}/{total}] {url}")
+        self._download_log_buffer.append(f"[{current}/{total}] {url}")
 
     def on_download_finished(self, results):
         """ダウンロード完了"""
+        self._release_worker()
         self.download_btn.setEnabled(True)
         self.cancel_btn.setEnabled(False)
         self.download_progress.setValue(100)
@@ -242,24 +283,32 @@ class DownloadTab(QWidget):
         success_files = [r for r in results if not r.startswith("ERROR")]
         error_results = [r for r in results if r.startswith("ERROR")]
 
-        self.download_log.append(f"\n{'='*40}")
-        self.download_log.append(f"完了: {len(success_files)}件成功, {len(error_results)}件失敗")
+        # 結果の一覧は行リストにまとめてから1回で追加する
+        lines = [
+            f"\n{'='*40}",
+            f"完了: {len(success_files)}件成功, {len(error_results)}件失敗",
+        ]
 
         # 成功したファイルを表示
         if success_files:
-            self.download_log.append("\n【成功】")
-            for f in success_files:
-                self.download_log.append(f"  {f}")
+            lines.append("\n【成功】")
+            lines.extend(f"  {f}" for f in success_files)
 
         # エラー詳細を表示
         if error_results:
-            self.download_log.append("\n【エラー】")
-            for e in error_results:
-                self.download_log.append(f"  {e}")
+            lines.append("\n【エラー】")
+            lines.extend(f"  {e}" for e in error_results)
+
+        start_transcribe = self.transcribe_check.isChecked() and len(success_files) > 0
+        if start_transcribe:
+            lines.append("\n文字起こしを開始します...")
+
+        # ダイアログ表示前に反映しておく
+        self._download_log_buffer.extend(lines)
+        self._download_log_buffer.flush()
 
         # 文字起こしも実行（最初の成功ファイルのみ）
-        if self.transcribe_check.isChecked() and len(success_files) > 0:
-            self.download_log.append("\n文字起こしを開始します...")
+        if start_transcribe:
             self.transcribe_requested.emit(success_files[0])
 
         QMessageBox.information(self, "完了",
@@ -267,11 +316,19 @@ class DownloadTab(QWidget):
 
     def on_download_error(self, error_msg):
         """ダウンロードエラー"""
+        self._release_worker()
         self.download_btn.setEnabled(True)
         self.cancel_btn.setEnabled(False)
         self.download_status_label.setText("エラー発生")
         QMessageBox.critical(self, "エラー", f"ダウンロードエラー:\n{error_msg}")
 
+    def _release_worker(self):
+        """完了したワーカーを解放"""
+        self._download_ui_timer.stop()
+        self._pending_download_progress = None
+        release_worker(self.current_worker)
+        self.current_worker = None
+
     def cancel_download(self):
         """ダウンロードキャンセル"""
         if self.current_worker:
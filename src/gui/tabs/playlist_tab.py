@@ -3,20 +3,46 @@
 YouTubeプレイリストのダウンロード機能を提供
 """
 
+import calendar
 from datetime import datetime
 
+import numpy as np
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
     QLabel, QLineEdit, QPushButton, QProgressBar, QCheckBox,
-    QSpinBox, QComboBox, QTableWidget, QTableWidgetItem,
+    QSpinBox, QComboBox, QTableView,
     QHeaderView, QAbstractItemView, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QThreadPool, QTimer, pyqtSignal
 
+from src.gui.models import PlaylistTableModel, PlaylistFilterProxy
+from src.gui.utils import release_worker, PROGRESS_UI_INTERVAL_MS
 from src.gui.workers import PlaylistFetchWorker
 from src.downloader import YouTubeDownloader, PlaylistFilter
 
 
+# フィルター用の数値列で値がないことを表す値（再生回数・再生時間・日付はいずれも0以上）
+_MISSING = -1
+
+# 日付フィルターの年・月プルダウンの項目（インスタンスごとに作らないよう一度だけ生成）
+_YEARS = [str(y) for y in range(2005, 2027)]
+_MONTHS = [str(m) for m in range(1, 13)]
+
+
+def _column_range(column: np.ndarray):
+    """数値列の (最小値, 最大値) を取得（値がない場合はNone）"""
+    valid = column[column != _MISSING]
+    if not valid.size:
+        return None
+    return int(valid.min()), int(valid.max())
+
+
+def _month_end(year: int, month: int) -> int:
+    """指定した年月の末日を取得"""
+    return calendar.monthrange(year, month)[1]
+
+
 class PlaylistTab(QWidget):
     """再生リストタブ"""
 
@@ -27,8 +53,17 @@ class PlaylistTab(QWidget):
         super().__init__(parent)
         self.downloader = downloader
         self.all_videos = []  # 全動画（フィルター前）
+        self._titles_lc = []  # all_videos と同じ順のcasefold済みタイトル（タイトルフィルター用）
+        self._set_filter_columns([])  # all_videos と同じ順の数値列（数値フィルター用）
         self.playlist_videos = []  # 表示中の動画（フィルター後）
         self.current_worker = None
+
+        # 取得進捗は最新値だけを保持し、タイマーで一定間隔ごとに表示へ反映
+        self._pending_playlist_progress = None
+        self._playlist_ui_timer = QTimer(self)
+        self._playlist_ui_timer.setInterval(PROGRESS_UI_INTERVAL_MS)
+        self._playlist_ui_timer.timeout.connect(self._flush_playlist_progress)
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -64,20 +99,20 @@ class PlaylistTab(QWidget):
 
         # From: 年・月プルダウン
         self.year_from = QComboBox()
-        self.year_from.addItems([str(y) for y in range(2005, 2027)])
+        self.year_from.addItems(_YEARS)
         self.year_from.setCurrentText("2005")
         self.year_from.setFixedWidth(70)
         self.month_from = QComboBox()
-        self.month_from.addItems([str(m) for m in range(1, 13)])
+        self.month_from.addItems(_MONTHS)
         self.month_from.setFixedWidth(50)
 
         # To: 年・月プルダウン
         self.year_to = QComboBox()
-        self.year_to.addItems([str(y) for y in range(2005, 2027)])
+        self.year_to.addItems(_YEARS)
         self.year_to.setCurrentText("2026")  # 2026年をデフォルト
         self.year_to.setFixedWidth(70)
         self.month_to = QComboBox()
-        self.month_to.addItems([str(m) for m in range(1, 13)])
+        self.month_to.addItems(_MONTHS)
         self.month_to.setCurrentText("12")
         self.month_to.setFixedWidth(50)
 
@@ -183,12 +218,16 @@ class PlaylistTab(QWidget):
         list_group = QGroupBox("動画一覧")
         list_layout = QVBoxLayout()
 
-        self.playlist_table = QTableWidget()
-        self.playlist_table.setColumnCount(5)
-        self.playlist_table.setHorizontalHeaderLabels(["選択", "タイトル", "再生時間", "再生回数", "アップロード日"])
+        # モデルは全動画を保持し、フィルターはプロキシで表示行だけを絞り込む
+        self.playlist_model = PlaylistTableModel(self)
+        self.playlist_proxy = PlaylistFilterProxy(self)
+        self.playlist_proxy.setSourceModel(self.playlist_model)
+        self.playlist_table = QTableView()
+        self.playlist_table.setModel(self.playlist_proxy)
         self.playlist_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         self.playlist_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.playlist_table.cellChanged.connect(self.update_selected_count)
+        self.playlist_model.dataChanged.connect(self._on_playlist_data_changed)
+        self.playlist_model.modelReset.connect(self.update_selected_count)
         list_layout.addWidget(self.playlist_table)
 
         # 選択ボタン
@@ -230,16 +269,10 @@ class PlaylistTab(QWidget):
                 int(self.month_from.currentText()),
                 1
             )
-            # 月末日を計算
+            # 終了月の末日まで
             year_to = int(self.year_to.currentText())
             month_to = int(self.month_to.currentText())
-            if month_to == 12:
-                next_month = datetime(year_to + 1, 1, 1)
-            else:
-                next_month = datetime(year_to, month_to + 1, 1)
-            from datetime import timedelta
-            last_day = (next_month - timedelta(days=1)).day
-            filter_options.date_to = datetime(year_to, month_to, last_day)
+            filter_options.date_to = datetime(year_to, month_to, _month_end(year_to, month_to))
 
         if self.use_view_filter.isChecked():
             filter_options.min_views = self.min_views.value()
@@ -262,29 +295,47 @@ class PlaylistTab(QWidget):
         self.cancel_fetch_btn.setEnabled(True)
         self.playlist_progress_label.setText("再生リストを読み込み中...")
         self.playlist_progress.setValue(0)
-        self.playlist_table.setRowCount(0)
+        self._update_table([])
 
         # ワーカー開始
         self.current_worker = PlaylistFetchWorker(self.downloader, url, filter_options)
-        self.current_worker.progress.connect(self.on_playlist_progress)
-        self.current_worker.finished.connect(self.on_playlist_fetched)
-        self.current_worker.error.connect(self.on_playlist_error)
-        self.current_worker.start()
+        signals = self.current_worker.signals
+        signals.progress.connect(self.on_playlist_progress)
+        signals.finished.connect(self.on_playlist_fetched)
+        signals.error.connect(self.on_playlist_error)
+        QThreadPool.globalInstance().start(self.current_worker)
+        self._playlist_ui_timer.start()
+
+    def _release_worker(self):
+        """完了したワーカーを解放"""
+        self._playlist_ui_timer.stop()
+        self._pending_playlist_progress = None
+        release_worker(self.current_worker)
+        self.current_worker = None
 
     def cancel_fetch(self):
         """読み込みを中止"""
-        if self.current_worker and self.current_worker.isRunning():
+        if self.current_worker and self.current_worker.is_running():
             self.downloader.cancel()
             self.playlist_progress_label.setText("中止中...")
             self.cancel_fetch_btn.setEnabled(False)
 
     def on_playlist_progress(self, current, total):
-        """再生リスト取得進捗"""
+        """再生リスト取得進捗（表示はタイマーでまとめて更新）"""
+        self._pending_playlist_progress = (current, total)
+
+    def _flush_playlist_progress(self):
+        """保留中の取得進捗をUIに反映（タイマーから呼び出し）"""
+        if self._pending_playlist_progress is None:
+            return
+        current, total = self._pending_playlist_progress
+        self._pending_playlist_progress = None
         self.playlist_progress_label.setText(f"読み込み中... {current}/{total}")
         self.playlist_progress.setValue(int(current / total * 100) if total > 0 else 0)
 
     def on_playlist_fetched(self, videos):
         """再生リスト取得完了"""
+        self._release_worker()
         self.fetch_playlist_btn.setEnabled(True)
         self.cancel_fetch_btn.setEnabled(False)
 
@@ -295,68 +346,67 @@ class PlaylistTab(QWidget):
             return
 
         self.all_videos = videos  # 全動画を保存
+        self._titles_lc = [v.title.casefold() for v in videos]  # フィルターのたびに変換しないよう一度だけ
+        self._set_filter_columns(videos)
         self.playlist_videos = videos  # 表示用にもコピー
         self.playlist_progress_label.setText(f"完了: {len(videos)}件の動画")
         self.playlist_progress.setValue(100)
 
         # フィルターのデフォルト値を実際のデータ範囲に設定
-        self._set_filter_defaults_from_data(videos)
+        self._set_filter_defaults_from_data()
 
         # テーブル更新
         self._update_table(videos)
 
-    def _set_filter_defaults_from_data(self, videos):
-        """フィルターのデフォルト値を実際のデータ範囲に設定"""
-        if not videos:
-            return
-
-        # 日付の範囲を計算
-        dates = [v.upload_datetime for v in videos if v.upload_datetime]
-        if dates:
-            min_date = min(dates)
-            max_date = max(dates)
-            self.year_from.setCurrentText(str(min_date.year))
-            self.month_from.setCurrentText(str(min_date.month))
-            self.year_to.setCurrentText(str(max_date.year))
-            self.month_to.setCurrentText(str(max_date.month))
-
-        # 再生回数の範囲を計算
-        view_counts = [v.view_count for v in videos if v.view_count is not None]
-        if view_counts:
-            self.min_views.setValue(min(view_counts))
-            self.max_views.setValue(max(view_counts))
-
-        # 再生時間の範囲を計算（秒→分に変換）
-        durations = [v.duration for v in videos if v.duration is not None]
-        if durations:
-            self.min_duration.setValue(min(durations) // 60)
-            self.max_duration.setValue(max(durations) // 60 + 1)  # 切り上げ
+    def _set_filter_columns(self, videos):
+        """数値フィルター用の列（再生回数・再生時間・投稿日YYYYMMDD）をNumPy配列で作成"""
+        views = []
+        durations = []
+        dates = []
+        for v in videos:
+            views.append(v.view_count if v.view_count is not None else _MISSING)
+            durations.append(v.duration if v.duration is not None else _MISSING)
+            dt = v.upload_datetime
+            dates.append(dt.year * 10000 + dt.month * 100 + dt.day if dt else _MISSING)
+        self._views = np.array(views, dtype=np.int64)
+        self._durations = np.array(durations, dtype=np.int64)
+        self._dates = np.array(dates, dtype=np.int64)
+
+        # フィルターの既定値に使う範囲（リセット時に再計算しないよう保持）
+        self._filter_ranges = {
+            'date': _column_range(self._dates),
+            'views': _column_range(self._views),
+            'duration': _column_range(self._durations),
+        }
+
+    def _set_filter_defaults_from_data(self):
+        """フィルターのデフォルト値を実際のデータ範囲に設定（取得時に求めた範囲を使用）"""
+        ranges = self._filter_ranges
+
+        # 日付の範囲（YYYYMMDD）
+        if ranges['date']:
+            min_date, max_date = ranges['date']
+            self.year_from.setCurrentText(str(min_date // 10000))
+            self.month_from.setCurrentText(str(min_date // 100 % 100))
+            self.year_to.setCurrentText(str(max_date // 10000))
+            self.month_to.setCurrentText(str(max_date // 100 % 100))
+
+        # 再生回数の範囲
+        if ranges['views']:
+            min_views, max_views = ranges['views']
+            self.min_views.setValue(min_views)
+            self.max_views.setValue(max_views)
+
+        # 再生時間の範囲（秒→分に変換）
+        if ranges['duration']:
+            min_duration, max_duration = ranges['duration']
+            self.min_duration.setValue(min_duration // 60)
+            self.max_duration.setValue(max_duration // 60 + 1)  # 切り上げ
 
     def _update_table(self, videos):
-        """テーブルを更新"""
-        self.playlist_table.setRowCount(len(videos))
-        for i, video in enumerate(videos):
-            # チェックボックス
-            checkbox = QTableWidgetItem()
-            checkbox.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-            checkbox.setCheckState(Qt.CheckState.Checked)
-            self.playlist_table.setItem(i, 0, checkbox)
-
-            # タイトル
-            self.playlist_table.setItem(i, 1, QTableWidgetItem(video.title))
-
-            # 再生時間
-            self.playlist_table.setItem(i, 2, QTableWidgetItem(video.duration_str))
-
-            # 再生回数
-            self.playlist_table.setItem(i, 3, QTableWidgetItem(video.view_count_str))
-
-            # アップロード日
-            upload_date = video.upload_datetime
-            date_str = upload_date.strftime("%Y/%m/%d") if upload_date else "不明"
-            self.playlist_table.setItem(i, 4, QTableWidgetItem(date_str))
-
-        self.update_selected_count()
+        """テーブルを更新（モデルを一括リセットし、フィルターを解除）"""
+        self.playlist_model.load(videos)
+        self.playlist_proxy.clear_filter()
 
     def apply_filter(self):
         """フィルターを適用（ローカルで絞り込み）"""
@@ -364,50 +414,57 @@ class PlaylistTab(QWidget):
             QMessageBox.warning(self, "エラー", "先に再生リストを読み込んでください")
             return
 
-        filtered = self.all_videos.copy()
-
-        # 日付フィルター
-        if self.use_date_filter.isChecked():
-            date_from = datetime(
-                int(self.year_from.currentText()),
-                int(self.month_from.currentText()),
-                1
+        # 条件は1回だけ求める
+        use_date = self.use_date_filter.isChecked()
+        use_view = self.use_view_filter.isChecked()
+        use_dur = self.use_duration_filter.isChecked()
+        needle = self.title_contains.text().strip().casefold()
+        neg = self.title_excludes.text().strip().casefold()
+
+        # 条件がなければ絞り込まずに全件表示（配列や一覧を作らない）
+        if not (use_date or use_view or use_dur or needle or neg):
+            self.playlist_videos = self.all_videos
+            self.playlist_model.set_all_checked(True)
+            self.playlist_proxy.clear_filter()
+            self.playlist_progress_label.setText(
+                f"フィルター適用: {len(self.all_videos)}/{len(self.all_videos)}件"
             )
-            # 月末日を計算
+            return
+
+        # 数値フィルターは列全体をまとめて比較
+        mask = np.ones(len(self.all_videos), dtype=bool)
+        if use_date:
+            # 投稿日はYYYYMMDDの整数で比較（開始月の1日〜終了月の末日）
+            date_from = int(self.year_from.currentText()) * 10000 + int(self.month_from.currentText()) * 100 + 1
             year_to = int(self.year_to.currentText())
             month_to = int(self.month_to.currentText())
-            if month_to == 12:
-                next_month = datetime(year_to + 1, 1, 1)
-            else:
-                next_month = datetime(year_to, month_to + 1, 1)
-            from datetime import timedelta
-            last_day = (next_month - timedelta(days=1)).day
-            date_to = datetime(year_to, month_to, last_day, 23, 59, 59)
-            filtered = [v for v in filtered if v.upload_datetime and date_from <= v.upload_datetime <= date_to]
-
-        # 再生回数フィルター
-        if self.use_view_filter.isChecked():
-            min_v = self.min_views.value()
-            max_v = self.max_views.value()
-            filtered = [v for v in filtered if v.view_count is not None and min_v <= v.view_count <= max_v]
-
-        # 再生時間フィルター（分→秒に変換して比較）
-        if self.use_duration_filter.isChecked():
-            min_d = self.min_duration.value() * 60  # 分→秒
-            max_d = self.max_duration.value() * 60
-            filtered = [v for v in filtered if v.duration is not None and min_d <= v.duration <= max_d]
-
-        # タイトルフィルター
-        title_contains = self.title_contains.text().strip()
-        title_excludes = self.title_excludes.text().strip()
-        if title_contains:
-            filtered = [v for v in filtered if title_contains.lower() in v.title.lower()]
-        if title_excludes:
-            filtered = [v for v in filtered if title_excludes.lower() not in v.title.lower()]
-
-        # 結果を保存して表示
+            date_to = year_to * 10000 + month_to * 100 + _month_end(year_to, month_to)
+            mask &= (self._dates != _MISSING) & (self._dates >= date_from) & (self._dates <= date_to)
+        if use_view:
+            mask &= (self._views != _MISSING) & (self._views >= self.min_views.value()) \
+                & (self._views <= self.max_views.value())
+        if use_dur:
+            # 分→秒に変換して比較
+            mask &= (self._durations != _MISSING) & (self._durations >= self.min_duration.value() * 60) \
+                & (self._durations <= self.max_duration.value() * 60)
+        indices = np.flatnonzero(mask).tolist()
+
+        # タイトルフィルターは残った動画だけをcasefold済みのタイトルと比較
+        if needle or neg:
+            titles_lc = self._titles_lc
+            indices = [
+                i for i in indices
+                if (not needle or needle in titles_lc[i]) and (not neg or neg not in titles_lc[i])
+            ]
+            mask = np.zeros(len(self.all_videos), dtype=bool)
+            mask[indices] = True
+        filtered = [self.all_videos[i] for i in indices]
+
+        # 結果を保存し、テーブルは作り直さずプロキシで表示行だけを切り替え
+        # （表示される動画を選択状態にし、非表示の動画は選択から外す）
         self.playlist_videos = filtered
-        self._update_table(filtered)
+        self.playlist_model.set_checked_mask(mask)
+        self.playlist_proxy.set_accepted_rows(mask)
         self.playlist_progress_label.setText(f"フィルター適用: {len(filtered)}/{len(self.all_videos)}件")
 
     def reset_filter(self):
@@ -423,18 +480,21 @@ class PlaylistTab(QWidget):
         self.title_excludes.clear()
 
         # デフォルト値を再設定
-        self._set_filter_defaults_from_data(self.all_videos)
+        self._set_filter_defaults_from_data()
 
-        # 全件表示
+        # 全件表示（全件を選択状態に戻す）
         self.playlist_videos = self.all_videos
-        self._update_table(self.all_videos)
+        self.playlist_model.set_all_checked(True)
+        self.playlist_proxy.clear_filter()
         self.playlist_progress_label.setText(f"全件表示: {len(self.all_videos)}件")
 
     def clear_playlist(self):
         """再生リストをクリア（URLと一覧を消去）"""
         self.playlist_url_input.clear()
-        self.playlist_table.setRowCount(0)
+        self._update_table([])
         self.all_videos = []
+        self._titles_lc = []
+        self._set_filter_columns([])
         self.playlist_videos = []
         self.playlist_progress_label.setText("再生リストを読み込んでください")
         self.playlist_progress.setValue(0)
@@ -459,44 +519,37 @@ class PlaylistTab(QWidget):
 
     def on_playlist_error(self, error_msg):
         """再生リスト取得エラー"""
+        self._release_worker()
         self.fetch_playlist_btn.setEnabled(True)
         self.cancel_fetch_btn.setEnabled(False)
         self.playlist_progress_label.setText("エラー発生")
         QMessageBox.critical(self, "エラー", f"再生リスト取得エラー:\n{error_msg}")
 
     def select_all_playlist(self):
-        """全選択"""
-        for i in range(self.playlist_table.rowCount()):
-            item = self.playlist_table.item(i, 0)
-            if item:
-                item.setCheckState(Qt.CheckState.Checked)
-        self.update_selected_count()
+        """全選択（フィルター中は表示中の動画のみ）"""
+        mask = self.playlist_proxy.accepted_mask()
+        if mask is None:
+            self.playlist_model.set_all_checked(True)
+        else:
+            self.playlist_model.set_checked_mask(mask)
 
     def deselect_all_playlist(self):
         """全解除"""
-        for i in range(self.playlist_table.rowCount()):
-            item = self.playlist_table.item(i, 0)
-            if item:
-                item.setCheckState(Qt.CheckState.Unchecked)
-        self.update_selected_count()
+        self.playlist_model.set_all_checked(False)
+
+    def _on_playlist_data_changed(self, top_left, bottom_right, roles):
+        """モデル変更通知（チェック状態の変更時のみ選択数を更新）"""
+        if not roles or Qt.ItemDataRole.CheckStateRole in roles:
+            self.update_selected_count()
 
     def update_selected_count(self):
         """選択数更新"""
-        count = 0
-        for i in range(self.playlist_table.rowCount()):
-            item = self.playlist_table.item(i, 0)
-            if item and item.checkState() == Qt.CheckState.Checked:
-                count += 1
+        count = self.playlist_model.checked_count()
         self.selected_count_label.setText(f"選択: {count}件")
 
     def download_selected_playlist(self):
         """選択した動画をダウンロード"""
-        urls = []
-        for i in range(self.playlist_table.rowCount()):
-            item = self.playlist_table.item(i, 0)
-            if item and item.checkState() == Qt.CheckState.Checked:
-                if i < len(self.playlist_videos):
-                    urls.append(self.playlist_videos[i].url)
+        urls = [video.url for video in self.playlist_model.checked_videos()]
 
         if not urls:
             QMessageBox.warning(self, "エラー", "動画を選択してください")
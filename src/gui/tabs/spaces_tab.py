@@ -4,21 +4,42 @@ Xスペースのダウンロード機能を提供
 """
 
 import os
+import re
+import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
     QLabel, QTextEdit, QComboBox, QCheckBox,
-    QProgressBar, QPushButton, QLineEdit, QFileDialog, QMessageBox
+    QProgressBar, QPushButton, QLineEdit, QFileDialog, QMessageBox, QSpinBox
 )
-from PyQt6.QtCore import QSettings, pyqtSignal
+from PyQt6.QtCore import QSettings, QTimer, pyqtSignal
 
-from src.gui.utils import style_combobox, format_duration, format_eta, THREAD_WAIT_TIMEOUT_MS
+from src.gui.utils import (
+    style_combobox, format_duration, release_worker, LogBuffer,
+    DEFAULT_DOWNLOAD_DIR, PROGRESS_UI_INTERVAL_MS, THREAD_WAIT_TIMEOUT_MS
+)
 from src.gui.workers import SpacesDownloadWorker
+from src.constants import DEFAULT_SPACES_CONCURRENCY, MAX_DOWNLOAD_CONCURRENCY, PART_FILE_DELETE_WORKERS
 
 logger = logging.getLogger(__name__)
 
+# X/TwitterのURL判定（スペースURL、ツイートURL両方対応）
+_X_URL_RE = re.compile(r'(?:^|[/.])(?:twitter|x)\.com(?:/|$)', re.IGNORECASE)
+
+
+def _try_remove(path: str) -> int:
+    """ファイルを削除（成功したら1、失敗したら0）"""
+    try:
+        os.unlink(path)
+        return 1
+    except OSError as e:
+        # ファイル削除失敗をログに記録（使用中など）
+        logger.warning(f".part file delete failed: {os.path.basename(path)} - {e}")
+        return 0
+
 
 class SpacesTab(QWidget):
     """Xスペースタブ"""
@@ -26,9 +47,22 @@ class SpacesTab(QWidget):
     # 文字起こし開始シグナル（ファイルパスを親に送信）
     transcribe_requested = pyqtSignal(str)
 
-    def __init__(self, parent=None):
+    # 音声フォーマット（spaces_format_combo のインデックス順）
+    # スペースの音声はAACのため、m4aなら再エンコードせずにコンテナの変換だけで済む
+    _SPACES_FORMATS = ('m4a', 'mp3', 'wav', 'original')
+
+    def __init__(self, settings: QSettings, parent=None):
         super().__init__(parent)
         self.spaces_worker = None
+        self._spaces_connections = []  # ワーカーとのシグナル接続（解放時にこれだけを切断）
+        self._settings = settings  # MainWindowと共有する設定
+
+        # ダウンロード中の進捗は最新の1件だけを保持し、タイマーでまとめて反映
+        self._pending_spaces_progress = None
+        self._spaces_ui_timer = QTimer(self)
+        self._spaces_ui_timer.setInterval(PROGRESS_UI_INTERVAL_MS)
+        self._spaces_ui_timer.timeout.connect(self._flush_spaces_progress)
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -73,21 +107,32 @@ class SpacesTab(QWidget):
         self.spaces_format_combo = QComboBox()
         style_combobox(self.spaces_format_combo)
         self.spaces_format_combo.addItems([
-            "MP3 (推奨)",
-            "M4A (AACコーデック)",
+            "M4A (AACコーデック・推奨/高速)",
+            "MP3 (再エンコード)",
             "WAV (無圧縮)",
             "オリジナル形式"
         ])
         format_layout.addWidget(format_label)
         format_layout.addWidget(self.spaces_format_combo)
+
+        # 同時ダウンロード数
+        concurrency_label = QLabel("同時ダウンロード数:")
+        self.spaces_concurrency_spin = QSpinBox()
+        self.spaces_concurrency_spin.setRange(1, MAX_DOWNLOAD_CONCURRENCY)
+        self.spaces_concurrency_spin.setValue(
+            self._settings.value("spaces_concurrency", DEFAULT_SPACES_CONCURRENCY, type=int)
+        )
+        self.spaces_concurrency_spin.setToolTip("複数URLを同時にダウンロードする数（増やしすぎると制限される可能性があります）")
+        self.spaces_concurrency_spin.valueChanged.connect(self.on_spaces_concurrency_changed)
+        format_layout.addWidget(concurrency_label)
+        format_layout.addWidget(self.spaces_concurrency_spin)
         options_layout.addLayout(format_layout)
 
         # 保存先
         save_layout = QVBoxLayout()
         save_label = QLabel("保存先:")
         self.spaces_save_dir_edit = QLineEdit()
-        default_save_dir = os.path.expanduser("~/Downloads")
-        self.spaces_save_dir_edit.setText(default_save_dir)
+        self.spaces_save_dir_edit.setText(DEFAULT_DOWNLOAD_DIR)
         self.spaces_save_dir_edit.setToolTip("実際の保存先はタイムスタンプ付きフォルダが作成されます")
         spaces_save_dir_btn = QPushButton("参照...")
         spaces_save_dir_btn.clicked.connect(self.browse_spaces_save_dir)
@@ -125,6 +170,9 @@ class SpacesTab(QWidget):
         self.spaces_progress = QProgressBar()
         self.spaces_progress.setMinimum(0)
         self.spaces_progress.setMaximum(100)
+        # 進捗率はステータスラベルに表示するため、バー上の文字は描画しない
+        self.spaces_progress.setTextVisible(False)
+        self._spaces_progress_busy = False  # 不確定表示（setRange(0, 0)）中かどうか
         progress_layout.addWidget(self.spaces_progress)
 
         progress_group.setLayout(progress_layout)
@@ -164,6 +212,7 @@ class SpacesTab(QWidget):
         # ログ表示
         self.spaces_log = QTextEdit()
         self.spaces_log.setReadOnly(True)
+        self._spaces_log_buffer = LogBuffer(self.spaces_log)
         self.spaces_log.setMaximumHeight(120)
         layout.addWidget(self.spaces_log)
 
@@ -175,31 +224,30 @@ class SpacesTab(QWidget):
         if dir_path:
             self.spaces_save_dir_edit.setText(dir_path)
 
+    def _spaces_base_dir(self) -> str:
+        """入力された保存先（未入力の場合は既定のダウンロードフォルダ）"""
+        return self.spaces_save_dir_edit.text().strip() or DEFAULT_DOWNLOAD_DIR
+
+    def _iter_input_lines(self):
+        """URL入力欄の空でない行を順に返す（全文をまとめてコピーせず、ブロック単位で読む）"""
+        block = self.spaces_url_input.document().begin()
+        while block.isValid():
+            line = block.text().strip()
+            if line:
+                yield line
+            block = block.next()
+
     def start_spaces_download(self):
         """Xスペースダウンロード開始（複数URL対応）"""
-        text = self.spaces_url_input.toPlainText().strip()
-        if not text:
-            QMessageBox.warning(self, "エラー", "スペースのURLを入力してください")
-            return
-
-        # 複数URLを解析
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        # 複数URLを解析し、URL検証（スペースURL、ツイートURL両方対応）は1行につき1回の照合で振り分け
         urls = []
-
-        # URL検証（スペースURL、ツイートURL両方対応）
-        valid_patterns = [
-            'twitter.com/i/spaces/',
-            'x.com/i/spaces/',
-            'twitter.com/',
-            'x.com/',
-        ]
-
         invalid_urls = []
-        for line in lines:
-            if any(pattern in line for pattern in valid_patterns):
-                urls.append(line)
-            else:
-                invalid_urls.append(line)
+        for line in self._iter_input_lines():
+            (urls if _X_URL_RE.search(line) else invalid_urls).append(line)
+
+        if not urls and not invalid_urls:
+            QMessageBox.warning(self, "エラー", "スペースのURLを入力してください")
+            return
 
         if not urls:
             QMessageBox.warning(self, "エラー",
@@ -209,22 +257,23 @@ class SpacesTab(QWidget):
             return
 
         if invalid_urls:
+            tail = f"\n他{len(invalid_urls) - 5}件" if len(invalid_urls) > 5 else ""
             QMessageBox.warning(self, "警告",
-                f"以下の無効なURLはスキップされます:\n{chr(10).join(invalid_urls[:5])}"
-                + (f"\n他{len(invalid_urls)-5}件" if len(invalid_urls) > 5 else ""))
+                "以下の無効なURLはスキップされます:\n" + "\n".join(invalid_urls[:5]) + tail)
 
         # 保存先設定（タイムスタンプ付きフォルダを作成）
-        base_dir = self.spaces_save_dir_edit.text().strip() or os.path.expanduser("~/Downloads")
+        base_dir = self._spaces_base_dir()
         timestamp = datetime.now().strftime("%Y%m%d_%H_%M_%S")
         output_dir = os.path.join(base_dir, f"XSpaces_{timestamp}")
 
         # フォーマット設定
-        format_map = {0: 'mp3', 1: 'm4a', 2: 'wav', 3: 'original'}
-        audio_format = format_map.get(self.spaces_format_combo.currentIndex(), 'mp3')
+        format_idx = self.spaces_format_combo.currentIndex()
+        audio_format = self._SPACES_FORMATS[format_idx] if 0 <= format_idx < len(self._SPACES_FORMATS) else 'm4a'
 
         options = {
             'audio_format': audio_format,
             'anti_ban': self.spaces_anti_ban_check.isChecked(),
+            'concurrency': self.spaces_concurrency_spin.value(),
         }
 
         # UI更新
@@ -234,18 +283,24 @@ class SpacesTab(QWidget):
         self.spaces_progress.setValue(0)
         self.spaces_overall_label.setText(f"0/{len(urls)} 件")
         self.spaces_status_label.setText("ダウンロード準備中...")
-        self.spaces_log.clear()
-        self.spaces_log.append(f"ダウンロード対象: {len(urls)} 件のURL")
-        for i, url in enumerate(urls, 1):
-            self.spaces_log.append(f"  [{i}] {url}")
+        self._spaces_log_buffer.clear()
+        self._spaces_log_buffer.append(f"ダウンロード対象: {len(urls)} 件のURL")
+        self._spaces_log_buffer.extend(f"  [{i}] {url}" for i, url in enumerate(urls, 1))
 
         # ワーカー開始（URLリストを渡す）
         self.spaces_worker = SpacesDownloadWorker(urls, output_dir, options)
-        self.spaces_worker.progress.connect(self.on_spaces_progress)
-        self.spaces_worker.item_progress.connect(self.on_spaces_item_progress)
-        self.spaces_worker.finished.connect(self.on_spaces_finished)
-        self.spaces_worker.error.connect(self.on_spaces_error)
+        self._spaces_connections = [
+            self.spaces_worker.progress.connect(self.on_spaces_progress),
+            self.spaces_worker.item_progress.connect(self.on_spaces_item_progress),
+            self.spaces_worker.finished.connect(self.on_spaces_finished),
+            self.spaces_worker.error.connect(self.on_spaces_error),
+        ]
         self.spaces_worker.start()
+        self._spaces_ui_timer.start()
+
+    def on_spaces_concurrency_changed(self, value):
+        """同時ダウンロード数の変更を設定に保存"""
+        self._settings.setValue("spaces_concurrency", value)
 
     def cancel_spaces_download(self):
         """Xスペースダウンロードキャンセル"""
@@ -266,66 +321,62 @@ class SpacesTab(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             logger.info("Force stop initiated by user")
             self.spaces_status_label.setText("強制停止中...")
-            self.spaces_log.append("\n強制停止を実行中...")
+            self._spaces_log_buffer.append("\n強制停止を実行中...")
 
             # ワーカーを強制停止
+            temp_dir = None
             if self.spaces_worker:
+                temp_dir = self.spaces_worker.temp_dir
                 self.spaces_worker.force_stop()
                 if not self.spaces_worker.wait(THREAD_WAIT_TIMEOUT_MS):
                     logger.warning("Worker thread did not terminate in time")
-                    self.spaces_log.append("警告: スレッドの終了に時間がかかっています")
+                    self._spaces_log_buffer.append("警告: スレッドの終了に時間がかかっています")
 
             # ワーカー参照をクリア
             self._cleanup_spaces_worker()
 
-            # 一時ファイルを削除
-            output_dir = self.spaces_save_dir_edit.text() or os.path.expanduser("~/Downloads")
+            # 一時ファイルを削除（作業用フォルダごと削除し、保存先には完成したファイルだけが残る）
+            output_dir = self._spaces_base_dir()
             deleted = self._delete_part_files(output_dir)
+            if temp_dir:
+                deleted += self._delete_temp_dir(temp_dir)
 
             # UI更新
             self.spaces_download_btn.setEnabled(True)
             self.spaces_cancel_btn.setEnabled(False)
             self.spaces_force_stop_btn.setEnabled(False)
-            self.spaces_progress.setRange(0, 100)
+            self._set_spaces_progress_busy(False)
             self.spaces_progress.setValue(0)
             self.spaces_status_label.setText("強制停止完了")
 
             if deleted > 0:
-                self.spaces_log.append(f"一時ファイル {deleted}件 を削除しました")
-            self.spaces_log.append("強制停止完了")
+                self._spaces_log_buffer.append(f"一時ファイル {deleted}件 を削除しました")
+            self._spaces_log_buffer.append("強制停止完了")
             logger.info("Force stop completed")
 
     def _cleanup_spaces_worker(self):
         """ワーカー参照をクリーンアップ"""
+        self._spaces_ui_timer.stop()
+        self._pending_spaces_progress = None
         if self.spaces_worker:
-            try:
-                self.spaces_worker.progress.disconnect()
-                self.spaces_worker.item_progress.disconnect()
-                self.spaces_worker.finished.disconnect()
-                self.spaces_worker.error.disconnect()
-            except (TypeError, RuntimeError):
-                pass
+            release_worker(self.spaces_worker, self._spaces_connections)
+            self._spaces_connections = []
             self.spaces_worker = None
             logger.debug("Spaces worker cleaned up")
 
     def _save_spaces_settings(self):
         """Xスペースの設定を保存"""
-        settings = QSettings("YTDownloader", "Settings")
         spaces_dir = self.spaces_save_dir_edit.text()
         if spaces_dir:
-            settings.setValue("spaces_output_dir", spaces_dir)
+            self._settings.setValue("spaces_output_dir", spaces_dir)
             logger.debug(f"Spaces output dir saved: {spaces_dir}")
 
     def cleanup_part_files(self):
         """一時ファイル(.part)を削除"""
-        output_dir = self.spaces_save_dir_edit.text() or os.path.expanduser("~/Downloads/YouTube")
+        output_dir = self._spaces_base_dir()
 
-        # .partファイルを検索
-        part_files = []
-        if os.path.exists(output_dir):
-            for f in os.listdir(output_dir):
-                if f.endswith('.part'):
-                    part_files.append(f)
+        # .partファイルを検索（一覧は削除時にも再利用）
+        part_files = self._scan_part_files(output_dir)
 
         if not part_files:
             QMessageBox.information(self, "確認", "削除対象の一時ファイルはありません")
@@ -344,97 +395,116 @@ class SpacesTab(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            deleted = self._delete_part_files(output_dir)
+            deleted = self._delete_part_files(output_dir, part_files)
             QMessageBox.information(self, "完了", f"{deleted}件の一時ファイルを削除しました")
-            self.spaces_log.append(f"一時ファイル {deleted}件 を削除しました")
-
-    def _delete_part_files(self, directory: str) -> int:
-        """指定ディレクトリの.partファイルを削除"""
-        deleted = 0
-        if os.path.exists(directory):
-            for f in os.listdir(directory):
-                if f.endswith('.part'):
-                    try:
-                        os.remove(os.path.join(directory, f))
-                        deleted += 1
-                    except OSError as e:
-                        # ファイル削除失敗をログに記録（使用中など）
-                        print(f"[警告] .partファイル削除失敗: {f} - {e}")
-        return deleted
+            self._spaces_log_buffer.append(f"一時ファイル {deleted}件 を削除しました")
+
+    def _scan_part_files(self, directory: str) -> list:
+        """指定ディレクトリの.partファイル名を列挙（scandirで1回だけ走査）"""
+        part_files = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name.endswith('.part') and entry.is_file(follow_symlinks=False):
+                        part_files.append(entry.name)
+        except OSError:
+            # ディレクトリが存在しない・アクセスできない場合は対象なし
+            pass
+        return part_files
+
+    def _delete_part_files(self, directory: str, part_files: list = None) -> int:
+        """指定ディレクトリの.partファイルを削除（一覧が渡された場合は再走査しない）"""
+        if part_files is None:
+            part_files = self._scan_part_files(directory)
+
+        paths = [os.path.join(directory, f) for f in part_files]
+        if len(paths) <= 1:
+            return sum(map(_try_remove, paths))
+
+        # 削除の待ち時間（ネットワークドライブ等）が重ならないよう並列に実行
+        with ThreadPoolExecutor(max_workers=min(PART_FILE_DELETE_WORKERS, len(paths))) as executor:
+            return sum(executor.map(_try_remove, paths))
+
+    def _delete_temp_dir(self, temp_dir: str) -> int:
+        """作業用フォルダを削除（削除したファイル数を返す）"""
+        count = sum(len(files) for _, _, files in os.walk(temp_dir))
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        return count
+
+    def _set_spaces_progress_busy(self, busy: bool):
+        """プログレスバーの不確定表示を切り替え（表示モードが変わる場合のみ設定）"""
+        if busy == self._spaces_progress_busy:
+            return
+        self._spaces_progress_busy = busy
+        if busy:
+            self.spaces_progress.setRange(0, 0)
+        else:
+            self.spaces_progress.setRange(0, 100)
 
     def on_spaces_progress(self, info):
         """Xスペースダウンロード進捗"""
         status = info.get('status', '')
         message = info.get('message', '')
 
+        # ダウンロード中の高頻度な進捗はタイマーで間引いて反映
+        if status == 'downloading':
+            self._pending_spaces_progress = info
+            return
+
+        # 状態が変わった場合は保留中の進捗を破棄して即時反映
+        self._pending_spaces_progress = None
+
         if status == 'extracting':
-            self.spaces_progress.setRange(0, 0)
+            self._set_spaces_progress_busy(True)
             self.spaces_status_label.setText(message or "スペース情報を取得中...")
-            self.spaces_log.append("スペース情報を取得中...")
+            self._spaces_log_buffer.append("スペース情報を取得中...")
 
         elif status == 'info_ready':
             self.spaces_status_label.setText(message)
-            self.spaces_log.append(message)
             title = info.get('title', '')
             duration = info.get('duration', 0)
             estimated_size = info.get('estimated_size_mb', 0)
             duration_unknown = info.get('duration_unknown', False)
 
+            lines = [message]
             if title:
-                self.spaces_log.append(f"タイトル: {title}")
+                lines.append(f"タイトル: {title}")
             if duration:
-                self.spaces_log.append(f"再生時間: {format_duration(duration)}")
+                lines.append(f"再生時間: {format_duration(duration)}")
             elif duration_unknown:
-                self.spaces_log.append("再生時間: 取得できませんでした（推定時間は表示されません）")
+                lines.append("再生時間: 取得できませんでした（推定時間は表示されません）")
 
             if estimated_size > 0:
-                self.spaces_log.append(f"推定サイズ: 約{estimated_size:.1f} MB")
+                lines.append(f"推定サイズ: 約{estimated_size:.1f} MB")
+            self._spaces_log_buffer.extend(lines)
 
         elif status == 'starting':
             self.spaces_status_label.setText(message or "ダウンロード開始...")
-            self.spaces_log.append("ダウンロード開始...")
-
-        elif status == 'downloading':
-            percent = info.get('percent', 0)
-            total = info.get('total', 0)
-            downloaded = info.get('downloaded', 0)
-            speed = info.get('speed', 0)
-            eta = info.get('eta', 0)
-
-            if total == 0 or percent == 0:
-                self.spaces_progress.setRange(0, 0)
-                downloaded_mb = downloaded / 1024 / 1024 if downloaded > 0 else 0
-                eta_str = format_eta(eta)
-                if downloaded_mb > 0 and eta_str:
-                    self.spaces_status_label.setText(f"ダウンロード中... {downloaded_mb:.1f} MB ({eta_str})")
-                elif downloaded_mb > 0:
-                    self.spaces_status_label.setText(f"ダウンロード中... {downloaded_mb:.1f} MB")
-                elif eta_str:
-                    self.spaces_status_label.setText(f"ダウンロード中... ({eta_str})")
-                else:
-                    self.spaces_status_label.setText("ダウンロード中...")
-            else:
-                self.spaces_progress.setRange(0, 100)
-                self.spaces_progress.setValue(int(percent))
-                speed_str = f"{speed / 1024 / 1024:.1f} MB/s" if speed else ""
-                eta_str = format_eta(eta)
-
-                parts = [f"{percent:.1f}%"]
-                if speed_str:
-                    parts.append(speed_str)
-                if eta_str:
-                    parts.append(eta_str)
-                self.spaces_status_label.setText(f"ダウンロード中... {' / '.join(parts)}")
+            self._spaces_log_buffer.append("ダウンロード開始...")
 
         elif status == 'finished':
-            self.spaces_progress.setRange(0, 100)
+            self._set_spaces_progress_busy(False)
             self.spaces_status_label.setText(message or '音声変換中...')
 
+    def _flush_spaces_progress(self):
+        """保留中のダウンロード進捗をUIに反映（タイマーから呼び出し）"""
+        info = self._pending_spaces_progress
+        if info is None:
+            return
+        self._pending_spaces_progress = None
+
+        # 表示用の値はワーカー側で整形済み
+        if info.get('indeterminate', True):
+            self._set_spaces_progress_busy(True)
+        else:
+            self._set_spaces_progress_busy(False)
+            self.spaces_progress.setValue(info.get('percent_int', 0))
+        self.spaces_status_label.setText(info.get('status_text', "ダウンロード中..."))
+
     def on_spaces_item_progress(self, current: int, total: int, url: str):
         """Xスペースアイテム進捗（複数URL処理時）"""
         self.spaces_overall_label.setText(f"{current}/{total} 件")
-        self.spaces_log.append(f"\n--- [{current}/{total}] 処理開始 ---")
-        self.spaces_log.append(f"URL: {url}")
+        self._spaces_log_buffer.extend((f"\n--- [{current}/{total}] 処理開始 ---", f"URL: {url}"))
 
     def on_spaces_finished(self, results: list):
         """Xスペースダウンロード完了（複数URL対応）"""
@@ -446,7 +516,7 @@ class SpacesTab(QWidget):
         self.spaces_download_btn.setEnabled(True)
         self.spaces_cancel_btn.setEnabled(False)
         self.spaces_force_stop_btn.setEnabled(False)
-        self.spaces_progress.setRange(0, 100)
+        self._set_spaces_progress_busy(False)
         self.spaces_progress.setValue(100)
 
         # 結果集計
@@ -456,25 +526,32 @@ class SpacesTab(QWidget):
         self.spaces_overall_label.setText(f"{len(results)}/{len(results)} 件 完了")
         self.spaces_status_label.setText(f"完了! 成功: {len(success_files)}件, 失敗: {len(error_results)}件")
 
-        # ログに結果を表示
-        self.spaces_log.append(f"\n{'='*40}")
-        self.spaces_log.append(f"処理完了: {len(results)}件")
-        self.spaces_log.append(f"  成功: {len(success_files)}件")
-        self.spaces_log.append(f"  失敗: {len(error_results)}件")
+        # ログに結果を表示（行リストにまとめてから1回で追加）
+        lines = [
+            f"\n{'='*40}",
+            f"処理完了: {len(results)}件",
+            f"  成功: {len(success_files)}件",
+            f"  失敗: {len(error_results)}件",
+        ]
 
         if success_files:
-            self.spaces_log.append("\n【成功したファイル】")
-            for f in success_files:
-                self.spaces_log.append(f"  {f}")
+            lines.append("\n【成功したファイル】")
+            lines.extend(f"  {f}" for f in success_files)
 
         if error_results:
-            self.spaces_log.append("\n【エラー】")
-            for e in error_results:
-                self.spaces_log.append(f"  {e}")
+            lines.append("\n【エラー】")
+            lines.extend(f"  {e}" for e in error_results)
+
+        start_transcribe = self.spaces_transcribe_check.isChecked() and bool(success_files)
+        if start_transcribe:
+            lines.append("\n文字起こしを開始します...")
+
+        # ダイアログ表示前に反映しておく
+        self._spaces_log_buffer.extend(lines)
+        self._spaces_log_buffer.flush()
 
         # 文字起こしも実行（最初の成功ファイルのみ）
-        if self.spaces_transcribe_check.isChecked() and success_files:
-            self.spaces_log.append("\n文字起こしを開始します...")
+        if start_transcribe:
             self.transcribe_requested.emit(success_files[0])
         else:
             # 結果のサマリーを表示
@@ -494,10 +571,10 @@ class SpacesTab(QWidget):
         self.spaces_download_btn.setEnabled(True)
         self.spaces_cancel_btn.setEnabled(False)
         self.spaces_force_stop_btn.setEnabled(False)
-        self.spaces_progress.setRange(0, 100)
+        self._set_spaces_progress_busy(False)
         self.spaces_progress.setValue(0)
         self.spaces_status_label.setText("エラー発生")
-        self.spaces_log.append(f"\nエラー: {error_msg}")
+        self._spaces_log_buffer.append(f"\nエラー: {error_msg}")
 
         # よくあるエラーの対処法を表示
         help_text = ""
@@ -514,6 +591,5 @@ class SpacesTab(QWidget):
 
     def load_settings(self, output_dir: str):
         """設定を読み込み"""
-        settings = QSettings("YTDownloader", "Settings")
-        spaces_output_dir = settings.value("spaces_output_dir", output_dir)
+        spaces_output_dir = self._settings.value("spaces_output_dir", output_dir)
         self.spaces_save_dir_edit.setText(spaces_output_dir)
@@ -8,52 +8,79 @@ import os
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
     QLabel, QLineEdit, QPushButton, QProgressBar, QCheckBox,
-    QComboBox, QTextEdit, QFileDialog, QMessageBox, QRadioButton, QButtonGroup
+    QComboBox, QTextEdit, QPlainTextEdit, QFileDialog, QMessageBox, QRadioButton, QButtonGroup,
+    QApplication
 )
-from PyQt6.QtGui import QClipboard
-from PyQt6.QtCore import QCoreApplication, QSettings
+from PyQt6.QtCore import Qt, QSettings, QThreadPool, QTimer
 
-from src.gui.utils import style_combobox
-from src.gui.workers import TranscribeWorker
+from src.gui.utils import (
+    style_combobox, release_worker, get_transcript_cache_dir,
+    DEFAULT_DOWNLOAD_DIR, TRANSCRIBE_PROGRESS_COALESCE_MS
+)
+from src.gui.workers import TranscribeWorker, GpuDetectTask, ModelPreloadTask
 from src.transcriber import Transcriber, save_transcript, TranscriptResult
+from src.downloader import sanitize_filename
 from src.gpu_info import (
-    detect_gpu, get_device_display_text, get_recommendation_text,
-    get_model_options_with_recommendation
+    GPUInfo, get_device_display_text, get_recommendation_text,
+    get_model_options_with_recommendation, invalidate_gpu_cache
 )
 
 
+def _item_at(values: tuple, index: int, default: str) -> str:
+    """コンボボックスのインデックスに対応する値を取得（範囲外は既定値）"""
+    return values[index] if 0 <= index < len(values) else default
+
+
 class TranscribeTab(QWidget):
     """文字起こしタブ"""
 
-    def __init__(self, transcriber: Transcriber, parent=None):
+    # コンボボックス・設定値のインデックス順
+    _LANGUAGES = ('ja', 'en', 'auto')
+    _MODELS = ('tiny', 'base', 'small', 'medium', 'large')
+    # 0: 標準Whisper, 1: Faster Whisper, 2: kotoba-whisper
+    _ENGINES = ('openai-whisper', 'faster-whisper', 'kotoba-whisper')
+    # 進捗バーを不確定モードで表示するステータス
+    _INDETERMINATE_STATUSES = frozenset(('transcribing', 'loading', 'downloading', 'fetching'))
+
+    def __init__(self, transcriber: Transcriber, settings: QSettings, parent=None):
         super().__init__(parent)
         self.transcriber = transcriber
+        self._settings = settings  # MainWindowと共有する設定
         self.current_worker = None
         self.current_transcript = None
+        self._transcript_txt = None  # current_transcript のタイムスタンプ付きテキスト（コピー用に保持）
+        self._streamed_segments = 0  # 文字起こし中に結果欄へ追加したセグメント数
+
+        # 進捗は最新の1件だけを保持し、一定間隔ごとにまとめて描画する
+        self._pending_transcribe_progress = None
+        self._transcribe_ui_timer = QTimer(self)
+        self._transcribe_ui_timer.setSingleShot(True)
+        self._transcribe_ui_timer.setInterval(TRANSCRIBE_PROGRESS_COALESCE_MS)
+        self._transcribe_ui_timer.timeout.connect(self._flush_transcribe_progress)
+
         self.setup_ui()
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
 
-        # GPU情報検出
-        self.gpu_info = detect_gpu()
+        # GPU情報（検出はバックグラウンドで行い、完了までは未検出として扱う）
+        self.gpu_info = GPUInfo(available=False, name="", vram_mb=0)
 
         # デバイス情報表示
         device_group = QGroupBox("デバイス情報")
         device_layout = QVBoxLayout()
 
-        # GPU/CPU状態
-        device_text = get_device_display_text(self.gpu_info)
-        recommendation_text = get_recommendation_text(self.gpu_info)
-
-        self.device_label = QLabel(device_text)
-        if self.gpu_info.available:
-            self.device_label.setStyleSheet("color: #0078d4; font-weight: bold;")
-        else:
-            self.device_label.setStyleSheet("color: #d83b01; font-weight: bold;")
-        device_layout.addWidget(self.device_label)
-
-        self.recommendation_label = QLabel(recommendation_text)
+        # GPU/CPU状態（ドライバ更新後などに再検出できるようボタンを併置）
+        device_status_layout = QHBoxLayout()
+        self.device_label = QLabel()
+        device_status_layout.addWidget(self.device_label)
+        device_status_layout.addStretch()
+        self.gpu_redetect_btn = QPushButton("再検出")
+        self.gpu_redetect_btn.clicked.connect(self.redetect_gpu)
+        device_status_layout.addWidget(self.gpu_redetect_btn)
+        device_layout.addLayout(device_status_layout)
+
+        self.recommendation_label = QLabel("")
         device_layout.addWidget(self.recommendation_label)
 
         device_group.setLayout(device_layout)
@@ -186,12 +213,29 @@ class TranscribeTab(QWidget):
         self.transcribe_btn.clicked.connect(self.start_transcribe)
         layout.addWidget(self.transcribe_btn)
 
-        # 結果表示
+        # 結果表示は最初の文字起こしが完了した時に作成する（_ensure_result_group）
+        self.transcribe_result = None
+        layout.addStretch(1)
+
+        # 設定に基づいてUIを更新
+        self.update_model_ui_state()
+
+        # GPU検出を開始（完了時に on_gpu_detected で表示を更新）
+        self._start_gpu_detection()
+
+    def _ensure_result_group(self):
+        """文字起こし結果の表示・保存欄を作成（初回の完了時に1度だけ）"""
+        if self.transcribe_result is not None:
+            return
+
         result_group = QGroupBox("文字起こし結果")
         result_layout = QVBoxLayout()
 
-        self.transcribe_result = QTextEdit()
+        # 長い結果でも軽く表示できるようプレーンテキスト専用のウィジェットを使用
+        self.transcribe_result = QPlainTextEdit()
         self.transcribe_result.setReadOnly(True)
+        # 逐次追加する間に取り消し履歴が伸び続けないようにする
+        self.transcribe_result.setUndoRedoEnabled(False)
         result_layout.addWidget(self.transcribe_result)
 
         # 保存ボタン
@@ -209,15 +253,46 @@ class TranscribeTab(QWidget):
         result_layout.addLayout(save_layout)
 
         result_group.setLayout(result_layout)
+        # 未作成の間に入れていた余白を結果表示に置き換える
+        layout = self.layout()
+        layout.takeAt(layout.count() - 1)
         layout.addWidget(result_group)
 
-        # 設定に基づいてUIを更新
-        self.update_model_ui_state()
+    def _start_gpu_detection(self):
+        """GPU検出をスレッドプールで開始"""
+        self.device_label.setText("GPU: 検出中...")
+        self.device_label.setStyleSheet("color: gray; font-weight: bold;")
+        self.gpu_redetect_btn.setEnabled(False)
+        task = GpuDetectTask()
+        self._gpu_detect_signals = task.signals  # 完了まで参照を保持
+        self._gpu_detect_signals.finished.connect(self.on_gpu_detected)
+        QThreadPool.globalInstance().start(task)
+
+    def on_gpu_detected(self, gpu_info: GPUInfo):
+        """GPU検出完了"""
+        self.gpu_info = gpu_info
+        self._gpu_detect_signals = None
+        self.gpu_redetect_btn.setEnabled(True)
+
+        self.device_label.setText(get_device_display_text(gpu_info))
+        if gpu_info.available:
+            self.device_label.setStyleSheet("color: #0078d4; font-weight: bold;")
+        else:
+            self.device_label.setStyleSheet("color: #d83b01; font-weight: bold;")
+        self.recommendation_label.setText(get_recommendation_text(gpu_info))
+
+        # 推奨マークを更新（選択中のモデルは維持）
+        for i, text in enumerate(get_model_options_with_recommendation(gpu_info)):
+            self.transcribe_model_combo.setItemText(i, text)
+
+    def redetect_gpu(self):
+        """キャッシュしたGPU検出結果を破棄して再検出"""
+        invalidate_gpu_cache()
+        self._start_gpu_detection()
 
     def update_model_ui_state(self):
         """設定に基づいてWhisperモデル選択のUI状態を更新"""
-        settings = QSettings("YTDownloader", "Settings")
-        engine_idx = settings.value("whisper_engine", 0, type=int)
+        engine_idx = self._settings.value("whisper_engine", 0, type=int)
         is_kotoba = (engine_idx == 2)
 
         self.transcribe_model_combo.setEnabled(not is_kotoba)
@@ -283,12 +358,12 @@ class TranscribeTab(QWidget):
                 QMessageBox.warning(self, "エラー", "ファイルを選択してください")
                 return
             # 複数ファイル対応
-            paths = [p.strip() for p in text.split('\n') if p.strip()]
+            paths = list(filter(None, map(str.strip, text.splitlines())))
             invalid_paths = [p for p in paths if not os.path.exists(p)]
             if invalid_paths:
                 QMessageBox.warning(self, "エラー", f"以下のファイルが見つかりません:\n{chr(10).join(invalid_paths[:5])}")
                 return
-            url_or_path = paths[0] if len(paths) == 1 else paths
+            items = paths
         else:
             # URL（YouTube or Xスペース）
             text = self.transcribe_url_input.toPlainText().strip()
@@ -296,18 +371,11 @@ class TranscribeTab(QWidget):
                 QMessageBox.warning(self, "エラー", "URLを入力してください")
                 return
             # 複数URL対応
-            urls = [u.strip() for u in text.split('\n') if u.strip()]
-            url_or_path = urls[0] if len(urls) == 1 else urls
+            items = list(filter(None, map(str.strip, text.splitlines())))
 
         # 設定から精度向上オプションを読み込み
-        settings = QSettings("YTDownloader", "Settings")
-        engine_idx = settings.value("whisper_engine", 0, type=int)
-        # 0: 標準Whisper, 1: Faster Whisper, 2: kotoba-whisper
-        engine_map = {0: 'openai-whisper', 1: 'faster-whisper', 2: 'kotoba-whisper'}
-        whisper_engine = engine_map.get(engine_idx, 'openai-whisper')
-
-        # kotoba-whisperかどうか判定
-        use_kotoba = (engine_idx == 2)
+        settings = self._settings
+        self._apply_engine_settings()
 
         saved_vocabulary = settings.value("custom_vocabulary", "", type=str)
 
@@ -318,55 +386,91 @@ class TranscribeTab(QWidget):
         else:
             custom_vocabulary = saved_vocabulary or input_vocabulary
 
+        # バッチサイズ（0は搭載VRAMから自動決定）
+        batch_size = settings.value("whisper_batch_size", 0, type=int)
+        if batch_size <= 0:
+            batch_size = self.gpu_info.get_recommended_batch_size()
+
         # Transcriberに設定を適用
-        self.transcriber.set_engine(whisper_engine)
-        self.transcriber.set_use_kotoba(use_kotoba)
+        self.transcriber.set_batch_size(batch_size)
+        self.transcriber.set_vad_filter(settings.value("whisper_vad_filter", True, type=bool))
         self.transcriber.set_custom_vocabulary(custom_vocabulary)
 
         # オプション取得
-        lang_map = {0: 'ja', 1: 'en', 2: 'auto'}
-        model_map = {0: 'tiny', 1: 'base', 2: 'small', 3: 'medium', 4: 'large'}
-
         options = {
             'is_file': is_file,
             'is_spaces': input_type == 1,  # Xスペースかどうか
-            'language': lang_map.get(self.transcribe_lang_combo.currentIndex(), 'ja'),
-            'model': model_map.get(self.transcribe_model_combo.currentIndex(), 'base'),
+            'language': _item_at(self._LANGUAGES, self.transcribe_lang_combo.currentIndex(), 'ja'),
+            'model': _item_at(self._MODELS, self.transcribe_model_combo.currentIndex(), 'base'),
             'prefer_youtube': self.prefer_youtube_sub_check.isChecked() and input_type == 0,
             'custom_vocabulary': custom_vocabulary,
+            'cache_dir': get_transcript_cache_dir(),
         }
 
         # UI更新
         self.transcribe_btn.setEnabled(False)
         self.transcribe_progress.setValue(0)
-        item_count = len(url_or_path) if isinstance(url_or_path, list) else 1
-        self.transcribe_progress_label.setText(f"文字起こし準備中... ({item_count}件)")
-        self.transcribe_result.clear()
+        self.transcribe_progress_label.setText(f"文字起こし準備中... ({len(items)}件)")
+        if self.transcribe_result is not None:
+            self.transcribe_result.clear()
+        self._streamed_segments = 0
 
         # ワーカー開始
-        self.current_worker = TranscribeWorker(self.transcriber, url_or_path, options)
-        self.current_worker.progress.connect(self.on_transcribe_progress)
+        self.current_worker = TranscribeWorker(self.transcriber, items, options)
+        # デコードスレッドがGUI更新を待たないようにキュー接続を明示
+        self.current_worker.progress.connect(
+            self.on_transcribe_progress, Qt.ConnectionType.QueuedConnection
+        )
+        self.current_worker.segment.connect(self._append_segment)
         self.current_worker.finished.connect(self.on_transcribe_finished)
         self.current_worker.error.connect(self.on_transcribe_error)
         self.current_worker.start()
 
+    def _apply_engine_settings(self):
+        """設定のWhisperエンジンをTranscriberに適用"""
+        engine_idx = self._settings.value("whisper_engine", 0, type=int)
+        self.transcriber.set_engine(_item_at(self._ENGINES, engine_idx, 'openai-whisper'))
+        self.transcriber.set_use_kotoba(engine_idx == 2)
+
+    def preload_model(self):
+        """設定のエンジン・モデルをバックグラウンドで読み込んでおく（起動時に呼び出し）"""
+        self._apply_engine_settings()
+
+        model_name = _item_at(self._MODELS, self._settings.value("whisper_model", 1, type=int), 'base')
+        QThreadPool.globalInstance().start(ModelPreloadTask(self.transcriber, model_name))
+
     def on_transcribe_progress(self, info):
-        """文字起こし進捗"""
+        """文字起こし進捗（描画はタイマーでまとめて行う）"""
+        self._pending_transcribe_progress = info
+        if not self._transcribe_ui_timer.isActive():
+            self._transcribe_ui_timer.start()
+
+    def _flush_transcribe_progress(self):
+        """保留中の文字起こし進捗をUIに反映（タイマーから呼び出し）"""
+        info = self._pending_transcribe_progress
+        if info is None:
+            return
+        self._pending_transcribe_progress = None
+
         status = info.get('status', '')
         message = info.get('message', '')
         percent = info.get('percent', 0)
 
         self.transcribe_progress_label.setText(message or status)
 
-        # 処理中は不確定モード、完了時は確定モード
-        if status in ['transcribing', 'loading', 'downloading', 'fetching']:
-            self.transcribe_progress.setRange(0, 0)
+        # 処理中は不確定モード、完了時は確定モード（モードが変わる時だけ切り替える）
+        progress_bar = self.transcribe_progress
+        if status in self._INDETERMINATE_STATUSES:
+            if progress_bar.maximum() != 0:
+                progress_bar.setRange(0, 0)
         else:
-            self.transcribe_progress.setRange(0, 100)
-            self.transcribe_progress.setValue(int(percent))
+            if progress_bar.maximum() != 100:
+                progress_bar.setRange(0, 100)
+            progress_bar.setValue(int(percent))
 
     def on_transcribe_finished(self, result: TranscriptResult):
         """文字起こし完了"""
+        self._release_worker()
         self.transcribe_btn.setEnabled(True)
         self.transcribe_progress.setRange(0, 100)
         self.transcribe_progress.setValue(100)
@@ -374,16 +478,40 @@ class TranscribeTab(QWidget):
 
         # 結果表示
         self.current_transcript = result
-        self.transcribe_result.setPlainText(result.to_txt())
+        self._transcript_txt = None
+        self._ensure_result_group()
+        # 逐次表示で全セグメントが表示済みなら、全文の再設定は不要
+        # （キャッシュ・YouTube字幕・逐次通知のないエンジンの結果が混ざる場合は全文を設定）
+        if self._streamed_segments == len(result.segments):
+            return
+        # 大量のテキストを設定する間は再描画を止め、最後に1回だけ描画する
+        self.transcribe_result.setUpdatesEnabled(False)
+        self._transcript_txt = result.to_txt()
+        self.transcribe_result.setPlainText(self._transcript_txt)
+        self.transcribe_result.setUpdatesEnabled(True)
+
+    def _append_segment(self, line: str):
+        """デコード済みのセグメントを結果欄の末尾に追加"""
+        self._ensure_result_group()
+        self.transcribe_result.appendPlainText(line)
+        self._streamed_segments += 1
 
     def on_transcribe_error(self, error_msg):
         """文字起こしエラー"""
+        self._release_worker()
         self.transcribe_btn.setEnabled(True)
         self.transcribe_progress.setRange(0, 100)
         self.transcribe_progress.setValue(0)
         self.transcribe_progress_label.setText("エラー発生")
         QMessageBox.critical(self, "エラー", f"文字起こしエラー:\n{error_msg}")
 
+    def _release_worker(self):
+        """完了したワーカーを解放"""
+        self._transcribe_ui_timer.stop()
+        self._pending_transcribe_progress = None
+        release_worker(self.current_worker)
+        self.current_worker = None
+
     def save_transcript_result(self):
         """文字起こし結果を保存"""
         if not self.current_transcript:
@@ -397,10 +525,13 @@ class TranscribeTab(QWidget):
         format_type = format_map.get(format_idx, 'txt')
         ext = ext_map.get(format_idx, 'txt')
 
-        default_name = f"{self.current_transcript.video_title}.{ext}"
+        # 保存先フォルダを含む完全なパスを渡す（ファイル名だけだとダイアログが最近使った場所を探す）
+        output_dir = self._settings.value("output_dir", DEFAULT_DOWNLOAD_DIR)
+        default_name = sanitize_filename(f"{self.current_transcript.video_title}.{ext}")
+        default_path = os.path.join(output_dir, default_name)
         file_path, _ = QFileDialog.getSaveFileName(
             self, "保存先を選択",
-            default_name,
+            default_path,
             f"テキストファイル (*.{ext});;すべてのファイル (*)"
         )
 
@@ -413,10 +544,14 @@ class TranscribeTab(QWidget):
 
     def copy_transcript(self):
         """文字起こし結果をコピー"""
-        text = self.transcribe_result.toPlainText()
+        if self.current_transcript is None:
+            return
+        # 表示中のドキュメントを走査せず、結果から作った文字列を使う
+        if self._transcript_txt is None:
+            self._transcript_txt = self.current_transcript.to_txt()
+        text = self._transcript_txt
         if text:
-            clipboard = QCoreApplication.instance().clipboard()
-            clipboard.setText(text)
+            QApplication.clipboard().setText(text)
 
     def set_file_for_transcribe(self, file_path: str):
         """外部からファイルを設定して文字起こしモードに切り替え"""
@@ -3,42 +3,100 @@ GUI共通ユーティリティ
 フォーマット関数やスタイル適用など
 """
 
-from typing import Optional
+import os
+import time
+import logging
+from typing import Optional, Union
 
-from PyQt6.QtWidgets import QComboBox, QListView
+from PyQt6.QtWidgets import QComboBox, QListView, QTextEdit
+from PyQt6.QtGui import QIcon, QPixmap
+from PyQt6.QtCore import Qt, QObject, QRunnable, QStandardPaths, QThread, QTimer
 
 # 定数は constants.py から一元管理（重複を解消）
 from src.constants import (
     AUDIO_BITRATE_KBPS,
     BYTES_PER_SECOND,
     DOWNLOAD_TIMEOUT_SECONDS,
+    LOG_MAX_LINES,
+    PROGRESS_EMIT_MIN_INTERVAL_SECONDS,
+    PROGRESS_EMIT_MIN_PERCENT,
+    PROGRESS_UI_INTERVAL_MS,
     THREAD_WAIT_TIMEOUT_MS,
+    TRANSCRIBE_PROGRESS_COALESCE_MS,
+    TRANSCRIPT_CACHE_DIR_NAME,
 )
 
+logger = logging.getLogger(__name__)
+
+# 既定の保存先（プロセス中は不変のため起動時に1回だけ展開）
+DEFAULT_DOWNLOAD_DIR = os.path.expanduser("~/Downloads")
+
+# アプリアイコンのファイル（優先順）と、PNGから用意するサイズ
+APP_ICON_FILES = ('icon.ico', 'icon_d.png')
+APP_ICON_SIZES = (16, 24, 32, 48, 64, 128, 256)
+
+
+def load_app_icon(app_dir: str) -> QIcon:
+    """
+    アプリアイコンを読み込み（見つからない場合は空のQIcon）
+
+    .ico は内包する各サイズをQtがそのまま使うため1回読み込むだけ。
+    PNGは1回だけデコードし、各サイズへ縮小して登録する
+    """
+    for icon_name in APP_ICON_FILES:
+        icon_path = os.path.join(app_dir, icon_name)
+        if not os.path.exists(icon_path):
+            continue
+
+        if icon_name.endswith('.ico'):
+            icon = QIcon(icon_path)
+        else:
+            pixmap = QPixmap(icon_path)
+            icon = QIcon()
+            for size in APP_ICON_SIZES:
+                icon.addPixmap(pixmap.scaled(
+                    size, size,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                ))
+        logger.debug("App icon loaded: %s", icon_path)
+        return icon
+
+    return QIcon()
+
+
+def get_transcript_cache_dir() -> str:
+    """文字起こし結果キャッシュの保存先を取得"""
+    base_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+    return os.path.join(base_dir, TRANSCRIPT_CACHE_DIR_NAME)
+
+
+# ワーカーが持つ可能性のあるシグナル名
+WORKER_SIGNAL_NAMES = ('progress', 'item_progress', 'urls_parsed', 'status', 'segment', 'finished', 'error')
+
 
 def format_eta(seconds: Optional[int]) -> str:
     """推定残り時間を日本語形式でフォーマット"""
     if not seconds or seconds <= 0:
         return ""
-    if seconds >= 3600:
-        h = int(seconds // 3600)
-        m = int((seconds % 3600) // 60)
-        return f"残り約{h}時間{m}分"
-    elif seconds >= 60:
-        m = int(seconds // 60)
-        s = int(seconds % 60)
+    # 整数化は1回だけ行い、以降は整数演算で分解
+    total = int(seconds)
+    if total >= 3600:
+        h, rem = divmod(total, 3600)
+        return f"残り約{h}時間{rem // 60}分"
+    elif total >= 60:
+        m, s = divmod(total, 60)
         return f"残り約{m}分{s}秒"
     else:
-        return f"残り約{int(seconds)}秒"
+        return f"残り約{total}秒"
 
 
 def format_duration(seconds: int) -> str:
     """再生時間を日本語形式でフォーマット"""
     if not seconds or seconds <= 0:
         return ""
-    h = int(seconds // 3600)
-    m = int((seconds % 3600) // 60)
-    s = int(seconds % 60)
+    h, rem = divmod(int(seconds), 3600)
+    m, s = divmod(rem, 60)
     if h > 0:
         return f"{h}時間{m}分{s}秒"
     else:
@@ -58,24 +116,129 @@ def format_file_size(bytes_size: int) -> str:
 
 
 def style_combobox(combo: QComboBox):
-    """コンボボックスにスタイルを適用"""
-    list_view = QListView()
-    list_view.setStyleSheet("""
-        QListView {
-            background-color: white;
-            border: 1px solid #cccccc;
-        }
-        QListView::item {
-            padding: 6px;
-            min-height: 20px;
-        }
-        QListView::item:hover {
-            background-color: #0078d4;
-            color: white;
-        }
-        QListView::item:selected {
-            background-color: #0078d4;
-            color: white;
-        }
-    """)
-    combo.setView(list_view)
+    """
+    コンボボックスにスタイルを適用
+
+    ドロップダウンをQListViewにして、アプリ全体のスタイルシート（main.py の
+    QComboBox QAbstractItemView）の項目スタイルが効くようにする
+    """
+    combo.setView(QListView())
+
+
+def release_worker(worker: Optional[Union[QThread, QRunnable]], connections: Optional[list] = None):
+    """
+    ワーカーを解放（メモリリーク対策）
+
+    シグナルを切断してスロット経由の参照を断ち、スレッド終了を待ってから
+    deleteLater()でQt側オブジェクトの破棄を予約する。
+    QThreadPool用のタスク（signals属性を持つQRunnable）はシグナルの切断のみ行う
+
+    Args:
+        worker: 解放するワーカー
+        connections: 接続時に記録した QMetaObject.Connection のリスト。
+                     渡した場合はその接続だけを切断する（省略時は既知のシグナルをすべて切断）
+    """
+    if worker is None:
+        return
+
+    if connections is not None:
+        for connection in connections:
+            QObject.disconnect(connection)
+    else:
+        signal_owner = getattr(worker, 'signals', worker)
+        for name in WORKER_SIGNAL_NAMES:
+            signal = getattr(signal_owner, name, None)
+            if signal is None:
+                continue
+            try:
+                signal.disconnect()
+            except (TypeError, RuntimeError):
+                pass
+
+    if not isinstance(worker, QThread):
+        return
+
+    worker.quit()
+    if worker.wait(THREAD_WAIT_TIMEOUT_MS):
+        worker.deleteLater()
+    else:
+        logger.warning("Worker thread did not terminate in time, skipping deleteLater")
+
+
+class LogBuffer:
+    """
+    ログ表示のバッファ
+
+    追加された行を溜めておき、一定間隔でまとめて1回のappendで反映する。
+    表示行数は LOG_MAX_LINES までに制限する
+    """
+
+    def __init__(self, text_edit: QTextEdit, max_lines: int = LOG_MAX_LINES):
+        self._text_edit = text_edit
+        self._pending = []
+        text_edit.document().setMaximumBlockCount(max_lines)
+
+        self._timer = QTimer(text_edit)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(PROGRESS_UI_INTERVAL_MS)
+        self._timer.timeout.connect(self.flush)
+
+    def append(self, line: str):
+        """行を追加（表示は次回のフラッシュ時）"""
+        self._pending.append(line)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def extend(self, lines):
+        """複数行をまとめて追加（表示は次回のフラッシュ時）"""
+        self._pending.extend(lines)
+        if self._pending and not self._timer.isActive():
+            self._timer.start()
+
+    def clear(self):
+        """保留中の行と表示内容を消去"""
+        self._timer.stop()
+        self._pending.clear()
+        self._text_edit.clear()
+
+    def flush(self):
+        """保留中の行をまとめて表示に反映"""
+        self._timer.stop()
+        if not self._pending:
+            return
+        text = "\n".join(self._pending)
+        self._pending.clear()
+        self._text_edit.append(text)
+
+
+class ProgressEmitFilter:
+    """
+    ワーカー側の進捗通知フィルター
+
+    'downloading' の進捗は変化率が PROGRESS_EMIT_MIN_PERCENT 未満かつ
+    前回通知から PROGRESS_EMIT_MIN_INTERVAL_SECONDS 未満なら通知しない。
+    それ以外の状態は常に通知する
+    """
+
+    def __init__(self, min_percent: float = PROGRESS_EMIT_MIN_PERCENT,
+                 min_interval: float = PROGRESS_EMIT_MIN_INTERVAL_SECONDS):
+        self._min_percent = min_percent
+        self._min_interval = min_interval
+        self._last_percent = -1.0
+        self._last_time = 0.0
+
+    def should_emit(self, info: dict) -> bool:
+        """この進捗をシグナルで通知すべきか判定"""
+        if info.get('status') != 'downloading':
+            # 状態が変わったら次の進捗は必ず通知する
+            self._last_percent = -1.0
+            return True
+
+        percent = info.get('percent', 0)
+        now = time.monotonic()
+        if (abs(percent - self._last_percent) >= self._min_percent
+                or now - self._last_time >= self._min_interval):
+            self._last_percent = percent
+            self._last_time = now
+            return True
+        return False
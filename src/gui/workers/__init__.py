@@ -1,6 +1,6 @@
 """
 ワーカークラスモジュール
-バックグラウンド処理用のQThreadワーカー
+バックグラウンド処理用のQThreadワーカーとQThreadPool用タスク
 """
 
 from src.gui.workers.download_worker import DownloadWorker
@@ -8,6 +8,8 @@ from src.gui.workers.playlist_worker import PlaylistFetchWorker
 from src.gui.workers.transcribe_worker import TranscribeWorker
 from src.gui.workers.update_worker import UpdateYtDlpWorker
 from src.gui.workers.spaces_worker import SpacesDownloadWorker
+from src.gui.workers.gpu_worker import GpuDetectTask
+from src.gui.workers.preload_worker import ModelPreloadTask
 
 __all__ = [
     'DownloadWorker',
@@ -15,4 +17,6 @@ __all__ = [
     'TranscribeWorker',
     'UpdateYtDlpWorker',
     'SpacesDownloadWorker',
+    'GpuDetectTask',
+    'ModelPreloadTask',
 ]
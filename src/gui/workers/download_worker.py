@@ -1,28 +1,88 @@
 """
-ダウンロード用ワーカースレッド
+ダウンロード用タスク（QThreadPoolで実行）
 """
 
-from PyQt6.QtCore import QThread, pyqtSignal
+import logging
+import threading
 
-from src.downloader import YouTubeDownloader
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 
+from src.downloader import YouTubeDownloader, canonicalize_youtube_url, extract_urls_from_text
+from src.gui.utils import ProgressEmitFilter
 
-class DownloadWorker(QThread):
-    """ダウンロード用ワーカースレッド"""
+logger = logging.getLogger(__name__)
+
+
+class DownloadSignals(QObject):
+    """ダウンロードタスクのシグナル（QRunnableはシグナルを持てないため分離）"""
     progress = pyqtSignal(dict)
     item_progress = pyqtSignal(int, int, str)
+    urls_parsed = pyqtSignal(list)  # 解析・重複除去後のURL
     finished = pyqtSignal(list)
     error = pyqtSignal(str)
 
-    def __init__(self, downloader: YouTubeDownloader, urls: list, options: dict):
+
+class DownloadWorker(QRunnable):
+    """ダウンロード用タスク（入力テキストのURL解析もこのタスクで行う）"""
+
+    def __init__(self, downloader: YouTubeDownloader, text: str, options: dict):
         super().__init__()
+        self.signals = DownloadSignals()
+        self._done = threading.Event()
         self.downloader = downloader
-        self.urls = urls
+        self.text = text
+        self.urls = []
         self.options = options
+        # 進捗通知の間引き（並列ダウンロード時に進捗が混ざらないようファイルごとに判定）
+        self._progress_filters = {}
+        self._progress_lock = threading.Lock()
+
+    def _on_progress(self, info: dict):
+        """進捗コールバック（変化の小さい進捗はシグナルを送らない、複数スレッドから呼ばれる）"""
+        filename = info.get('filename', '')
+        with self._progress_lock:
+            progress_filter = self._progress_filters.get(filename)
+            if progress_filter is None:
+                progress_filter = self._progress_filters[filename] = ProgressEmitFilter()
+            emit = progress_filter.should_emit(info)
+            if info.get('status') != 'downloading':
+                # 完了したファイルの判定状態は不要
+                self._progress_filters.pop(filename, None)
+        if emit:
+            self.signals.progress.emit(info)
+
+    def is_running(self) -> bool:
+        """実行中（未完了）かどうか"""
+        return not self._done.is_set()
+
+    def _parse_urls(self) -> list:
+        """入力テキストからURLを取り出し、同じ動画の重複を除去（順序は維持）"""
+        urls = extract_urls_from_text(self.text)
+        if not urls:
+            # 直接入力の場合
+            urls = list(filter(None, map(str.strip, self.text.splitlines())))
+
+        unique_urls = list(dict.fromkeys(canonicalize_youtube_url(u) for u in urls))
+        if len(unique_urls) < len(urls):
+            logger.info(f"Removed {len(urls) - len(unique_urls)} duplicate URLs")
+        return unique_urls
 
     def run(self):
         try:
-            self.downloader.set_progress_callback(lambda d: self.progress.emit(d))
+            self._run()
+        finally:
+            self._done.set()
+
+    def _run(self):
+        signals = self.signals
+        try:
+            self.urls = self._parse_urls()
+            if not self.urls:
+                signals.error.emit("有効なURLが見つかりません")
+                return
+            signals.urls_parsed.emit(self.urls)
+
+            self.downloader.set_progress_callback(self._on_progress)
 
             results = self.downloader.download_batch(
                 self.urls,
@@ -30,8 +90,9 @@ class DownloadWorker(QThread):
                 audio_only=self.options.get('audio_only', False),
                 subtitle=self.options.get('subtitle', False),
                 anti_ban=self.options.get('anti_ban', True),
-                item_callback=lambda i, t, u: self.item_progress.emit(i, t, u)
+                item_callback=lambda i, t, u: signals.item_progress.emit(i, t, u),
+                max_workers=self.options.get('concurrency', 1)
             )
-            self.finished.emit(results)
+            signals.finished.emit(results)
         except Exception as e:
-            self.error.emit(str(e))
+            signals.error.emit(str(e))
@@ -0,0 +1,32 @@
+"""
+GPU検出用タスク（QThreadPoolで実行）
+"""
+
+import logging
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from src.gpu_info import detect_gpu, GPUInfo
+
+logger = logging.getLogger(__name__)
+
+
+class GpuDetectSignals(QObject):
+    """GPU検出タスクのシグナル（QRunnableはシグナルを持てないため分離）"""
+    finished = pyqtSignal(object)  # GPUInfo
+
+
+class GpuDetectTask(QRunnable):
+    """GPU検出タスク（起動時のGUIスレッドをブロックしないため）"""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = GpuDetectSignals()
+
+    def run(self):
+        try:
+            gpu_info = detect_gpu()
+        except Exception as e:
+            logger.warning(f"GPU detection failed: {e}")
+            gpu_info = GPUInfo(available=False, name="", vram_mb=0)
+        self.signals.finished.emit(gpu_info)
@@ -1,31 +1,46 @@
 """
-再生リスト取得用ワーカースレッド
+再生リスト取得用タスク（QThreadPoolで実行）
 """
 
-from PyQt6.QtCore import QThread, pyqtSignal
+import threading
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 
 from src.downloader import YouTubeDownloader, PlaylistFilter
 
 
-class PlaylistFetchWorker(QThread):
-    """再生リスト取得用ワーカースレッド"""
+class PlaylistFetchSignals(QObject):
+    """再生リスト取得タスクのシグナル（QRunnableはシグナルを持てないため分離）"""
     progress = pyqtSignal(int, int)
     finished = pyqtSignal(list)
     error = pyqtSignal(str)
 
+
+class PlaylistFetchWorker(QRunnable):
+    """再生リスト取得用タスク"""
+
     def __init__(self, downloader: YouTubeDownloader, url: str, filter_options: PlaylistFilter):
         super().__init__()
+        self.signals = PlaylistFetchSignals()
+        self._done = threading.Event()
         self.downloader = downloader
         self.url = url
         self.filter_options = filter_options
 
+    def is_running(self) -> bool:
+        """実行中（未完了）かどうか"""
+        return not self._done.is_set()
+
     def run(self):
+        signals = self.signals
         try:
             videos = self.downloader.get_playlist_info(
                 self.url,
                 self.filter_options,
-                lambda c, t: self.progress.emit(c, t)
+                lambda c, t: signals.progress.emit(c, t)
             )
-            self.finished.emit(videos)
+            signals.finished.emit(videos)
         except Exception as e:
-            self.error.emit(str(e))
+            signals.error.emit(str(e))
+        finally:
+            self._done.set()
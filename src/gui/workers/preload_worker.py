@@ -0,0 +1,34 @@
+"""
+Whisperモデル事前読み込み用タスク（QThreadPoolで実行）
+"""
+
+import logging
+
+from PyQt6.QtCore import QRunnable
+
+from src.transcriber import Transcriber
+
+logger = logging.getLogger(__name__)
+
+
+class ModelPreloadTask(QRunnable):
+    """
+    起動時にWhisperモデルを読み込んでおくタスク
+
+    読み込みは Transcriber のロックで保護されるため、読み込み中に文字起こしを
+    開始した場合はワーカー側が完了を待ってからキャッシュ済みモデルを使用する
+    """
+
+    def __init__(self, transcriber: Transcriber, model_name: str):
+        super().__init__()
+        self.transcriber = transcriber
+        self.model_name = model_name
+
+    def run(self):
+        try:
+            logger.info(f"Preloading Whisper model: {self.model_name}")
+            self.transcriber.load_whisper_model(self.model_name)
+            logger.info(f"Whisper model preloaded: {self.model_name}")
+        except Exception as e:
+            # 事前読み込みの失敗は文字起こし開始時に改めて扱う
+            logger.warning(f"Whisper model preload failed: {e}")
@@ -4,18 +4,66 @@ Xスペースダウンロード用ワーカースレッド
 
 import os
 import sys
+import time
+import shutil
+import random
 import logging
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from src.gui.utils import BYTES_PER_SECOND, DOWNLOAD_TIMEOUT_SECONDS, format_duration
+from src.gui.utils import (
+    BYTES_PER_SECOND, DOWNLOAD_TIMEOUT_SECONDS, ProgressEmitFilter, format_duration, format_eta
+)
+from src.constants import SPACES_TEMP_DIR_NAME
 
 logger = logging.getLogger(__name__)
 
 
+def _format_progress(info: dict) -> dict:
+    """
+    'downloading' の進捗に表示用の値を追加（GUIスレッドは反映するだけで済むようワーカー側で整形）
+
+    追加する値:
+        status_text: ステータスラベルの文字列
+        percent_int: プログレスバーの値
+        indeterminate: 進捗率が不明（プログレスバーを不確定表示にする）
+    """
+    percent = info.get('percent', 0)
+    total = info.get('total', 0)
+    downloaded = info.get('downloaded', 0)
+    speed = info.get('speed', 0)
+    eta_str = format_eta(info.get('eta', 0))
+
+    if total == 0 or percent == 0:
+        downloaded_mb = downloaded / 1024 / 1024 if downloaded > 0 else 0
+        if downloaded_mb > 0 and eta_str:
+            status_text = f"ダウンロード中... {downloaded_mb:.1f} MB ({eta_str})"
+        elif downloaded_mb > 0:
+            status_text = f"ダウンロード中... {downloaded_mb:.1f} MB"
+        elif eta_str:
+            status_text = f"ダウンロード中... ({eta_str})"
+        else:
+            status_text = "ダウンロード中..."
+        info.update(status_text=status_text, percent_int=0, indeterminate=True)
+    else:
+        parts = [f"{percent:.1f}%"]
+        if speed:
+            parts.append(f"{speed / 1024 / 1024:.1f} MB/s")
+        if eta_str:
+            parts.append(eta_str)
+        info.update(
+            status_text=f"ダウンロード中... {' / '.join(parts)}",
+            percent_int=int(percent),
+            indeterminate=False
+        )
+    return info
+
+
 class SpacesDownloadWorker(QThread):
-    """Xスペースダウンロード用ワーカースレッド（複数URL対応）"""
+    """Xスペースダウンロード用ワーカースレッド（複数URL対応、options['concurrency'] 件まで同時処理）"""
     progress = pyqtSignal(dict)
     item_progress = pyqtSignal(int, int, str)  # current_index, total, url
     finished = pyqtSignal(list)  # 結果リスト
@@ -26,70 +74,93 @@ class SpacesDownloadWorker(QThread):
         self.urls = urls  # URLリスト
         self.output_dir = output_dir
         self.options = options
-        self._cancel_flag = False
-        self._subprocess_pid: Optional[int] = None  # 子プロセスのPID
-        self._download_start_time = None
-        self._duration = 0  # 再生時間（秒）
-        self._ydl = None  # yt-dlpインスタンス
-        self._current_index = 0
+        # ダウンロード・変換中のファイルは作業用フォルダに置き、完成後に保存先へ移動
+        self.temp_dir = os.path.join(output_dir, SPACES_TEMP_DIR_NAME)
+        self._cancel_event = threading.Event()  # キャンセル通知（待機中でも即座に解除）
+        self._subprocess_pids: Dict[int, float] = {}  # 子プロセス（FFmpeg）のPID -> 起動時刻
+        self._pid_lock = threading.Lock()
         self._total_urls = len(urls)
 
     def cancel(self):
         """キャンセルフラグを設定"""
         logger.info("Download cancellation requested")
-        self._cancel_flag = True
+        self._cancel_event.set()
 
     def force_stop(self):
-        """強制停止（自プロセスのみ終了）"""
+        """強制停止（自プロセスの子プロセスのみ終了）"""
         logger.info("Force stop requested")
-        self._cancel_flag = True
+        self._cancel_event.set()
+
+        with self._pid_lock:
+            pids = dict(self._subprocess_pids)
+        if not pids:
+            return
+
+        import psutil
+        import subprocess
 
         # 特定の子プロセスのみ終了（全FFmpegを殺さない）
-        if self._subprocess_pid:
+        for pid, create_time in pids.items():
             try:
-                import subprocess
+                # 終了済み、またはPIDが別のプロセスに再利用されている場合は対象外
+                if psutil.Process(pid).create_time() != create_time:
+                    continue
                 if sys.platform == 'win32':
                     # 特定のPIDのプロセスツリーを終了
                     subprocess.run(
-                        ['taskkill', '/F', '/T', '/PID', str(self._subprocess_pid)],
+                        ['taskkill', '/F', '/T', '/PID', str(pid)],
                         capture_output=True,
                         creationflags=subprocess.CREATE_NO_WINDOW
                     )
-                    logger.info(f"Terminated subprocess PID: {self._subprocess_pid}")
+                    logger.info(f"Terminated subprocess PID: {pid}")
+            except psutil.NoSuchProcess:
+                continue
             except Exception as e:
                 logger.warning(f"Failed to terminate subprocess: {e}")
 
     def _track_subprocess(self):
-        """子プロセスのPIDを追跡"""
+        """
+        子プロセスのPIDを追跡（同時ダウンロード時は複数のFFmpegを記録）
+
+        作業用フォルダを引数に含むFFmpegだけを対象にし（文字起こしやYouTubeダウンロードの
+        FFmpegは除外）、確認のたびに終了したプロセスは外す
+        """
         try:
             import psutil
-            current_process = psutil.Process()
-            children = current_process.children(recursive=True)
-            for child in children:
-                if 'ffmpeg' in child.name().lower():
-                    self._subprocess_pid = child.pid
-                    logger.debug(f"Tracking FFmpeg subprocess PID: {self._subprocess_pid}")
-                    break
+            running = {}
+            for child in psutil.Process().children(recursive=True):
+                try:
+                    if 'ffmpeg' not in child.name().lower():
+                        continue
+                    if not any(self.temp_dir in arg for arg in child.cmdline()):
+                        continue
+                    running[child.pid] = child.create_time()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            with self._pid_lock:
+                new_pids = running.keys() - self._subprocess_pids.keys()
+                self._subprocess_pids = running
+            if new_pids:
+                logger.debug(f"Tracking FFmpeg subprocess PIDs: {sorted(new_pids)}")
         except ImportError:
             # psutilがない場合はスキップ
             pass
         except Exception as e:
             logger.debug(f"Could not track subprocess: {e}")
 
-    def run(self):
+    def _download_one(self, index: int, url: str, ffmpeg_path: Optional[str]) -> str:
+        """1件のスペースをダウンロード（結果はファイルパスまたは "ERROR: ..."）"""
         import yt_dlp
 
-        logger.info(f"Starting download for {self._total_urls} URLs")
-
-        results = []  # ダウンロード結果リスト
+        current = index + 1
+        total_urls = self._total_urls
+        duration = 0  # 再生時間（秒）、情報取得後に設定
+        progress_filter = ProgressEmitFilter()  # 進捗通知の間引き（URLごと）
 
         def progress_hook(d):
-            if self._cancel_flag:
+            if self._cancel_event.is_set():
                 raise Exception("ダウンロードがキャンセルされました")
 
-            # 子プロセス追跡（ダウンロード中に定期的に確認）
-            self._track_subprocess()
-
             status = d.get('status', '')
             info = {'status': status}
 
@@ -100,8 +171,8 @@ class SpacesDownloadWorker(QThread):
                 eta = d.get('eta', 0)
 
                 # ETAが不明な場合、再生時間とビットレートから推定
-                if (not eta or eta <= 0) and self._duration > 0 and speed and speed > 0:
-                    estimated_total = self._duration * BYTES_PER_SECOND
+                if (not eta or eta <= 0) and duration > 0 and speed and speed > 0:
+                    estimated_total = duration * BYTES_PER_SECOND
                     remaining_bytes = max(0, estimated_total - downloaded)
                     eta = int(remaining_bytes / speed) if speed > 0 else 0
 
@@ -109,8 +180,8 @@ class SpacesDownloadWorker(QThread):
                 percent = 0
                 if total > 0:
                     percent = (downloaded / total * 100)
-                elif self._duration > 0:
-                    estimated_total = self._duration * BYTES_PER_SECOND
+                elif duration > 0:
+                    estimated_total = duration * BYTES_PER_SECOND
                     percent = min(99, (downloaded / estimated_total * 100))
 
                 info.update({
@@ -119,164 +190,198 @@ class SpacesDownloadWorker(QThread):
                     'speed': speed,
                     'eta': eta,
                     'percent': percent,
-                    'duration': self._duration
+                    'duration': duration
                 })
             elif status == 'finished':
                 info['message'] = '音声変換中...'
 
-            self.progress.emit(info)
+            # 変化の小さい進捗はシグナルを送らない
+            if not progress_filter.should_emit(info):
+                return
 
-        try:
-            if not os.path.exists(self.output_dir):
-                os.makedirs(self.output_dir)
+            # 子プロセス追跡（通知のタイミングで定期的に確認）
+            self._track_subprocess()
 
-            # FFmpegパス設定
-            from src.downloader import get_ffmpeg_path
-            ffmpeg_path = get_ffmpeg_path()
+            if status == 'downloading':
+                _format_progress(info)
+            self.progress.emit(info)
 
-            # 各URLを順番に処理
-            import time
-            import random
-            anti_ban = self.options.get('anti_ban', True)
+        self.item_progress.emit(current, total_urls, url)
+        logger.info(f"Processing URL {current}/{total_urls}: {url}")
 
-            for idx, url in enumerate(self.urls):
-                if self._cancel_flag:
-                    break
+        try:
+            # ステップ1: 情報取得（ダウンロードなし）
+            self.progress.emit({
+                'status': 'extracting',
+                'message': f'[{current}/{total_urls}] スペース情報を取得中...'
+            })
+
+            extract_opts = {
+                'quiet': True,
+                'no_warnings': True,
+            }
+            if ffmpeg_path:
+                extract_opts['ffmpeg_location'] = ffmpeg_path
+
+            with yt_dlp.YoutubeDL(extract_opts) as ydl:
+                info = ydl.extract_info(url, download=False)
+
+            if not info:
+                return f"ERROR: {url} - 情報を取得できませんでした"
+
+            # タイトルと再生時間を取得
+            title = info.get('title', 'Unknown')
+
+            # 再生時間を複数のフィールドから取得を試みる
+            duration = info.get('duration', 0)
+            if not duration:
+                formats = info.get('formats', [])
+                for fmt in formats:
+                    if fmt.get('duration'):
+                        duration = fmt.get('duration')
+                        break
+            if not duration:
+                req_formats = info.get('requested_formats', [])
+                for fmt in req_formats:
+                    if fmt.get('duration'):
+                        duration = fmt.get('duration')
+                        break
+            if not duration:
+                fragments = info.get('fragments', [])
+                if fragments:
+                    duration = sum(f.get('duration', 0) for f in fragments if f.get('duration'))
+
+            duration_str = format_duration(duration) if duration else ""
+            estimated_size_mb = (duration * BYTES_PER_SECOND) / (1024 * 1024) if duration else 0
+
+            if not estimated_size_mb:
+                filesize = info.get('filesize') or info.get('filesize_approx', 0)
+                if filesize:
+                    estimated_size_mb = filesize / (1024 * 1024)
+
+            self.progress.emit({
+                'status': 'info_ready',
+                'message': f'[{current}/{total_urls}] 取得完了: {title}' + (f' ({duration_str})' if duration_str else ''),
+                'title': title,
+                'duration': duration,
+                'estimated_size_mb': estimated_size_mb,
+                'duration_unknown': not bool(duration)
+            })
+
+            # ステップ2: ダウンロード開始
+            self.progress.emit({
+                'status': 'starting',
+                'message': f'[{current}/{total_urls}] ダウンロード開始...'
+            })
+            logger.info(f"Starting download phase for: {title}")
+
+            # 途中のファイル（.part や変換前の音声）は temp に置かれ、
+            # 後処理まで完了したファイルだけが yt-dlp により home へ移動される
+            ydl_opts = {
+                'paths': {'home': self.output_dir, 'temp': self.temp_dir},
+                'outtmpl': '%(title)s.%(ext)s',
+                'progress_hooks': [progress_hook],
+                'quiet': True,
+                'no_warnings': True,
+                'socket_timeout': DOWNLOAD_TIMEOUT_SECONDS,
+                'retries': 3,
+            }
+
+            if ffmpeg_path:
+                ydl_opts['ffmpeg_location'] = ffmpeg_path
+
+            # 音声フォーマット設定
+            audio_format = self.options.get('audio_format', 'm4a')
+            if audio_format != 'original':
+                ydl_opts['postprocessors'] = [{
+                    'key': 'FFmpegExtractAudio',
+                    'preferredcodec': audio_format,
+                    'preferredquality': '320',
+                }]
+
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                ydl.download([url])
+
+                # ファイル名を生成
+                filename = ydl.prepare_filename(info)
+                if audio_format != 'original':
+                    base = os.path.splitext(filename)[0]
+                    filename = f"{base}.{audio_format}"
+
+                logger.info(f"Download completed: {filename}")
+                return filename
+
+        except yt_dlp.utils.DownloadError as e:
+            error_msg = str(e)
+            logger.error(f"Download error for {url}: {error_msg}")
+            if "Unsupported URL" in error_msg:
+                return f"ERROR: {url} - このURLはサポートされていません"
+            elif "Private" in error_msg or "protected" in error_msg.lower():
+                return f"ERROR: {url} - このスペースは非公開です"
+            elif "not available" in error_msg.lower():
+                return f"ERROR: {url} - このスペースは利用できません"
+            else:
+                return f"ERROR: {url} - {error_msg}"
+        except Exception as e:
+            logger.error(f"Unexpected error for {url}: {e}")
+            return f"ERROR: {url} - {str(e)}"
 
-                # BAN対策: 2件目以降は遅延を入れる
-                if anti_ban and idx > 0:
-                    delay = random.uniform(3.0, 5.0)  # 3〜5秒のランダム遅延
-                    logger.info(f"Anti-ban delay: {delay:.1f}s")
-                    time.sleep(delay)
+    def run(self):
+        max_workers = max(1, self.options.get('concurrency', 1))
+        logger.info(f"Starting download for {self._total_urls} URLs (workers={max_workers})")
 
-                self._current_index = idx + 1
-                self.item_progress.emit(self._current_index, self._total_urls, url)
+        # URLの順に並んだ結果（キャンセルで未処理の分は含めない）
+        results: List[Optional[str]] = [None] * self._total_urls
 
-                logger.info(f"Processing URL {self._current_index}/{self._total_urls}: {url}")
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
 
-                try:
-                    # ステップ1: 情報取得（ダウンロードなし）
-                    self.progress.emit({
-                        'status': 'extracting',
-                        'message': f'[{self._current_index}/{self._total_urls}] スペース情報を取得中...'
-                    })
-
-                    extract_opts = {
-                        'quiet': True,
-                        'no_warnings': True,
-                    }
-                    if ffmpeg_path:
-                        extract_opts['ffmpeg_location'] = ffmpeg_path
-
-                    with yt_dlp.YoutubeDL(extract_opts) as ydl:
-                        info = ydl.extract_info(url, download=False)
-
-                    if not info:
-                        results.append(f"ERROR: {url} - 情報を取得できませんでした")
-                        continue
+            # FFmpegパス設定
+            from src.downloader import get_ffmpeg_path
+            ffmpeg_path = get_ffmpeg_path()
 
-                    # タイトルと再生時間を取得
-                    title = info.get('title', 'Unknown')
-
-                    # 再生時間を複数のフィールドから取得を試みる
-                    duration = info.get('duration', 0)
-                    if not duration:
-                        formats = info.get('formats', [])
-                        for fmt in formats:
-                            if fmt.get('duration'):
-                                duration = fmt.get('duration')
-                                break
-                    if not duration:
-                        req_formats = info.get('requested_formats', [])
-                        for fmt in req_formats:
-                            if fmt.get('duration'):
-                                duration = fmt.get('duration')
-                                break
-                    if not duration:
-                        fragments = info.get('fragments', [])
-                        if fragments:
-                            duration = sum(f.get('duration', 0) for f in fragments if f.get('duration'))
-
-                    self._duration = duration
-
-                    duration_str = format_duration(duration) if duration else ""
-                    estimated_size_mb = (duration * BYTES_PER_SECOND) / (1024 * 1024) if duration else 0
-
-                    if not estimated_size_mb:
-                        filesize = info.get('filesize') or info.get('filesize_approx', 0)
-                        if filesize:
-                            estimated_size_mb = filesize / (1024 * 1024)
-
-                    self.progress.emit({
-                        'status': 'info_ready',
-                        'message': f'[{self._current_index}/{self._total_urls}] 取得完了: {title}' + (f' ({duration_str})' if duration_str else ''),
-                        'title': title,
-                        'duration': duration,
-                        'estimated_size_mb': estimated_size_mb,
-                        'duration_unknown': not bool(duration)
-                    })
-
-                    # ステップ2: ダウンロード開始
-                    self.progress.emit({
-                        'status': 'starting',
-                        'message': f'[{self._current_index}/{self._total_urls}] ダウンロード開始...'
-                    })
-                    logger.info(f"Starting download phase for: {title}")
-
-                    ydl_opts = {
-                        'outtmpl': os.path.join(self.output_dir, '%(title)s.%(ext)s'),
-                        'progress_hooks': [progress_hook],
-                        'quiet': True,
-                        'no_warnings': True,
-                        'socket_timeout': DOWNLOAD_TIMEOUT_SECONDS,
-                        'retries': 3,
-                    }
-
-                    if ffmpeg_path:
-                        ydl_opts['ffmpeg_location'] = ffmpeg_path
-
-                    # 音声フォーマット設定
-                    audio_format = self.options.get('audio_format', 'mp3')
-                    if audio_format != 'original':
-                        ydl_opts['postprocessors'] = [{
-                            'key': 'FFmpegExtractAudio',
-                            'preferredcodec': audio_format,
-                            'preferredquality': '320',
-                        }]
-
-                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                        ydl.download([url])
-
-                        # ファイル名を生成
-                        filename = ydl.prepare_filename(info)
-                        if audio_format != 'original':
-                            base = os.path.splitext(filename)[0]
-                            filename = f"{base}.{audio_format}"
-
-                        logger.info(f"Download completed: {filename}")
-                        results.append(filename)
-
-                except yt_dlp.utils.DownloadError as e:
-                    error_msg = str(e)
-                    logger.error(f"Download error for {url}: {error_msg}")
-                    if "Unsupported URL" in error_msg:
-                        results.append(f"ERROR: {url} - このURLはサポートされていません")
-                    elif "Private" in error_msg or "protected" in error_msg.lower():
-                        results.append(f"ERROR: {url} - このスペースは非公開です")
-                    elif "not available" in error_msg.lower():
-                        results.append(f"ERROR: {url} - このスペースは利用できません")
-                    else:
-                        results.append(f"ERROR: {url} - {error_msg}")
-                except Exception as e:
-                    logger.error(f"Unexpected error for {url}: {e}")
-                    results.append(f"ERROR: {url} - {str(e)}")
+            # BAN対策: 2件目以降は3〜5秒の遅延を入れる
+            # 同時処理時も直前の開始予定時刻から間隔を空け、同時に開始しないようにする
+            anti_ban = self.options.get('anti_ban', True)
+            schedule_lock = threading.Lock()
+            last_start = [0.0]
+
+            def wait_turn(index: int) -> bool:
+                if not anti_ban or index == 0:
+                    return True
+                with schedule_lock:
+                    now = time.monotonic()
+                    start_at = max(now, last_start[0]) + random.uniform(3.0, 5.0)  # 3〜5秒のランダム遅延
+                    last_start[0] = start_at
+                delay = start_at - now
+                logger.info(f"Anti-ban delay: {delay:.1f}s")
+                # キャンセル時は待機を打ち切る
+                return not self._cancel_event.wait(delay)
+
+            def process(index: int, url: str):
+                if self._cancel_event.is_set() or not wait_turn(index):
+                    return
+                results[index] = self._download_one(index, url, ffmpeg_path)
+
+            if max_workers <= 1 or self._total_urls <= 1:
+                for idx, url in enumerate(self.urls):
+                    if self._cancel_event.is_set():
+                        break
+                    process(idx, url)
+            else:
+                with ThreadPoolExecutor(max_workers=min(max_workers, self._total_urls)) as executor:
+                    futures = [executor.submit(process, idx, url) for idx, url in enumerate(self.urls)]
+                    for future in as_completed(futures):
+                        future.result()
 
             # 全件処理完了
-            self.finished.emit(results)
+            self.finished.emit([r for r in results if r is not None])
 
         except Exception as e:
             logger.error(f"Critical error: {e}")
             self.error.emit(str(e))
         finally:
-            # リソースクリーンアップ
-            self._subprocess_pid = None
+            # リソースクリーンアップ（作業用フォルダに残るのは失敗・中断した途中のファイルのみ）
+            with self._pid_lock:
+                self._subprocess_pids.clear()
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
@@ -2,12 +2,17 @@
 文字起こし用ワーカースレッド
 """
 
+import os
+import queue
 import logging
-from typing import Union, List
+import tempfile
+import threading
+from typing import Union, List, Optional
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from src.transcriber import Transcriber, TranscriptResult
+from src.transcriber import Transcriber, TranscriptResult, DownloadedAudio
+from src.transcript_cache import TranscriptCache
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +20,7 @@ logger = logging.getLogger(__name__)
 class TranscribeWorker(QThread):
     """文字起こし用ワーカースレッド（複数ファイル対応）"""
     progress = pyqtSignal(dict)
+    segment = pyqtSignal(str)  # デコード済みセグメント（タイムスタンプ付きの1行）
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
 
@@ -27,36 +33,36 @@ class TranscribeWorker(QThread):
     def run(self):
         try:
             self.transcriber.set_progress_callback(lambda d: self.progress.emit(d))
+            self.transcriber.set_segment_callback(lambda seg: self.segment.emit(seg.to_txt_line()))
 
             # カスタム辞書を取得
             custom_vocabulary = self.options.get('custom_vocabulary', '')
 
+            # ローカルファイルの結果キャッシュ
+            cache_dir = self.options.get('cache_dir')
+            cache = TranscriptCache(cache_dir) if cache_dir else None
+
             # 複数ファイル/URL対応
             items = self.url_or_path if isinstance(self.url_or_path, list) else [self.url_or_path]
             results = []
 
-            for i, item in enumerate(items):
-                self.progress.emit({
-                    'status': 'processing',
-                    'message': f'処理中... ({i+1}/{len(items)})',
-                    'percent': (i / len(items)) * 100
-                })
-
-                if self.options.get('is_file', False):
-                    result = self.transcriber.transcribe_audio(
-                        item,
-                        language=self.options.get('language', 'ja'),
-                        model_name=self.options.get('model', 'base'),
-                        custom_vocabulary=custom_vocabulary
-                    )
-                else:
-                    result = self.transcriber.transcribe_youtube(
-                        item,
-                        language=self.options.get('language', 'ja'),
-                        model_name=self.options.get('model', 'base'),
-                        prefer_youtube_subtitles=self.options.get('prefer_youtube', True)
-                    )
-                results.append(result)
+            if not self.options.get('is_file', False) and len(items) > 1:
+                # 複数URLは音声の取得と文字起こしを並行して行う
+                results = self._transcribe_urls_pipelined(items)
+            else:
+                for i, item in enumerate(items):
+                    self._emit_item_progress(i, len(items))
+
+                    if self.options.get('is_file', False):
+                        result = self._transcribe_file(item, custom_vocabulary, cache)
+                    else:
+                        result = self.transcriber.transcribe_youtube(
+                            item,
+                            language=self.options.get('language', 'ja'),
+                            model_name=self.options.get('model', 'base'),
+                            prefer_youtube_subtitles=self.options.get('prefer_youtube', True)
+                        )
+                    results.append(result)
 
             # 単一ファイルの場合はそのまま返す、複数の場合は最初の結果を返す
             # TODO: 将来的には複数結果を統合するUIが必要
@@ -73,6 +79,132 @@ class TranscribeWorker(QThread):
         finally:
             # メモリリーク対策: コールバックをクリア
             self.transcriber.set_progress_callback(None)
+            self.transcriber.set_segment_callback(None)
+
+    def _emit_item_progress(self, index: int, total: int):
+        """何件目を処理中かを通知"""
+        self.progress.emit({
+            'status': 'processing',
+            'message': f'処理中... ({index+1}/{total})',
+            'percent': (index / total) * 100
+        })
+
+    def _emit_stage_progress(self, fetched: int, transcribing: int, total: int):
+        """パイプライン処理の各段階の件数を通知"""
+        self.progress.emit({
+            'status': 'processing',
+            'message': f'取得 {fetched}/{total} | 文字起こし {transcribing}/{total}',
+            'percent': (max(transcribing - 1, 0) / total) * 100
+        })
+
+    def _transcribe_urls_pipelined(self, urls: List[str]) -> List[TranscriptResult]:
+        """
+        複数URLを文字起こし（次のURLの字幕確認・音声ダウンロードを現在の文字起こしと並行して実行）
+
+        取得側スレッドは最大1件だけ先行する（キューの上限）。GPUを使う文字起こしは
+        このスレッドだけで1件ずつ行うため、VRAM使用量は逐次処理と変わらない
+        """
+        language = self.options.get('language', 'ja')
+        model_name = self.options.get('model', 'base')
+        prefer_youtube = self.options.get('prefer_youtube', True)
+
+        prepared = queue.Queue(maxsize=1)
+        stop_event = threading.Event()
+        results = []
+        # 取得済み件数・文字起こし中の番号（進捗表示用、それぞれ1スレッドだけが書き込む）
+        fetched = 0
+        transcribing = 0
+
+        with tempfile.TemporaryDirectory() as temp_root:
+            def produce():
+                nonlocal fetched
+                for i, url in enumerate(urls):
+                    if stop_event.is_set():
+                        return
+                    temp_dir = os.path.join(temp_root, str(i))
+                    try:
+                        os.makedirs(temp_dir)
+                        # 進捗は件数表示のみとし、文字起こし中の表示を上書きしない
+                        source = self.transcriber.fetch_youtube_source(
+                            url, language, prefer_youtube, temp_dir,
+                            report_progress=False, cancel_event=stop_event
+                        )
+                    except Exception as e:
+                        source = e
+                    fetched = i + 1
+                    self._emit_stage_progress(fetched, transcribing, len(urls))
+                    prepared.put(source)
+
+            producer = threading.Thread(target=produce, daemon=True)
+            producer.start()
+            try:
+                for i in range(len(urls)):
+                    source = prepared.get()
+                    transcribing = i + 1
+                    self._emit_stage_progress(fetched, transcribing, len(urls))
+                    if isinstance(source, Exception):
+                        raise source
+                    if isinstance(source, DownloadedAudio):
+                        result = self.transcriber.transcribe_downloaded_audio(source, language, model_name)
+                        # 処理済みの音声はすぐに削除
+                        os.remove(source.path)
+                    else:
+                        result = source
+                    results.append(result)
+            finally:
+                # 取得側スレッドを止めてから一時ディレクトリを削除する
+                stop_event.set()
+                while producer.is_alive():
+                    try:
+                        prepared.get_nowait()
+                    except queue.Empty:
+                        pass
+                    producer.join(0.1)
+
+        return results
+
+    def _transcribe_file(self, path: str, custom_vocabulary: str,
+                         cache: Optional[TranscriptCache]) -> TranscriptResult:
+        """ローカルファイルを文字起こし（同じ内容・条件の結果があれば再利用）"""
+        language = self.options.get('language', 'ja')
+        model_name = self.options.get('model', 'base')
+
+        key = None
+        if cache is not None:
+            params = {
+                'engine': self.transcriber.engine_name,
+                'model': model_name,
+                'language': language,
+                'custom_vocabulary': custom_vocabulary,
+                'vad_filter': self.transcriber.vad_filter,
+            'batch_size': self.transcriber.batch_size,
+            }
+            try:
+                key = cache.make_key(path, params)
+            except OSError as e:
+                logger.warning(f"Failed to hash audio file for cache: {e}")
+
+        if key is not None:
+            result = cache.get(key)
+            if result is not None:
+                # ファイル名が変わっている場合もあるため現在の名前を使用
+                result.video_title = os.path.splitext(os.path.basename(path))[0]
+                self.progress.emit({
+                    'status': 'completed',
+                    'message': '文字起こし完了（キャッシュ）',
+                    'percent': 100
+                })
+                return result
+
+        result = self.transcriber.transcribe_audio(
+            path,
+            language=language,
+            model_name=model_name,
+            custom_vocabulary=custom_vocabulary
+        )
+        if key is not None:
+            cache.put(key, result)
+        return result
 
     def _combine_results(self, results: List[TranscriptResult]) -> TranscriptResult:
         """複数の結果を結合"""
@@ -8,11 +8,15 @@ import sys
 import urllib.request
 import zipfile
 import shutil
+import tempfile
 import subprocess
 import logging
-from typing import Optional, Callable
+from typing import Optional, Callable, IO
 
-from src.constants import FFMPEG_URL, FFMPEG_FILENAME, ERROR_MESSAGES
+from src.constants import (
+    FFMPEG_URL, ERROR_MESSAGES, URL_FETCH_TIMEOUT_SECONDS,
+    FFMPEG_DOWNLOAD_CHUNK_BYTES, FFMPEG_SPOOL_MAX_BYTES
+)
 
 # ロガー設定
 logger = logging.getLogger(__name__)
@@ -77,68 +81,55 @@ def is_ffmpeg_installed() -> bool:
     return False
 
 
-def download_ffmpeg(progress_callback: Optional[Callable[[int, int], None]] = None) -> str:
-    """FFmpegをダウンロード"""
-    app_dir = get_app_dir()
-    zip_path = os.path.join(app_dir, FFMPEG_FILENAME)
+def download_ffmpeg(progress_callback: Optional[Callable[[int, int], None]] = None) -> IO[bytes]:
+    """
+    FFmpegをダウンロード
 
+    ZIPはディスクに書き出さず一時ファイルオブジェクト（FFMPEG_SPOOL_MAX_BYTESまではメモリ上）
+    に受信し、先頭にシークした状態で返す。呼び出し側でcloseすること
+    """
     logger.info(f"Downloading FFmpeg from: {FFMPEG_URL}")
 
-    def report_progress(block_num, block_size, total_size):
-        if progress_callback and total_size > 0:
-            downloaded = block_num * block_size
-            progress_callback(downloaded, total_size)
-
+    archive = tempfile.SpooledTemporaryFile(max_size=FFMPEG_SPOOL_MAX_BYTES)
     try:
-        urllib.request.urlretrieve(FFMPEG_URL, zip_path, report_progress)
-        logger.info(f"FFmpeg downloaded to: {zip_path}")
+        with urllib.request.urlopen(FFMPEG_URL, timeout=URL_FETCH_TIMEOUT_SECONDS) as response:
+            total_size = int(response.headers.get('Content-Length') or 0)
+            downloaded = 0
+            while True:
+                chunk = response.read(FFMPEG_DOWNLOAD_CHUNK_BYTES)
+                if not chunk:
+                    break
+                archive.write(chunk)
+                downloaded += len(chunk)
+                if progress_callback and total_size > 0:
+                    progress_callback(downloaded, total_size)
+        logger.info(f"FFmpeg downloaded: {downloaded} bytes")
     except urllib.error.URLError as e:
+        archive.close()
         logger.error(f"Download failed - network error: {e}")
         raise Exception(ERROR_MESSAGES['network_error'])
     except Exception as e:
+        archive.close()
         logger.error(f"Download failed: {e}")
         raise
 
-    return zip_path
-
+    archive.seek(0)
+    return archive
 
-def verify_zip_integrity(zip_path: str) -> bool:
-    """ZIPファイルの整合性を検証"""
-    logger.info(f"Verifying ZIP integrity: {zip_path}")
-    try:
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            # ZIPファイルの整合性チェック
-            bad_file = zip_ref.testzip()
-            if bad_file is not None:
-                logger.error(f"ZIP corruption detected in: {bad_file}")
-                return False
-            logger.info("ZIP integrity verified")
-            return True
-    except zipfile.BadZipFile as e:
-        logger.error(f"Invalid ZIP file: {e}")
-        return False
-    except Exception as e:
-        logger.error(f"ZIP verification error: {e}")
-        return False
 
+def extract_ffmpeg(archive: IO[bytes], progress_callback: Optional[Callable[[str], None]] = None) -> str:
+    """
+    FFmpegを展開
 
-def extract_ffmpeg(zip_path: str, progress_callback: Optional[Callable[[str], None]] = None) -> str:
-    """FFmpegを展開"""
-    logger.info(f"Extracting FFmpeg from: {zip_path}")
+    展開するファイルは読み込み時にCRCが検証されるため、事前の全体検証（testzip）は行わない
+    """
+    logger.info("Extracting FFmpeg archive")
     ffmpeg_dir = get_ffmpeg_dir()
 
-    # ZIPファイルの整合性検証
-    if not verify_zip_integrity(zip_path):
-        logger.error("ZIP file is corrupted")
-        raise Exception(ERROR_MESSAGES['checksum_mismatch'])
-
     # 既にffmpeg.exeが存在する場合はスキップ
     ffmpeg_exe = os.path.join(ffmpeg_dir, "ffmpeg.exe")
     if os.path.exists(ffmpeg_exe):
         logger.info(f"FFmpeg already exists at: {ffmpeg_exe}, skipping extraction")
-        # ZIPファイルだけ削除
-        if os.path.exists(zip_path):
-            os.remove(zip_path)
         return ffmpeg_dir
 
     # 既存のディレクトリを削除（ffmpeg.exeがない場合のみ）
@@ -152,27 +143,30 @@ def extract_ffmpeg(zip_path: str, progress_callback: Optional[Callable[[str], No
         progress_callback("展開中...")
 
     extracted_files = []
-    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        # binフォルダ内のexeファイルを取得
-        for file_info in zip_ref.namelist():
-            if file_info.endswith('.exe') and '/bin/' in file_info:
-                # ファイル名のみ取得
-                filename = os.path.basename(file_info)
-                # 展開先パス
-                target_path = os.path.join(ffmpeg_dir, filename)
-
-                if progress_callback:
-                    progress_callback(f"展開中: {filename}")
-
-                # ファイルを読み込んで書き込み
-                with zip_ref.open(file_info) as src, open(target_path, 'wb') as dst:
-                    dst.write(src.read())
-                extracted_files.append(filename)
-                logger.debug(f"Extracted: {filename}")
-
-    # ZIPファイルを削除
-    os.remove(zip_path)
-    logger.info(f"ZIP file removed: {zip_path}")
+    try:
+        with zipfile.ZipFile(archive, 'r') as zip_ref:
+            # binフォルダ内のexeファイルを取得
+            for file_info in zip_ref.namelist():
+                if file_info.endswith('.exe') and '/bin/' in file_info:
+                    # ファイル名のみ取得
+                    filename = os.path.basename(file_info)
+                    # 展開先パス
+                    target_path = os.path.join(ffmpeg_dir, filename)
+
+                    if progress_callback:
+                        progress_callback(f"展開中: {filename}")
+
+                    # チャンク単位で書き込み（CRC不一致時はBadZipFileが発生）
+                    with zip_ref.open(file_info) as src, open(target_path, 'wb') as dst:
+                        shutil.copyfileobj(src, dst, FFMPEG_DOWNLOAD_CHUNK_BYTES)
+                    extracted_files.append(filename)
+                    logger.debug(f"Extracted: {filename}")
+    except zipfile.BadZipFile as e:
+        logger.error(f"ZIP file is corrupted: {e}")
+        # 壊れたファイルが残らないよう削除
+        shutil.rmtree(ffmpeg_dir, ignore_errors=True)
+        raise Exception(ERROR_MESSAGES['checksum_mismatch'])
+
     logger.info(f"Extracted {len(extracted_files)} files to: {ffmpeg_dir}")
 
     return ffmpeg_dir
@@ -208,11 +202,9 @@ def setup_ffmpeg(
         return True
 
     try:
-        # ダウンロード
-        zip_path = download_ffmpeg(download_callback)
-
-        # 展開
-        extract_ffmpeg(zip_path, extract_callback)
+        # ダウンロード（ディスクに保存せずそのまま展開）
+        with download_ffmpeg(download_callback) as archive:
+            extract_ffmpeg(archive, extract_callback)
 
         # PATHに追加
         setup_ffmpeg_path()
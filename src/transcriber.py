@@ -8,14 +8,17 @@ import os
 import re
 import tempfile
 import logging
+import importlib.util
 import threading
-from typing import Callable, Optional, List, Dict, Any
-from dataclasses import dataclass
+from collections import OrderedDict
+from typing import Callable, Optional, List, Dict, Any, Tuple, Union
+from dataclasses import dataclass, asdict
 import yt_dlp
 
 from src.constants import (
-    ERROR_MESSAGES, WHISPER_MODELS, KOTOBA_WHISPER_MODEL,
-    URL_FETCH_TIMEOUT_SECONDS
+    ERROR_MESSAGES, WHISPER_MODELS, KOTOBA_WHISPER_MODEL, KOTOBA_CHUNK_LENGTH_SECONDS,
+    URL_FETCH_TIMEOUT_SECONDS, WHISPER_SAMPLE_RATE, WHISPER_CHUNK_SECONDS,
+    PINNED_AUDIO_MAX_SECONDS, WHISPER_MODEL_CACHE_SIZE, WHISPER_VAD_MIN_SILENCE_MS
 )
 
 # ロガー設定
@@ -48,6 +51,10 @@ class TranscriptSegment:
             return f"{hours}:{minutes:02d}:{secs:02d}"
         return f"{minutes}:{secs:02d}"
 
+    def to_txt_line(self) -> str:
+        """タイムスタンプ付きテキストの1行に変換"""
+        return f"[{self.start_str}] {self.text}"
+
 
 @dataclass
 class TranscriptResult:
@@ -78,15 +85,27 @@ class TranscriptResult:
 
     def to_txt(self) -> str:
         """タイムスタンプ付きテキストに変換"""
-        lines = []
-        for seg in self.segments:
-            lines.append(f"[{seg.start_str}] {seg.text}")
-        return '\n'.join(lines)
+        return '\n'.join(seg.to_txt_line() for seg in self.segments)
 
     def to_plain_txt(self) -> str:
         """プレーンテキストに変換"""
         return self.full_text
 
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON保存用の辞書に変換"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TranscriptResult':
+        """to_dict() の辞書から復元"""
+        return cls(
+            video_title=data['video_title'],
+            video_id=data['video_id'],
+            language=data['language'],
+            segments=[TranscriptSegment(**seg) for seg in data['segments']],
+            source=data['source']
+        )
+
     def _format_srt_time(self, seconds: float) -> str:
         """秒をSRT時間形式に変換"""
         hours = int(seconds // 3600)
@@ -96,29 +115,85 @@ class TranscriptResult:
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{ms:03d}"
 
 
+@dataclass
+class DownloadedAudio:
+    """文字起こし用にダウンロードした音声"""
+    path: str
+    video_title: str
+    video_id: str
+
+
 class Transcriber:
     """文字起こしクラス"""
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None):
         self._whisper_model = None
         self._faster_whisper_model = None
         self._kotoba_pipeline = None
+        # 読み込み済みモデル（(エンジン, モデル名) -> モデル、LRU順）
+        self._model_cache: OrderedDict = OrderedDict()
         self._model_name = 'base'
+        self._cache_dir = cache_dir or None  # モデルの保存先（Noneは各ライブラリの既定）
         self._engine = 'openai-whisper'  # openai-whisper, faster-whisper
         self._use_kotoba = False
         self._custom_vocabulary = ''  # カスタム辞書（initial_prompt用）
+        self._batch_size = 1  # faster-whisper/kotoba-whisperのバッチサイズ（1はバッチ推論なし）
+        self._batched_pipeline = None  # faster-whisperのバッチ推論パイプライン（複数項目で再利用）
+        self._vad_filter = True  # faster-whisperで無音区間をスキップするか
+        self._pinned_audio_buffer = None  # GPU転送用のピン留め音声バッファ（再利用）
         self._progress_callback: Optional[Callable[[Dict], None]] = None
+        # デコードされたセグメントを逐次受け取るコールバック（faster-whisperのみ）
+        self._segment_callback: Optional[Callable[[TranscriptSegment], None]] = None
         self._cancel_flag = False
         self._cancel_lock = threading.Lock()  # スレッドセーフなキャンセル制御
         self._model_load_lock = threading.Lock()  # モデルロードの競合対策
+        self._local = threading.local()  # スレッドごとの状態（進捗通知の抑止）
+        self._clear_pending = False  # 読み込み中に要求されたキャッシュ破棄（次の読み込み時に実行）
         logger.info("Transcriber initialized")
 
+    @property
+    def engine_name(self) -> str:
+        """実際に使用するエンジン名（kotoba-whisper使用時はそれを優先）"""
+        return 'kotoba-whisper' if self._use_kotoba else self._engine
+
     def set_engine(self, engine: str):
         """使用するWhisperエンジンを設定"""
         if engine in ['openai-whisper', 'faster-whisper']:
             self._engine = engine
             logger.info(f"Whisper engine set to: {engine}")
 
+    def set_cache_dir(self, cache_dir: Optional[str]):
+        """モデルの保存先を設定（空の場合は各ライブラリの既定の場所）"""
+        self._cache_dir = cache_dir or None
+        logger.info(f"Whisper model cache dir set to: {self._cache_dir or '(default)'}")
+
+    def _get_download_root(self) -> Optional[str]:
+        """モデルの保存先を取得（指定がある場合はディレクトリを作成）"""
+        if not self._cache_dir:
+            return None
+        os.makedirs(self._cache_dir, exist_ok=True)
+        return self._cache_dir
+
+    def set_batch_size(self, batch_size: int):
+        """faster-whisper/kotoba-whisperのバッチ推論サイズを設定（1以下はバッチ推論なし）"""
+        self._batch_size = max(1, int(batch_size))
+        logger.info(f"Whisper batch size set to: {self._batch_size}")
+
+    @property
+    def batch_size(self) -> int:
+        """1回の推論でまとめて処理するチャンク数"""
+        return self._batch_size
+
+    @property
+    def vad_filter(self) -> bool:
+        """faster-whisperで無音区間をスキップするか"""
+        return self._vad_filter
+
+    def set_vad_filter(self, enabled: bool):
+        """faster-whisperのVAD（無音区間のスキップ）を設定"""
+        self._vad_filter = bool(enabled)
+        logger.info(f"Faster Whisper VAD filter: {self._vad_filter}")
+
     def set_custom_vocabulary(self, vocabulary: str):
         """カスタム辞書（用語リスト）を設定"""
         self._custom_vocabulary = vocabulary.strip()
@@ -133,6 +208,10 @@ class Transcriber:
         """進捗コールバックを設定"""
         self._progress_callback = callback
 
+    def set_segment_callback(self, callback: Optional[Callable[[TranscriptSegment], None]]):
+        """セグメント単位のコールバックを設定（デコードしながら結果を表示するため）"""
+        self._segment_callback = callback
+
     def cancel(self):
         """処理をキャンセル（スレッドセーフ）"""
         with self._cancel_lock:
@@ -150,8 +229,8 @@ class Transcriber:
             return self._cancel_flag
 
     def _report_progress(self, status: str, percent: float = 0, message: str = ''):
-        """進捗を報告"""
-        if self._progress_callback:
+        """進捗を報告（通知を止めたスレッドからの呼び出しは無視）"""
+        if self._progress_callback and not getattr(self._local, 'silent', False):
             self._progress_callback({
                 'status': status,
                 'percent': percent,
@@ -162,79 +241,227 @@ class Transcriber:
         """Whisperモデルを読み込み（エンジンに応じて適切なモデルをロード）"""
         # モデルロードの競合を防止
         with self._model_load_lock:
+            # 読み込み中に要求されたキャッシュ破棄をここで反映
+            if self._clear_pending:
+                self._clear_model_cache_locked()
+
             # kotoba-whisperを使う場合
             if self._use_kotoba:
-                self._load_kotoba_model()
+                self._kotoba_pipeline = self._get_cached_model(
+                    ('kotoba-whisper', KOTOBA_WHISPER_MODEL), self._load_kotoba_model
+                )
                 return
 
             # faster-whisperを使う場合
             if self._engine == 'faster-whisper':
-                self._load_faster_whisper_model(model_name)
+                # large -> large-v2 に変換
+                if model_name == 'large':
+                    model_name = 'large-v2'
+                self._faster_whisper_model = self._get_cached_model(
+                    ('faster-whisper', model_name),
+                    lambda: self._load_faster_whisper_model(model_name)
+                )
+                self._model_name = model_name
                 return
 
             # 標準openai-whisperを使う場合
-            if self._whisper_model is None or self._model_name != model_name:
-                self._report_progress('loading', 0, f'Whisperモデル({model_name})を読み込み中...')
-                try:
-                    import whisper
-                    self._whisper_model = whisper.load_model(model_name)
-                    self._model_name = model_name
-                    self._report_progress('loaded', 100, 'モデル読み込み完了')
-                except Exception as e:
-                    raise Exception(f"Whisperモデルの読み込みに失敗: {str(e)}")
+            self._whisper_model = self._get_cached_model(
+                ('openai-whisper', model_name),
+                lambda: self._load_openai_whisper_model(model_name)
+            )
+            self._model_name = model_name
+
+    def _get_cached_model(self, key: Tuple[str, str], loader: Callable[[], Any]) -> Any:
+        """
+        モデルキャッシュから取得（なければ読み込んで登録）
+
+        キーは (エンジン, モデル名)。保持数が WHISPER_MODEL_CACHE_SIZE に達している場合は
+        新しいモデルを読み込む前に最も古く使われたモデルを破棄する（VRAM上で2つが重ならないように）
+        """
+        model = self._model_cache.get(key)
+        if model is not None:
+            self._model_cache.move_to_end(key)
+            logger.debug(f"Whisper model cache hit: {key}")
+            return model
+
+        while len(self._model_cache) >= WHISPER_MODEL_CACHE_SIZE:
+            evicted_key, evicted = self._model_cache.popitem(last=False)
+            self._drop_active_model(evicted)
+            del evicted
+            logger.info(f"Whisper model evicted from cache: {evicted_key}")
+            self._release_gpu_memory()
+
+        model = loader()
+        self._model_cache[key] = model
+        return model
+
+    def _drop_active_model(self, model: Any):
+        """破棄するモデルが使用中の参照に残っていれば外す"""
+        if self._whisper_model is model:
+            self._whisper_model = None
+        if self._faster_whisper_model is model:
+            self._faster_whisper_model = None
+            self._batched_pipeline = None
+        if self._kotoba_pipeline is model:
+            self._kotoba_pipeline = None
+
+    def _release_gpu_memory(self):
+        """解放済みモデルのVRAMをPyTorchのキャッシュから返却"""
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
+
+    def clear_model_cache(self):
+        """
+        読み込み済みモデルをすべて破棄（設定変更時にGUIスレッドから呼び出し）
+
+        事前読み込みなどでモデルを読み込み中の場合は完了を待たず、
+        次にモデルを読み込む時に破棄する
+        """
+        if not self._model_load_lock.acquire(blocking=False):
+            self._clear_pending = True
+            logger.info("Whisper model is loading, cache clear deferred")
+            return
+        try:
+            self._clear_model_cache_locked()
+        finally:
+            self._model_load_lock.release()
+
+    def _clear_model_cache_locked(self):
+        """読み込み済みモデルをすべて破棄（_model_load_lock を保持した状態で呼び出す）"""
+        self._clear_pending = False
+        if not self._model_cache:
+            return
+        self._model_cache.clear()
+        self._whisper_model = None
+        self._faster_whisper_model = None
+        self._batched_pipeline = None
+        self._kotoba_pipeline = None
+        self._pinned_audio_buffer = None
+        self._release_gpu_memory()
+        logger.info("Whisper model cache cleared")
+
+    def _load_openai_whisper_model(self, model_name: str):
+        """openai-whisperモデルを読み込み"""
+        self._report_progress('loading', 0, f'Whisperモデル({model_name})を読み込み中...')
+        try:
+            import whisper
+            model = whisper.load_model(model_name, download_root=self._get_download_root())
+            self._compile_encoder(model)
+            self._report_progress('loaded', 100, 'モデル読み込み完了')
+            return model
+        except Exception as e:
+            raise Exception(f"Whisperモデルの読み込みに失敗: {str(e)}")
+
+    def _compile_encoder(self, model):
+        """
+        GPU使用時にopenai-whisperのエンコーダをtorch.compileで最適化（対応環境のみ）
+
+        エンコーダは常に30秒単位の固定長入力のため再コンパイルが起きにくい。
+        デコーダはkvキャッシュのフックで入力長が毎回変わるため対象外。
+        モデルはキャッシュされるため、コンパイルのコストは2回目以降の文字起こしで回収される
+        """
+        import torch
+
+        if model.device.type != 'cuda' or not hasattr(torch, 'compile'):
+            return
+        # torch.compileのGPUバックエンドにはtritonが必要（Windowsでは通常未導入）
+        if importlib.util.find_spec('triton') is None:
+            logger.debug("triton is not available, skipping torch.compile")
+            return
+
+        try:
+            model.encoder = torch.compile(model.encoder)
+            logger.info("Whisper encoder compiled with torch.compile")
+        except Exception as e:
+            logger.warning(f"torch.compile failed, using eager mode: {e}")
+
+    @staticmethod
+    def _is_torch_compile_error(error: Exception) -> bool:
+        """torch.compile（TorchDynamo・バックエンドコンパイラ）由来のエラーか判定"""
+        try:
+            from torch._dynamo.exc import TorchDynamoException
+        except ImportError:
+            return False
+        # BackendCompilerFailed も TorchDynamoException の派生クラス
+        return isinstance(error, TorchDynamoException)
 
     def _load_faster_whisper_model(self, model_name: str = 'base'):
         """faster-whisperモデルを読み込み"""
-        # large -> large-v2 に変換
-        if model_name == 'large':
-            model_name = 'large-v2'
-
-        if self._faster_whisper_model is None or self._model_name != model_name:
-            self._report_progress('loading', 0, f'Faster Whisperモデル({model_name})を読み込み中...')
-            try:
-                from faster_whisper import WhisperModel
-                import torch
-
-                # デバイス選択
-                device = "cuda" if torch.cuda.is_available() else "cpu"
-                compute_type = "float16" if device == "cuda" else "int8"
-
-                self._faster_whisper_model = WhisperModel(
-                    model_name,
-                    device=device,
-                    compute_type=compute_type
-                )
-                self._model_name = model_name
-                self._report_progress('loaded', 100, f'Faster Whisperモデル読み込み完了 (device: {device})')
-                logger.info(f"Faster Whisper model loaded: {model_name} on {device}")
-            except ImportError:
-                raise Exception("faster-whisperがインストールされていません。pip install faster-whisper を実行してください。")
-            except Exception as e:
-                raise Exception(f"Faster Whisperモデルの読み込みに失敗: {str(e)}")
+        self._report_progress('loading', 0, f'Faster Whisperモデル({model_name})を読み込み中...')
+        try:
+            from faster_whisper import WhisperModel
+            import torch
+
+            # デバイス選択
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            # GPUでは重みをint8、演算をfloat16にしてVRAM使用量を削減
+            compute_type = "int8_float16" if device == "cuda" else "int8"
+            # CPUでは全コアを使う（0は既定値。未指定だと4スレッドに制限される）
+            cpu_threads = (os.cpu_count() or 0) if device == "cpu" else 0
+
+            model = WhisperModel(
+                model_name,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                download_root=self._get_download_root()
+            )
+            self._report_progress('loaded', 100, f'Faster Whisperモデル読み込み完了 (device: {device})')
+            logger.info(f"Faster Whisper model loaded: {model_name} on {device} ({compute_type})")
+            return model
+        except ImportError:
+            raise Exception("faster-whisperがインストールされていません。pip install faster-whisper を実行してください。")
+        except Exception as e:
+            raise Exception(f"Faster Whisperモデルの読み込みに失敗: {str(e)}")
 
     def _load_kotoba_model(self):
         """kotoba-whisperモデルを読み込み"""
-        if self._kotoba_pipeline is None:
-            self._report_progress('loading', 0, 'kotoba-whisperモデルを読み込み中...')
-            try:
-                import torch
-                from transformers import pipeline
-
-                device = "cuda:0" if torch.cuda.is_available() else "cpu"
-                torch_dtype = torch.float16 if torch.cuda.is_available() else torch.float32
-
-                self._kotoba_pipeline = pipeline(
-                    "automatic-speech-recognition",
-                    model=KOTOBA_WHISPER_MODEL,
-                    torch_dtype=torch_dtype,
-                    device=device,
-                )
-                self._report_progress('loaded', 100, f'kotoba-whisper読み込み完了 (device: {device})')
-                logger.info(f"Kotoba-whisper model loaded on {device}")
-            except ImportError:
-                raise Exception("transformersがインストールされていません。pip install transformers を実行してください。")
-            except Exception as e:
-                raise Exception(f"kotoba-whisperモデルの読み込みに失敗: {str(e)}")
+        self._report_progress('loading', 0, 'kotoba-whisperモデルを読み込み中...')
+        try:
+            import torch
+            from transformers import pipeline
+
+            device = "cuda:0" if torch.cuda.is_available() else "cpu"
+            torch_dtype = torch.float16 if torch.cuda.is_available() else torch.float32
+
+            model_kwargs = {}
+            # Flash Attention 2が使える場合のみ指定（それ以外はtransformersの既定に任せる）
+            if self._can_use_flash_attention():
+                model_kwargs['attn_implementation'] = 'flash_attention_2'
+            download_root = self._get_download_root()
+            if download_root:
+                model_kwargs['cache_dir'] = download_root
+
+            kotoba_pipeline = pipeline(
+                "automatic-speech-recognition",
+                model=KOTOBA_WHISPER_MODEL,
+                torch_dtype=torch_dtype,
+                device=device,
+                model_kwargs=model_kwargs,
+            )
+            self._report_progress('loaded', 100, f'kotoba-whisper読み込み完了 (device: {device})')
+            attention = model_kwargs.get('attn_implementation', 'default')
+            logger.info(f"Kotoba-whisper model loaded on {device} (attention: {attention})")
+            return kotoba_pipeline
+        except ImportError:
+            raise Exception("transformersがインストールされていません。pip install transformers を実行してください。")
+        except Exception as e:
+            raise Exception(f"kotoba-whisperモデルの読み込みに失敗: {str(e)}")
+
+    def _can_use_flash_attention(self) -> bool:
+        """
+        kotoba-whisperでFlash Attention 2を使えるか判定
+
+        Ampere以降（compute capability 8.0以上）のGPUでflash-attnが入っている場合のみ
+        """
+        import torch
+
+        return (torch.cuda.is_available() and torch.cuda.get_device_capability(0)[0] >= 8
+                and importlib.util.find_spec('flash_attn') is not None)
 
     def get_youtube_subtitles(self, url: str, lang: str = 'ja') -> Optional[TranscriptResult]:
         """YouTubeの字幕を取得"""
@@ -460,11 +687,49 @@ class Transcriber:
             self._report_progress('error', 0, f'文字起こしエラー: {str(e)}')
             raise
 
+    def _prepare_audio_for_gpu(self, audio_path: str):
+        """
+        音声をデコードしてGPUへ転送（ピン留めバッファを再利用）
+
+        GPUが使えない場合はパスをそのまま返し、Whisper側の読み込みに任せる。
+        長すぎる音声はデコード済みの配列をCPU上のまま返す（波形とメルスペクトログラム
+        全体をGPUに載せるとVRAMが不足するため、Whisper側でCPU上のメルから30秒ずつ転送させる）
+        """
+        device = getattr(self._whisper_model, 'device', None)
+        if device is None or device.type != 'cuda':
+            return audio_path
+
+        import torch
+        import whisper
+
+        audio = whisper.load_audio(audio_path)
+        num_samples = audio.shape[0]
+        if num_samples > PINNED_AUDIO_MAX_SECONDS * WHISPER_SAMPLE_RATE:
+            return audio
+
+        buffer = self._pinned_audio_buffer
+        if buffer is None or buffer.numel() < num_samples:
+            # 30秒単位で切り上げて確保し、次回以降は再利用
+            chunk = WHISPER_CHUNK_SECONDS * WHISPER_SAMPLE_RATE
+            size = -(-num_samples // chunk) * chunk
+            buffer = torch.empty(size, dtype=torch.float32, pin_memory=True)
+            self._pinned_audio_buffer = buffer
+            logger.debug(f"Pinned audio buffer allocated: {size} samples")
+
+        host_audio = buffer[:num_samples]
+        host_audio.copy_(torch.from_numpy(audio))
+        # ピン留めメモリからの非同期転送（メルスペクトログラムもGPU上で計算される）
+        return host_audio.to(device, non_blocking=True)
+
     def _transcribe_with_openai_whisper(self, audio_path: str, language: str,
                                          initial_prompt: str = '') -> TranscriptResult:
         """標準openai-whisperで文字起こし"""
+        # デコードオプションを明示（kvキャッシュを使う既定のデコード経路のまま、
+        # CPUではfp16を指定しないことで警告とfp32への切り替え処理を避ける）
         transcribe_options = {
             'language': language if language != 'auto' else None,
+            'task': 'transcribe',
+            'fp16': self._whisper_model.device.type == 'cuda',
             'verbose': False,
         }
 
@@ -473,7 +738,26 @@ class Transcriber:
             transcribe_options['initial_prompt'] = initial_prompt
             logger.info(f"Using initial_prompt: {initial_prompt[:100]}...")
 
-        result = self._whisper_model.transcribe(audio_path, **transcribe_options)
+        import torch
+
+        audio = self._prepare_audio_for_gpu(audio_path)
+        model = self._whisper_model
+        try:
+            # 勾配記録を完全に無効化して推論
+            with torch.inference_mode():
+                result = model.transcribe(audio, **transcribe_options)
+        except Exception as e:
+            # コンパイル済みエンコーダのコンパイル処理が失敗した場合だけ元のエンコーダで再実行
+            # （VRAM不足や音声の読み込みエラー等はそのまま送出し、全体を再実行しない）
+            encoder = model.encoder
+            if not hasattr(encoder, '_orig_mod') or not self._is_torch_compile_error(e):
+                raise
+            logger.warning(
+                f"Compiled Whisper encoder failed ({type(e).__name__}), falling back to eager mode: {e}"
+            )
+            model.encoder = encoder._orig_mod
+            with torch.inference_mode():
+                result = model.transcribe(audio, **transcribe_options)
 
         segments = []
         for seg in result.get('segments', []):
@@ -500,22 +784,42 @@ class Transcriber:
         transcribe_options = {
             'language': language if language != 'auto' else None,
             'beam_size': 5,
+            # 無音区間をVADで除外し、発話のある区間だけをデコード（タイムスタンプは元の時間のまま）
+            'vad_filter': self._vad_filter,
         }
+        if self._vad_filter:
+            transcribe_options['vad_parameters'] = {'min_silence_duration_ms': WHISPER_VAD_MIN_SILENCE_MS}
 
         # カスタム辞書（initial_prompt）を設定
         if initial_prompt:
             transcribe_options['initial_prompt'] = initial_prompt
             logger.info(f"Using initial_prompt for faster-whisper: {initial_prompt[:100]}...")
 
-        segments_iter, info = self._faster_whisper_model.transcribe(audio_path, **transcribe_options)
-
+        model = self._faster_whisper_model
+        # バッチ推論はVADで区切った発話区間を単位にするため、VADを使わない場合は逐次推論
+        # （VADなしで clip_timestamps も無いと30秒を超える音声でエラーになる）
+        if self._batch_size > 1 and self._vad_filter:
+            pipeline = self._get_batched_pipeline()
+            if pipeline is not None:
+                # 音声をチャンクに分割し、複数チャンクを1回の推論でまとめて処理
+                model = pipeline
+                transcribe_options['batch_size'] = self._batch_size
+                logger.info(f"Using batched inference (batch_size={self._batch_size})")
+
+        segments_iter, info = model.transcribe(audio_path, **transcribe_options)
+
+        # faster-whisperはセグメントを逐次デコードするため、確定した分から通知する
+        segment_callback = self._segment_callback
         segments = []
         for seg in segments_iter:
-            segments.append(TranscriptSegment(
+            segment = TranscriptSegment(
                 start=seg.start,
                 end=seg.end,
                 text=seg.text.strip()
-            ))
+            )
+            segments.append(segment)
+            if segment_callback:
+                segment_callback(segment)
 
         self._report_progress('completed', 100, '文字起こし完了 (faster-whisper)')
 
@@ -528,6 +832,25 @@ class Transcriber:
             source='faster-whisper'
         )
 
+    def _get_batched_pipeline(self):
+        """
+        読み込み済みのfaster-whisperモデルに対するバッチ推論パイプラインを取得
+
+        複数ファイル/URLを続けて処理する間は同じパイプラインを使い回す
+        （モデルが切り替わった時だけ作り直す）。利用できない場合はNone
+        """
+        pipeline = self._batched_pipeline
+        if pipeline is not None and pipeline.model is self._faster_whisper_model:
+            return pipeline
+        try:
+            from faster_whisper import BatchedInferencePipeline
+        except ImportError:
+            logger.warning("BatchedInferencePipeline is not available, falling back to sequential inference")
+            return None
+        pipeline = BatchedInferencePipeline(model=self._faster_whisper_model)
+        self._batched_pipeline = pipeline
+        return pipeline
+
     def _transcribe_with_kotoba(self, audio_path: str, language: str,
                                  initial_prompt: str = '') -> TranscriptResult:
         """kotoba-whisperで文字起こし（日本語特化）"""
@@ -541,8 +864,11 @@ class Transcriber:
             generate_kwargs['prompt_ids'] = None  # kotoba uses different prompt handling
             logger.info(f"Note: kotoba-whisper has limited initial_prompt support")
 
+        # 音声を一定長のチャンクに区切り、batch_size件ずつまとめて推論
         result = self._kotoba_pipeline(
             audio_path,
+            chunk_length_s=KOTOBA_CHUNK_LENGTH_SECONDS,
+            batch_size=self._batch_size,
             return_timestamps=True,
             generate_kwargs=generate_kwargs,
         )
@@ -584,9 +910,38 @@ class Transcriber:
         """YouTube動画を文字起こし"""
         self.reset_cancel()
 
-        video_title = ''
-        video_id = ''
-
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = self.fetch_youtube_source(url, language, prefer_youtube_subtitles, temp_dir)
+            if isinstance(source, TranscriptResult):
+                return source
+            return self.transcribe_downloaded_audio(source, language, model_name)
+
+    def fetch_youtube_source(self, url: str, language: str,
+                             prefer_youtube_subtitles: bool,
+                             temp_dir: str,
+                             report_progress: bool = True,
+                             cancel_event: Optional[threading.Event] = None
+                             ) -> Union[TranscriptResult, DownloadedAudio]:
+        """
+        文字起こしの元データを取得
+
+        YouTube字幕が使える場合はその結果を、なければ temp_dir にダウンロードした音声を返す。
+        GPUを使わないため、別の項目の文字起こしと並行して呼び出せる。
+        並行して呼び出す場合は report_progress=False で進捗通知を止め（文字起こし中の
+        表示を上書きしないため）、cancel_event が立ったらダウンロードを中断する
+        """
+        self._local.silent = not report_progress
+        try:
+            return self._fetch_youtube_source(url, language, prefer_youtube_subtitles,
+                                              temp_dir, cancel_event)
+        finally:
+            self._local.silent = False
+
+    def _fetch_youtube_source(self, url: str, language: str,
+                              prefer_youtube_subtitles: bool, temp_dir: str,
+                              cancel_event: Optional[threading.Event]
+                              ) -> Union[TranscriptResult, DownloadedAudio]:
+        """fetch_youtube_source の本体"""
         # まずYouTube字幕を試す
         if prefer_youtube_subtitles:
             self._report_progress('fetching', 0, 'YouTube字幕を確認中...')
@@ -594,49 +949,50 @@ class Transcriber:
             if result and result.segments:
                 return result
 
-        # YouTube字幕がない場合はWhisperで文字起こし
+        # YouTube字幕がない場合はWhisperで文字起こしするため音声をダウンロード
         self._report_progress('downloading', 0, '音声をダウンロード中...')
 
-        # 音声をダウンロード
-        with tempfile.TemporaryDirectory() as temp_dir:
-            audio_path = os.path.join(temp_dir, 'audio.mp3')
-
-            ydl_opts = {
-                'format': 'bestaudio/best',
-                'outtmpl': audio_path.replace('.mp3', '.%(ext)s'),
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'mp3',
-                    'preferredquality': '192',
-                }],
-                'quiet': True,
-                'no_warnings': True,
-            }
-
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=True)
-                video_title = info.get('title', '')
-                video_id = info.get('id', '')
-
-            # 実際のファイルパスを取得
-            actual_audio_path = audio_path
-            if not os.path.exists(actual_audio_path):
-                # 拡張子が違う場合を考慮
-                for ext in ['mp3', 'm4a', 'wav', 'webm']:
-                    test_path = audio_path.replace('.mp3', f'.{ext}')
-                    if os.path.exists(test_path):
-                        actual_audio_path = test_path
+        # MP3への再エンコードは行わず、取得した音声（m4a/webm等）をそのまま渡す
+        # （Whisper側のffmpegが16kHzモノラルPCMへ直接デコードする）
+        ydl_opts = {
+            'format': 'bestaudio/best',
+            'outtmpl': os.path.join(temp_dir, 'audio.%(ext)s'),
+            'quiet': True,
+            'no_warnings': True,
+        }
+        if cancel_event is not None:
+            def cancel_hook(d):
+                if cancel_event.is_set():
+                    raise yt_dlp.utils.DownloadCancelled()
+            ydl_opts['progress_hooks'] = [cancel_hook]
+
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=True)
+            video_title = info.get('title', '')
+            video_id = info.get('id', '')
+            actual_audio_path = ydl.prepare_filename(info)
+
+        # 実際のファイルパスを取得
+        if not os.path.exists(actual_audio_path):
+            # 拡張子が違う場合を考慮
+            with os.scandir(temp_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.startswith('audio.'):
+                        actual_audio_path = entry.path
                         break
 
-            if not os.path.exists(actual_audio_path):
-                raise Exception("音声ファイルのダウンロードに失敗しました")
+        if not os.path.exists(actual_audio_path):
+            raise Exception("音声ファイルのダウンロードに失敗しました")
 
-            # Whisperで文字起こし
-            result = self.transcribe_audio(actual_audio_path, language, model_name)
-            result.video_title = video_title
-            result.video_id = video_id
+        return DownloadedAudio(path=actual_audio_path, video_title=video_title, video_id=video_id)
 
-            return result
+    def transcribe_downloaded_audio(self, audio: DownloadedAudio, language: str = 'ja',
+                                    model_name: str = 'base') -> TranscriptResult:
+        """fetch_youtube_source でダウンロードした音声をWhisperで文字起こし"""
+        result = self.transcribe_audio(audio.path, language, model_name)
+        result.video_title = audio.video_title
+        result.video_id = audio.video_id
+        return result
 
 
 def save_transcript(result: TranscriptResult, output_path: str, format: str = 'txt'):
@@ -0,0 +1,92 @@
+"""
+文字起こし結果キャッシュモジュール
+同じ音声ファイルを同じ条件で再度文字起こしする場合にディスク上の結果を再利用する
+"""
+
+import os
+import json
+import hashlib
+import logging
+import tempfile
+from typing import Optional, Dict, Any
+
+from src.constants import TRANSCRIPT_CACHE_READ_CHUNK_BYTES
+from src.transcriber import TranscriptResult
+
+# ロガー設定
+logger = logging.getLogger(__name__)
+
+
+class TranscriptCache:
+    """
+    文字起こし結果のディスクキャッシュ
+
+    キーは音声ファイルの内容のハッシュと文字起こし条件（エンジン・モデル・言語・
+    カスタム辞書）から作成するため、ファイル名の変更や移動があってもヒットする
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def make_key(self, audio_path: str, params: Dict[str, Any]) -> str:
+        """音声ファイルの内容と条件からキャッシュキーを作成"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(audio_path, 'rb') as f:
+            while True:
+                chunk = f.read(TRANSCRIPT_CACHE_READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                digest.update(chunk)
+        digest.update(json.dumps(params, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[TranscriptResult]:
+        """キャッシュ済みの結果を取得（なければNone）"""
+        path = self._get_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                result = TranscriptResult.from_dict(json.load(f))
+            logger.info(f"Transcript cache hit: {key}")
+            return result
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # 壊れたキャッシュは無視して再計算させる
+            logger.warning(f"Failed to read transcript cache {path}: {e}")
+            return None
+
+    def put(self, key: str, result: TranscriptResult):
+        """結果をキャッシュに保存（一時ファイルに書いてから置き換える）"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(result.to_dict(), f, ensure_ascii=False)
+                os.replace(temp_path, self._get_path(key))
+            except BaseException:
+                os.remove(temp_path)
+                raise
+            logger.debug(f"Transcript cached: {key}")
+        except OSError as e:
+            logger.warning(f"Failed to write transcript cache: {e}")
+
+    def clear(self) -> int:
+        """キャッシュをすべて削除し、削除したファイル数を返す"""
+        removed = 0
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith(('.json', '.tmp')):
+                        try:
+                            os.remove(entry.path)
+                            removed += 1
+                        except OSError as e:
+                            logger.warning(f"Failed to delete cache file {entry.path}: {e}")
+        except FileNotFoundError:
+            pass
+        logger.info(f"Transcript cache cleared: {removed} files")
+        return removed